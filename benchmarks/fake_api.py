@@ -0,0 +1,217 @@
+"""
+Local stand-in for the Telegram Bot API and the WhatsApp Graph API.
+
+Serves sendMessage, editMessageText, sendDocument and the Graph /messages and
+/media endpoints with configurable latency and injected 429 / 5xx failures, so
+delivery code can be exercised and load-tested without real services.
+
+Point the app at it with:
+    TELEGRAM_API_BASE=http://127.0.0.1:8081
+    WHATSAPP_API_BASE=http://127.0.0.1:8081/graph
+
+Run standalone:
+    python -m benchmarks.fake_api --port 8081 --latency-ms 40 --rate-limit-rate 0.02 --error-rate 0.01
+"""
+import json
+import time
+import random
+import logging
+import argparse
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+TELEGRAM_METHODS = {'sendMessage', 'editMessageText', 'sendDocument', 'pinChatMessage'}
+
+
+class FakeApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency_ms=0, jitter_ms=0, rate_limit_rate=0.0,
+                 error_rate=0.0, retry_after=1, seed=None):
+        super().__init__(address, FakeApiHandler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = Counter()
+        self.next_id = 1
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def allocate_id(self):
+        with self.lock:
+            value = self.next_id
+            self.next_id += 1
+            return value
+
+    def roll(self):
+        """
+        Returns 'rate_limit', 'error' or None for the next request.
+        """
+        with self.lock:
+            r = self.random.random()
+        if r < self.rate_limit_rate:
+            return 'rate_limit'
+        if r < self.rate_limit_rate + self.error_rate:
+            return 'error'
+        return None
+
+    def delay(self):
+        if not self.latency_ms and not self.jitter_ms:
+            return
+        with self.lock:
+            jitter = self.random.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        time.sleep((self.latency_ms + jitter) / 1000.0)
+
+
+class FakeApiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        logger.debug("fake_api: " + format, *args)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0) or 0)
+        body = self.rfile.read(length) if length else b''
+        path = self.path.split('?', 1)[0].strip('/')
+        parts = path.split('/')
+
+        server = self.server
+        server.delay()
+
+        if parts and parts[0].startswith('bot') and len(parts) == 2 and parts[1] in TELEGRAM_METHODS:
+            self.handle_telegram(parts[1], body)
+        elif parts and parts[-1] in ('messages', 'media'):
+            self.handle_graph(parts[-1], body)
+        else:
+            server.stats['not_found'] += 1
+            self.respond(404, {'ok': False, 'error_code': 404, 'description': 'Not Found'})
+
+    def handle_telegram(self, method, body):
+        server = self.server
+        server.stats[f'telegram.{method}'] += 1
+        outcome = server.roll()
+        if outcome == 'rate_limit':
+            server.stats['injected_429'] += 1
+            self.respond(429, {
+                'ok': False,
+                'error_code': 429,
+                'description': f"Too Many Requests: retry after {server.retry_after}",
+                'parameters': {'retry_after': server.retry_after}
+            })
+            return
+        if outcome == 'error':
+            server.stats['injected_5xx'] += 1
+            self.respond(502, {'ok': False, 'error_code': 502, 'description': 'Bad Gateway'})
+            return
+
+        payload = self.parse_json(body)
+        message = {
+            'message_id': payload.get('message_id') or server.allocate_id(),
+            'chat': {'id': payload.get('chat_id')},
+            'date': int(time.time()),
+        }
+        if method in ('sendMessage', 'editMessageText'):
+            message['text'] = payload.get('text', '')
+        elif method == 'sendDocument':
+            message['document'] = {'file_id': f"FAKE-FILE-{server.allocate_id()}", 'file_size': len(body)}
+        self.respond(200, {'ok': True, 'result': True if method == 'pinChatMessage' else message})
+
+    def handle_graph(self, endpoint, body):
+        server = self.server
+        server.stats[f'graph.{endpoint}'] += 1
+        outcome = server.roll()
+        if outcome == 'rate_limit':
+            server.stats['injected_429'] += 1
+            self.respond(429, {'error': {'message': '(#131056) Pair rate limit hit', 'code': 131056}})
+            return
+        if outcome == 'error':
+            server.stats['injected_5xx'] += 1
+            self.respond(503, {'error': {'message': 'Service temporarily unavailable', 'code': 2}})
+            return
+
+        if endpoint == 'media':
+            self.respond(200, {'id': str(900000000 + server.allocate_id())})
+            return
+        payload = self.parse_json(body)
+        recipient = payload.get('to', '')
+        self.respond(200, {
+            'messaging_product': 'whatsapp',
+            'contacts': [{'input': recipient, 'wa_id': recipient}],
+            'messages': [{'id': f"wamid.FAKE{server.allocate_id()}"}]
+        })
+
+    def parse_json(self, body):
+        if self.headers.get('Content-Type', '').startswith('application/json'):
+            try:
+                return json.loads(body or b'{}')
+            except ValueError:
+                return {}
+        return {}
+
+    def respond(self, status, payload):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def start_fake_server(host='127.0.0.1', port=0, **options):
+    """
+    Starts the fake API server on a background thread and returns it.
+    Use port=0 to pick a free port; read the chosen address from server.base_url.
+    """
+    server = FakeApiServer((host, port), **options)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    logger.info(f"Fake Telegram/WhatsApp API listening on {server.base_url}")
+    return server
+
+
+def add_server_arguments(parser):
+    parser.add_argument('--latency-ms', type=float, default=0, help="Fixed latency added to every request")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="Random extra latency (uniform, 0..N ms)")
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered with 5xx")
+    parser.add_argument('--retry-after', type=int, default=1, help="retry_after seconds sent with Telegram 429s")
+    parser.add_argument('--seed', type=int, default=None, help="Seed for reproducible failure injection")
+
+
+def server_options(args):
+    return {
+        'latency_ms': args.latency_ms,
+        'jitter_ms': args.jitter_ms,
+        'rate_limit_rate': args.rate_limit_rate,
+        'error_rate': args.error_rate,
+        'retry_after': args.retry_after,
+        'seed': args.seed,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake Telegram Bot API / WhatsApp Graph API server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8081)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    server = FakeApiServer((args.host, args.port), **server_options(args))
+    logger.info(f"Fake Telegram/WhatsApp API listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        logger.info(f"Request stats: {dict(server.stats)}")
@@ -0,0 +1,187 @@
+"""
+posted_jobs dedup index benchmark: raw TEXT ids as the primary key (before) vs
+64-bit hashed job keys (after), on a synthetic history with the id shapes the
+scrapers produce (numeric API ids, guid/link URLs, SerpApi job_id blobs).
+
+Builds a legacy-schema jobs.db, times batched lookups against it, migrates it
+with db.init_db, then times the same lookups by job key and compares sizes.
+Computing the keys is timed separately: the pipeline pays for it once per scraped
+job, when the Job record is built.
+
+    python -m benchmarks.job_key_bench --jobs 200000 --lookups 20000
+"""
+import os
+import sys
+import json
+import time
+import base64
+import random
+import shutil
+import sqlite3
+import argparse
+import tempfile
+
+from src.utils import db
+from src.utils.job_keys import job_key
+
+LEGACY_SCHEMA = '''
+    CREATE TABLE posted_jobs (
+        id TEXT PRIMARY KEY,
+        url TEXT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        source TEXT
+    )
+'''
+
+
+def synthetic_postings(count, seed=11):
+    """
+    (source, id, url) for `count` postings, spread over the five sources.
+    """
+    rng = random.Random(seed)
+    postings = []
+    for i in range(count):
+        source = ('RemoteOK', 'Remotive', 'WeWorkRemotely', 'WorkingNomads', 'Google Jobs')[i % 5]
+        slug = f"company-{rng.randint(1, 5000)}-senior-software-engineer-{i}"
+        if source == 'RemoteOK':
+            job_id, url = str(100000 + i), f"https://remoteok.com/remote-jobs/{slug}"
+        elif source == 'Remotive':
+            job_id, url = str(900000 + i), f"https://remotive.com/remote-jobs/software-dev/{slug}"
+        elif source == 'WeWorkRemotely':
+            job_id = url = f"https://weworkremotely.com/remote-jobs/{slug}"
+        elif source == 'WorkingNomads':
+            job_id = url = f"https://www.workingnomads.com/jobs/{slug}"
+        else:
+            blob = json.dumps({'job_title': slug, 'htidocid': f"{rng.getrandbits(64):x}", 'hl': 'en', 'gl': 'in'})
+            job_id, url = base64.b64encode(blob.encode()).decode(), f"https://careers.example.com/{slug}"
+        postings.append((source, job_id, url))
+    return postings
+
+
+def build_legacy_db(path, postings):
+    conn = sqlite3.connect(path)
+    conn.execute(LEGACY_SCHEMA)
+    conn.executemany('INSERT INTO posted_jobs (id, url, source) VALUES (?, ?, ?)',
+                     [(job_id, url, source) for source, job_id, url in postings])
+    conn.commit()
+    conn.execute('VACUUM')
+    conn.close()
+
+
+def storage(path):
+    """
+    Bytes per b-tree (table or index), via the dbstat table.
+    """
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute('VACUUM')
+        return dict(conn.execute('SELECT name, SUM(pgsize) FROM dbstat GROUP BY name'))
+    except sqlite3.OperationalError:
+        return {}  # SQLite built without dbstat
+    finally:
+        conn.close()
+
+
+def time_lookups(lookup, probes, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        found = lookup(probes)
+        timings.append(time.perf_counter() - started)
+    return min(timings), len(found)
+
+
+def legacy_lookup(path):
+    # get_posted_ids as it was: batched IN queries on the TEXT primary key
+    def lookup(probes):
+        ids = [job_id for _, job_id in probes]
+        posted = set()
+        conn = sqlite3.connect(path)
+        try:
+            for start in range(0, len(ids), db.SQL_BATCH_SIZE):
+                batch = ids[start:start + db.SQL_BATCH_SIZE]
+                posted.update(row[0] for row in conn.execute(
+                    f"SELECT id FROM posted_jobs WHERE id IN ({','.join('?' * len(batch))})", batch))
+        finally:
+            conn.close()
+        return posted
+    return lookup
+
+
+def run(count, lookups, repeat, workdir, seed=5):
+    postings = synthetic_postings(count)
+    rng = random.Random(seed)
+    # Half the probes were posted before, half are new postings
+    probes = [(source, job_id) for source, job_id, _ in rng.sample(postings, lookups // 2)]
+    probes += [(source, f"{job_id}-new") for source, job_id, _ in rng.sample(postings, lookups - len(probes))]
+    rng.shuffle(probes)
+
+    path = os.path.join(workdir, 'jobs.db')
+    build_legacy_db(path, postings)
+    before_trees = storage(path)
+    before_seconds, before_found = time_lookups(legacy_lookup(path), probes, repeat)
+
+    db.DB_FILE = path
+    started = time.perf_counter()
+    db.init_db()
+    migrate_seconds = time.perf_counter() - started
+    after_trees = storage(path)
+    started = time.perf_counter()
+    keys = [job_key(source, job_id) for source, job_id in probes]
+    key_seconds = time.perf_counter() - started
+    after_seconds, after_found = time_lookups(db.get_posted_keys, keys, repeat)
+
+    mb = lambda n: round(n / (1024 * 1024), 2)
+    before_index = before_trees.get('sqlite_autoindex_posted_jobs_1', 0)
+    return {
+        'jobs': count,
+        'lookups': lookups,
+        'migrate_seconds': round(migrate_seconds, 3),
+        'key_seconds': round(key_seconds, 4),
+        'before': {
+            'dedup_index_mb': mb(before_index),
+            'posted_jobs_mb': mb(before_trees.get('posted_jobs', 0) + before_index),
+            'lookup_seconds': round(before_seconds, 4),
+            'found': before_found,
+        },
+        'after': {
+            # The key is the rowid: the table b-tree is the dedup index, with no separate index.
+            # The table also carries the (empty) history columns the migration adds
+            'dedup_index_mb': 0.0,
+            'posted_jobs_mb': mb(after_trees.get('posted_jobs', 0)),
+            'lookup_seconds': round(after_seconds, 4),
+            'found': after_found,
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TEXT id vs hashed job key dedup index")
+    parser.add_argument('--jobs', type=int, default=200000, help="Postings in the synthetic history")
+    parser.add_argument('--lookups', type=int, default=20000, help="Ids looked up per run (half already posted)")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per variant (best is reported)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="job_key_bench_")
+    original_db = db.DB_FILE
+    try:
+        result = run(args.jobs, args.lookups, args.repeat, workdir)
+    finally:
+        db.DB_FILE = original_db
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        before, after = result['before'], result['after']
+        print(f"{result['jobs']} posted jobs, {result['lookups']} lookups | migration {result['migrate_seconds']}s | "
+              f"computing keys {result['key_seconds']}s")
+        for label, r in (('TEXT id', before), ('job key', after)):
+            print(f"  {label:<8} dedup index {r['dedup_index_mb']:>6} MB | posted_jobs {r['posted_jobs_mb']:>6} MB | "
+                  f"lookups {r['lookup_seconds']}s ({r['found']} found)")
+    return result
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,123 @@
+"""
+Delivery load test against the local fake Telegram/WhatsApp API.
+
+Drives TelegramBot.send_message and send_whatsapp_message concurrently and
+reports throughput (messages/sec) and p50/p99 delivery latency, including any
+retries triggered by injected 429 / 5xx responses.
+
+    python -m benchmarks.load_test --messages 500 --concurrency 8 --latency-ms 40 --rate-limit-rate 0.02
+    python -m benchmarks.load_test --base-url http://127.0.0.1:8081   # use an already running fake
+"""
+import os
+import sys
+import time
+import json
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.fake_api import start_fake_server, add_server_arguments, server_options
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+def configure_environment(base_url):
+    """
+    Points the delivery modules at the fake server. Must run before src.utils.config is imported.
+    """
+    os.environ['TELEGRAM_API_BASE'] = base_url
+    os.environ['WHATSAPP_API_BASE'] = f"{base_url}/graph"
+    os.environ.setdefault('TELEGRAM_BOT_TOKEN', 'load-test-token')
+    os.environ.setdefault('TELEGRAM_CHANNEL_ID', '@load_test')
+    os.environ.setdefault('WHATSAPP_ACCESS_TOKEN', 'load-test-token')
+    os.environ.setdefault('WHATSAPP_PHONE_NUMBER_ID', '100000000000000')
+    os.environ.setdefault('WHATSAPP_RECIPIENT_PHONE_NUMBER', '910000000000')
+
+
+def run_channel(name, send, messages, concurrency):
+    def timed(text):
+        start = time.perf_counter()
+        ok = send(text)
+        return time.perf_counter() - start, ok
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(timed, messages))
+    wall = time.perf_counter() - started
+
+    latencies = sorted(r[0] for r in results)
+    delivered = sum(1 for r in results if r[1])
+    return {
+        'channel': name,
+        'messages': len(messages),
+        'delivered': delivered,
+        'failed': len(messages) - delivered,
+        'wall_seconds': round(wall, 3),
+        'messages_per_sec': round(delivered / wall, 2) if wall else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'max_ms': round(latencies[-1] * 1000, 2) if latencies else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Telegram/WhatsApp delivery load test")
+    parser.add_argument('--messages', type=int, default=200, help="Messages to send per channel")
+    parser.add_argument('--concurrency', type=int, default=4, help="Concurrent senders per channel")
+    parser.add_argument('--channels', default='telegram,whatsapp', help="Comma-separated: telegram,whatsapp")
+    parser.add_argument('--message-size', type=int, default=3000, help="Characters per message body")
+    parser.add_argument('--base-url', default=None, help="Use an already running fake server instead of starting one")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    add_server_arguments(parser)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        server = start_fake_server(**server_options(args))
+        base_url = server.base_url
+    configure_environment(base_url)
+
+    from src.utils.telegram_bot import TelegramBot
+    from src.utils.whatsapp_bot import send_whatsapp_message
+
+    bot = TelegramBot()
+    body = ("*Senior Backend Engineer*\n🏢 Example Corp\n🌍 Remote\n🔗 Apply: https://example.com/jobs/1\n\n" * 50)[:args.message_size]
+    messages = [f"Load test message {i}\n\n{body}" for i in range(args.messages)]
+
+    senders = {
+        'telegram': lambda text: bool((bot.send_message(text) or {}).get('ok')),
+        'whatsapp': send_whatsapp_message,
+    }
+
+    report = {'base_url': base_url, 'concurrency': args.concurrency, 'results': []}
+    for name in [c.strip() for c in args.channels.split(',') if c.strip()]:
+        report['results'].append(run_channel(name, senders[name], messages, args.concurrency))
+
+    if server:
+        report['server_stats'] = dict(server.stats)
+        server.shutdown()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"Target: {base_url} | concurrency {args.concurrency}")
+        for r in report['results']:
+            print(f"{r['channel']:<9} {r['delivered']}/{r['messages']} delivered | "
+                  f"{r['messages_per_sec']} msg/s | p50 {r['p50_ms']} ms | p99 {r['p99_ms']} ms | max {r['max_ms']} ms")
+        if 'server_stats' in report:
+            print(f"Server: {report['server_stats']}")
+    return report
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
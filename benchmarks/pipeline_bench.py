@@ -0,0 +1,323 @@
+"""
+End-to-end digest pipeline benchmark on synthetic job volumes.
+
+Generates realistic job batches of Job records (a few large employers and a long
+tail, weighted titles and locations, a share of already-posted and duplicate ids) and drives
+dedup -> curation/company capping -> mark posted -> digest rendering/chunking
+with delivery stubbed out. Reports per-stage time and peak traced memory, and
+appends every run to a results file keyed by git commit for later comparison.
+
+    python -m benchmarks.pipeline_bench --sizes 1000,10000,100000,1000000
+    python -m benchmarks.pipeline_bench --compare          # stored results, one row per commit
+    python -m benchmarks.pipeline_bench --job-memory 100000  # Job records vs per-job dicts
+    python -m benchmarks.pipeline_bench --stream 1000000     # streaming pipeline vs materialized lists
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import copy
+import platform
+import tempfile
+import subprocess
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from src import pipeline
+from src.utils import db
+from src.utils.job import Job
+from src.main import dedup_jobs, curate_jobs, build_digest_messages, is_india_role
+from src.utils.digest_format import format_job_entry, format_job_entry_wa, format_footer
+
+RESULTS_FILE = os.path.join(os.path.dirname(__file__), 'results', 'pipeline_bench.jsonl')
+STAGES = ('dedup', 'curate', 'mark_posted', 'render')
+
+TITLES = [
+    ("Software Engineer", 30), ("Senior Software Engineer", 18), ("Backend Developer", 12),
+    ("Frontend Developer", 9), ("Full Stack Developer", 9), ("DevOps Engineer", 7),
+    ("Site Reliability Engineer", 4), ("QA Engineer", 5), ("Test Automation Engineer", 3),
+    ("Data Engineer", 6), ("Machine Learning Engineer", 4), ("Engineering Manager", 2),
+]
+LOCATIONS = [
+    ("Remote", 30), ("Remote — Worldwide", 10), ("Remote — India", 8), ("Remote — Asia", 3),
+    ("Bangalore", 16), ("Hyderabad", 7), ("Pune", 6), ("Mumbai", 5), ("Chennai", 4),
+    ("Delhi", 3), ("Gurgaon", 3), ("Noida", 2), ("Berlin", 2), ("London", 1),
+]
+SOURCES = ["RemoteOK", "WeWorkRemotely", "Remotive", "WorkingNomads", "Google Jobs"]
+SALARIES = ["Not disclosed", "$80k - $120k", "$120k - $160k", "₹25L - ₹40L", "€60k - €80k"]
+
+
+def synthetic_jobs(count, seed=42, duplicate_rate=0.05, start=0, now=None):
+    """
+    Builds `count` scraped Job records. Company sizes follow a Zipf-like curve over
+    roughly count/20 employers, so company capping has real work to do. Ids are
+    numbered from `start`; posting times fall in the 24h before `now`.
+    """
+    rng = random.Random(seed)
+    num_companies = max(10, count // 20)
+    companies = [f"Company {i:06d}" for i in range(num_companies)]
+    company_weights = [1.0 / (rank + 1) for rank in range(num_companies)]
+    titles, title_weights = zip(*TITLES)
+    locations, location_weights = zip(*LOCATIONS)
+    now = now or datetime.now(timezone.utc)
+
+    picked_companies = rng.choices(companies, company_weights, k=count)
+    picked_titles = rng.choices(titles, title_weights, k=count)
+    picked_locations = rng.choices(locations, location_weights, k=count)
+    jobs = []
+    for i in range(count):
+        source = SOURCES[i % len(SOURCES)]
+        job_id = f"{source[:3].lower()}-{start + i}"
+        jobs.append(Job(
+            company=picked_companies[i],
+            role=picked_titles[i],
+            location=picked_locations[i],
+            posted_time="Recently",
+            posted_dt=now - timedelta(seconds=rng.randint(0, 86400)),
+            salary=rng.choice(SALARIES),
+            url=f"https://jobs.example.com/{source.lower()}/{job_id}",
+            source=source,
+            id=job_id,
+        ))
+    # The same posting scraped twice in one batch
+    for job in rng.sample(jobs, int(count * duplicate_rate)):
+        jobs.append(copy.copy(job))
+    return jobs
+
+
+def stream_jobs(count, now, chunk=10000):
+    """
+    The same kind of batch generated lazily, `chunk` jobs at a time, as scrapers feed the pipeline.
+    """
+    for start in range(0, count, chunk):
+        yield from synthetic_jobs(min(chunk, count - start), seed=42 + start, start=start, now=now)
+
+
+def _fresh(value):
+    # A new string object, as parsing a feed would produce for every posting
+    return value.encode('utf-8').decode('utf-8') if isinstance(value, str) else value
+
+
+def job_memory(count):
+    """
+    Traced bytes retained by `count` jobs held as the old per-job dicts vs Job records,
+    both built from freshly decoded strings the way a scraper builds them.
+    """
+    raw = []
+    for job in synthetic_jobs(count, duplicate_rate=0):
+        fields = job.to_dict()
+        del fields['posted_dt']  # scrapers don't set it
+        raw.append(fields)
+
+    def measure(build):
+        tracemalloc.start()
+        held = build()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del held
+        return size
+
+    dict_bytes = measure(lambda: [{k: _fresh(v) for k, v in fields.items()} for fields in raw])
+    job_bytes = measure(lambda: [Job(**{k: _fresh(v) for k, v in fields.items()}) for fields in raw])
+    return {
+        'jobs': count,
+        'dict_mb': round(dict_bytes / (1024 * 1024), 2),
+        'job_mb': round(job_bytes / (1024 * 1024), 2),
+        'saved_pct': round(100.0 * (dict_bytes - job_bytes) / dict_bytes, 1) if dict_bytes else 0.0,
+    }
+
+
+def seed_db(path, jobs, posted_rate, seed=7):
+    """
+    Creates a fresh jobs.db at path with a share of the batch already posted.
+    """
+    db.DB_FILE = path
+    if os.path.exists(path):
+        os.remove(path)
+    db.init_db()
+    rng = random.Random(seed)
+    db.mark_jobs_posted(rng.sample(jobs, int(len(jobs) * posted_rate)))
+
+
+def stream_memory(count, posted_rate, workdir):
+    """
+    Peak traced memory of dedup + curation over `count` jobs: materialized lists
+    (dedup_jobs -> curate_jobs) vs the streaming pipeline.curate over the same lazy source.
+    """
+    db_path = os.path.join(workdir, f"stream_{count}.db")
+    now = datetime.now(timezone.utc)
+    seed_db(db_path, list(stream_jobs(count, now)), posted_rate)
+
+    lists, list_peak = traced('lists', lambda: curate_jobs(dedup_jobs(list(stream_jobs(count, now)))))
+    streamed, stream_peak = traced('stream', lambda: pipeline.curate(stream_jobs(count, now)))
+    assert [job.id for job in lists] == [job.id for job in streamed]
+    return {
+        'jobs': count,
+        'final': len(streamed),
+        'lists_peak_mb': round(list_peak / (1024 * 1024), 2),
+        'stream_peak_mb': round(stream_peak / (1024 * 1024), 2),
+    }
+
+
+def render_digest(final_jobs):
+    display_india = [j for j in final_jobs if is_india_role(j)]
+    display_remote = [j for j in final_jobs if not is_india_role(j)]
+    footer = format_footer(len(display_remote), len(display_india))
+    header = f"🚀 *Daily Tech Jobs Digest by VJ — {datetime.now().strftime('%d %b %Y')}*\n\n"
+    telegram = build_digest_messages(header, footer, display_remote, display_india, format_job_entry)
+    whatsapp = build_digest_messages(header, footer, display_remote, display_india, format_job_entry_wa)
+    return len(telegram) + len(whatsapp)
+
+
+def run_pipeline(jobs, measure):
+    """
+    Runs every stage once; `measure(name, fn)` returns (result, metric).
+    """
+    metrics = {}
+    unique, metrics['dedup'] = measure('dedup', lambda: dedup_jobs(jobs))
+    final, metrics['curate'] = measure('curate', lambda: curate_jobs(list(unique)))
+    _, metrics['mark_posted'] = measure('mark_posted', lambda: db.mark_jobs_posted(final))
+    messages, metrics['render'] = measure('render', lambda: render_digest(final))
+    return metrics, {'unique': len(unique), 'final': len(final), 'messages': messages}
+
+
+def timed(name, fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def traced(name, fn):
+    # Separate pass: tracemalloc slows the stages down, so it stays out of the timings
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak - baseline
+
+
+def bench_size(count, posted_rate, workdir, memory=True):
+    jobs = synthetic_jobs(count)
+    db_path = os.path.join(workdir, f"bench_{count}.db")
+
+    seed_db(db_path, jobs, posted_rate)
+    seconds, counts = run_pipeline(jobs, timed)
+
+    peaks = {}
+    if memory:
+        seed_db(db_path, jobs, posted_rate)
+        peaks, _ = run_pipeline(jobs, traced)
+
+    return {
+        'jobs': count,
+        'scraped': len(jobs),
+        **counts,
+        'stages': {
+            stage: {
+                'seconds': round(seconds[stage], 4),
+                'peak_mb': round(peaks[stage] / (1024 * 1024), 2) if stage in peaks else None,
+            }
+            for stage in STAGES
+        },
+        'total_seconds': round(sum(seconds.values()), 4),
+    }
+
+
+def git_revision():
+    def git(*args):
+        try:
+            return subprocess.run(['git', *args], capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    commit = git('rev-parse', '--short', 'HEAD')
+    dirty = bool(git('status', '--porcelain', '--untracked-files=no'))
+    return {'commit': commit, 'dirty': dirty, 'subject': git('log', '-1', '--format=%s')}
+
+
+def store_results(results, path=RESULTS_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    record = {
+        **git_revision(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'results': results,
+    }
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record) + "\n")
+    return record
+
+
+def compare(path=RESULTS_FILE):
+    """
+    Prints total and per-stage seconds for every stored run, oldest first.
+    """
+    if not os.path.exists(path):
+        print(f"No stored results at {path}")
+        return
+    with open(path, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    print(f"{'commit':<10} {'jobs':>8} {'total_s':>9} " + " ".join(f"{s:>12}" for s in STAGES))
+    for record in records:
+        label = (record['commit'] or '?') + ('*' if record['dirty'] else '')
+        for r in record['results']:
+            stages = " ".join(f"{r['stages'][s]['seconds']:>12}" for s in STAGES)
+            print(f"{label:<10} {r['jobs']:>8} {r['total_seconds']:>9} {stages}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Digest pipeline benchmark on synthetic jobs")
+    parser.add_argument('--sizes', default='1000,10000,100000,1000000', help="Comma-separated batch sizes")
+    parser.add_argument('--posted-rate', type=float, default=0.2, help="Share of each batch already in posted_jobs")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc pass")
+    parser.add_argument('--no-store', action='store_true', help="Don't append results to the results file")
+    parser.add_argument('--compare', action='store_true', help="Print stored results and exit")
+    parser.add_argument('--job-memory', type=int, metavar='N', help="Compare memory of N jobs as dicts vs Job records and exit")
+    parser.add_argument('--stream', type=int, metavar='N', help="Compare peak memory of N jobs as lists vs streamed and exit")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare()
+        return []
+    if args.job_memory:
+        result = job_memory(args.job_memory)
+        print(json.dumps(result, indent=2) if args.json else
+              f"{result['jobs']} jobs: dicts {result['dict_mb']} MB | Job {result['job_mb']} MB | "
+              f"{result['saved_pct']}% smaller")
+        return [result]
+
+    workdir = tempfile.mkdtemp(prefix="pipeline_bench_")
+    original_db = db.DB_FILE
+    try:
+        if args.stream:
+            result = stream_memory(args.stream, args.posted_rate, workdir)
+            print(json.dumps(result, indent=2) if args.json else
+                  f"{result['jobs']} jobs -> {result['final']} kept: lists peak {result['lists_peak_mb']} MB | "
+                  f"streamed peak {result['stream_peak_mb']} MB")
+            return [result]
+        results = [bench_size(int(n), args.posted_rate, workdir, memory=not args.no_memory)
+                   for n in args.sizes.split(',')]
+    finally:
+        db.DB_FILE = original_db
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if not args.no_store:
+        store_results(results)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            print(f"{r['jobs']} jobs ({r['scraped']} scraped, {r['unique']} new, {r['final']} kept, "
+                  f"{r['messages']} messages) in {r['total_seconds']}s")
+            for stage, m in r['stages'].items():
+                peak = f" | peak {m['peak_mb']} MB" if m['peak_mb'] is not None else ""
+                print(f"  {stage:<12} {m['seconds']:>9}s{peak}")
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,155 @@
+"""
+Interview guide PDF render benchmark.
+
+Renders a large synthetic guide through InterviewPrepAgent.build_pdf and reports
+pages/sec and peak traced memory. --compare-legacy also runs the old canvas,
+which snapshotted the whole canvas __dict__ on every page.
+
+    python -m benchmarks.render_bench --questions 200 --repeat 3 --compare-legacy
+    python -m benchmarks.render_bench --batch 12 --questions 10 --workers 1,2,4   # process-pool scaling
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+from datetime import date
+
+from reportlab.pdfgen import canvas
+
+from src.agents import interview_agent
+from src.agents.interview_agent import InterviewPrepAgent, NumberedCanvas
+
+PAGE_RE = re.compile(rb'/Type /Page[^s]')
+
+
+class LegacyNumberedCanvas(NumberedCanvas):
+    """
+    The previous implementation: a full copy of the canvas state per page.
+    """
+
+    def showPage(self):
+        self._saved_page_states.append(dict(self.__dict__))
+        self._startPage()
+
+    def save(self):
+        num_pages = len(self._saved_page_states)
+        for state in self._saved_page_states:
+            self.__dict__.update(state)
+            self.draw_page_decorations(num_pages)
+            canvas.Canvas.showPage(self)
+        canvas.Canvas.save(self)
+
+
+def synthetic_guide(num_questions, role="SDE2", paragraph_repeat=12, bullets=5):
+    """
+    Builds a deterministic guide document with the same block mix Gemini produces.
+    """
+    questions = []
+    for i in range(1, num_questions + 1):
+        questions.append({
+            'id': i,
+            'category': ["System Design", "Coding & Algorithms", "Behavioral", "Architecture"][i % 4],
+            'question': f"How would you design and scale component #{i} of a <distributed> system & keep it reliable?",
+            'content_blocks': [
+                {'type': 'paragraph', 'text': "A detailed answer paragraph covering trade-offs, failure modes & scaling. " * paragraph_repeat},
+                {'type': 'subheading', 'text': "Key components"},
+                {'type': 'bullet_list', 'items': [f"Point {j}: a technical detail explained with enough words to wrap the line." for j in range(bullets)]},
+                {'type': 'code', 'language': 'python', 'text': "def handler(event):\n    if not event:\n        return None\n    return {'ok': True, 'id': event['id']}"},
+            ]
+        })
+    return {'role': role, 'introduction': "Role overview and current interview focus areas. " * 10, 'questions': questions}
+
+
+def render_once(agent, data, path):
+    started = time.perf_counter()
+    agent.build_pdf(data, path, published_on=date(2026, 1, 1))
+    return time.perf_counter() - started
+
+
+def traced_peak(agent, data, path):
+    # Separate pass: tracemalloc slows rendering several-fold, so it stays out of the timings
+    tracemalloc.start()
+    agent.build_pdf(data, path, published_on=date(2026, 1, 1))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run(label, canvas_cls, data, repeat):
+    interview_agent.NumberedCanvas = canvas_cls
+    agent = InterviewPrepAgent()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.pdf")
+        timings = [render_once(agent, data, path) for _ in range(repeat)]
+        with open(path, 'rb') as f:
+            pages = len(PAGE_RE.findall(f.read()))
+        peak = traced_peak(agent, data, path)
+    best = min(timings)
+    return {
+        'canvas': label,
+        'pages': pages,
+        'best_seconds': round(best, 3),
+        'pages_per_sec': round(pages / best, 2) if best else 0.0,
+        'peak_memory_mb': round(peak / (1024 * 1024), 2),
+    }
+
+
+def run_batch(num_guides, num_questions, workers):
+    """
+    Renders num_guides synthetic guides through build_pdf_batch with the given pool size.
+    """
+    guides = [synthetic_guide(num_questions, role=f"Role {i}") for i in range(num_guides)]
+    agent = InterviewPrepAgent()
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        rendered = agent.build_pdf_batch(guides, tmp, max_workers=workers, published_on=date(2026, 1, 1))
+        elapsed = time.perf_counter() - started
+    return {
+        'workers': workers,
+        'guides': len(rendered),
+        'seconds': round(elapsed, 3),
+        'guides_per_sec': round(len(rendered) / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Interview guide PDF render benchmark")
+    parser.add_argument('--questions', type=int, default=200, help="Questions in the synthetic guide")
+    parser.add_argument('--repeat', type=int, default=3, help="Renders per canvas (best time is reported)")
+    parser.add_argument('--compare-legacy', action='store_true', help="Also benchmark the old full-snapshot canvas")
+    parser.add_argument('--batch', type=int, default=0, help="Benchmark batch rendering of N guides instead")
+    parser.add_argument('--workers', default='1,2,4', help="Comma-separated pool sizes for --batch")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    if args.batch:
+        results = [run_batch(args.batch, args.questions, int(w)) for w in args.workers.split(',')]
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print(f"CPU count: {os.cpu_count()}")
+            for r in results:
+                print(f"{r['workers']} worker(s): {r['guides']} guides in {r['seconds']}s | {r['guides_per_sec']} guides/s")
+        return results
+
+    data = synthetic_guide(args.questions)
+    results = [run('numbered', NumberedCanvas, data, args.repeat)]
+    if args.compare_legacy:
+        results.append(run('legacy', LegacyNumberedCanvas, data, args.repeat))
+    interview_agent.NumberedCanvas = NumberedCanvas
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            print(f"{r['canvas']:<9} {r['pages']} pages | best {r['best_seconds']}s | "
+                  f"{r['pages_per_sec']} pages/s | peak {r['peak_memory_mb']} MB")
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,103 @@
+"""
+Role filtering benchmark: the compiled role matcher vs the per-keyword substring
+scans the scrapers and priority scoring used before it.
+
+    python -m benchmarks.role_match_bench --titles 100000
+"""
+import sys
+import json
+import time
+import random
+import argparse
+
+from src.utils import role_matcher
+from benchmarks.pipeline_bench import TITLES
+
+# The keyword lists as they were spread across remoteok.py, remotive.py,
+# weworkremotely.py and main.get_priority_score
+LEGACY_TITLE_ROLES = ['developer', 'engineer', 'sre', 'devops', 'tester']
+LEGACY_TAGS = {'dev', 'engineer', 'developer', 'backend', 'frontend', 'full stack', 'sre', 'devops', 'qa', 'test'}
+LEGACY_WWR = ['developer', 'software', 'engineer', 'devops', 'sre', 'backend', 'frontend', 'full stack', 'qa', 'tester']
+LEGACY_PRIORITY = ["developer", "software engineer", "sde", "backend", "frontend", "full stack"]
+
+OTHER_TITLES = [
+    "Product Manager", "Account Executive", "Data Analyst", "Customer Success Lead",
+    "UX Designer", "Technical Writer", "Marketing Manager", "Recruiter",
+]
+SENIORITY = ["", "Senior ", "Staff ", "Lead ", "Junior ", "Principal "]
+TAGS = ["dev", "backend", "python", "golang", "marketing", "sales", "design", "qa", "react", "aws"]
+
+
+def synthetic_titles(count, seed=42):
+    """
+    Roughly two thirds tech titles, with seniority prefixes and a numeric suffix on some
+    so that not every title repeats.
+    """
+    rng = random.Random(seed)
+    tech, weights = zip(*TITLES)
+    titles = []
+    for i in range(count):
+        base = rng.choices(tech, weights)[0] if rng.random() < 0.66 else rng.choice(OTHER_TITLES)
+        suffix = f" ({rng.randint(1, 500)})" if rng.random() < 0.5 else ""
+        titles.append(f"{rng.choice(SENIORITY)}{base}{suffix}")
+    tags = [rng.sample(TAGS, rng.randint(0, 4)) for _ in range(count)]
+    return titles, tags
+
+
+def legacy_scan(title, tags):
+    # Relevance (RemoteOK title/tags, then WWR's list) plus priority, as separate scans
+    relevant = any(tag.lower() in LEGACY_TAGS for tag in tags) or \
+        any(role in title.lower() for role in LEGACY_TITLE_ROLES) or \
+        any(k in title.lower() for k in LEGACY_WWR)
+    priority = 0 if any(k in title.lower() for k in LEGACY_PRIORITY) else 1
+    return relevant, priority
+
+
+def matcher_scan(title, tags):
+    categories = role_matcher.role_categories(title, tags)
+    return bool(categories), 0 if "development" in categories else 1
+
+
+def uncached_scan(title, tags):
+    categories = role_matcher._matcher.categories(title).union(*map(role_matcher._matcher.categories, tags))
+    return bool(categories), 0 if "development" in categories else 1
+
+
+def best_of(fn, titles, tags, repeat):
+    timings = []
+    for _ in range(repeat):
+        role_matcher._text_categories.cache_clear()
+        started = time.perf_counter()
+        for title, job_tags in zip(titles, tags):
+            fn(title, job_tags)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Role matcher vs legacy keyword scans")
+    parser.add_argument('--titles', type=int, default=100000, help="Number of synthetic titles")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per variant (best is reported)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    titles, tags = synthetic_titles(args.titles)
+    results = {
+        variant: round(best_of(fn, titles, tags, args.repeat), 4)
+        for variant, fn in (('legacy', legacy_scan), ('matcher', matcher_scan), ('matcher_uncached', uncached_scan))
+    }
+    kept = sum(matcher_scan(t, g)[0] for t, g in zip(titles, tags))
+    legacy_kept = sum(legacy_scan(t, g)[0] for t, g in zip(titles, tags))
+    result = {'titles': args.titles, 'seconds': results, 'kept': kept, 'legacy_kept': legacy_kept}
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{args.titles} titles | kept {kept} (legacy {legacy_kept})")
+        for variant, seconds in results.items():
+            print(f"  {variant:<18} {seconds:>8}s | {args.titles / seconds:,.0f} titles/s")
+    return result
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,109 @@
+"""
+Scraper parse benchmark over recorded fixtures.
+
+Record each source's raw responses once (live network; SerpApi needs SERPAPI_KEY):
+
+    python -m benchmarks.scraper_bench --record
+
+then time every scraper's scrape() offline against the recordings, scaled up
+synthetically to larger feeds:
+
+    python -m benchmarks.scraper_bench --scales 1,10,100 --repeat 3
+
+"Now" is pinned to the recording time so the scrapers' 24h cutoffs keep the same jobs.
+"""
+import sys
+import json
+import time
+import logging
+import argparse
+from datetime import datetime
+from contextlib import nullcontext
+from unittest import mock
+
+from src.main import SCRAPER_CLASSES
+from src.scrapers import fixtures
+
+
+def frozen_datetime(timestamp):
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.fromtimestamp(timestamp, tz)
+    return FrozenDatetime
+
+
+def record(version=None):
+    fixtures.configure('record', version)
+    for scraper_cls in SCRAPER_CLASSES:
+        scraper = scraper_cls()
+        jobs = scraper.scrape()
+        print(f"{scraper.name}: recorded, {len(jobs)} jobs parsed")
+
+
+def time_scraper(scraper_cls, scale, repeat, version=None):
+    fixtures.configure('replay', version, scale)
+    scraper = scraper_cls()
+    module = sys.modules[scraper_cls.__module__]
+    recorded_at = fixtures.recorded_at(scraper.name)
+
+    patch = mock.patch.object(module, 'datetime', frozen_datetime(recorded_at)) \
+        if recorded_at and hasattr(module, 'datetime') else nullcontext()
+    with patch:
+        jobs = scraper.scrape()  # warm-up: builds the scaled feed outside the timings
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            jobs = scraper.scrape()
+            timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    return {
+        'source': scraper.name,
+        'scale': scale,
+        'jobs': len(jobs),
+        'best_seconds': round(best, 4),
+        'jobs_per_sec': round(len(jobs) / best, 1) if best else 0.0,
+    }
+
+
+def run(scales, repeat, version=None):
+    results = []
+    for scraper_cls in SCRAPER_CLASSES:
+        name = scraper_cls().name
+        if not fixtures.versions(name):
+            print(f"{name}: no fixtures recorded, skipping", file=sys.stderr)
+            continue
+        for scale in scales:
+            results.append(time_scraper(scraper_cls, scale, repeat, version))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scraper parse benchmark over recorded fixtures")
+    parser.add_argument('--record', action='store_true', help="Fetch every source live and record fixtures")
+    parser.add_argument('--version', help="Fixture version to record into / replay (default: new timestamp / latest)")
+    parser.add_argument('--scales', default='1,10,100', help="Comma-separated feed size multipliers")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per scraper and scale (best is reported)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    # Scrapers log every fetch; keep the benchmark output readable
+    logging.getLogger().setLevel(logging.WARNING)
+
+    if args.record:
+        record(args.version)
+        return []
+
+    results = run([int(s) for s in args.scales.split(',')], args.repeat, args.version)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            print(f"{r['source']:<22} x{r['scale']:<4} {r['jobs']:>7} jobs | best {r['best_seconds']}s | "
+                  f"{r['jobs_per_sec']} jobs/s")
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
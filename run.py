@@ -1,29 +1,75 @@
+import os
+import json
+import time
 import logging
 import argparse
 from src.main import main, run_job_scraping
-from src.utils.db import init_db
+from src.utils.db import init_db, get_recent_runs, find_posted_jobs_by_salary
+from src.utils import profiling
+from src.utils.job_batch import JobBatch
 from src.agents.interview_agent import InterviewPrepAgent
+from src.agents.runner import run_interview_agent, run_interview_prefetch, start_interview_agent_process
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Job Openings Scraper Service")
     parser.add_argument('--run-once', action='store_true', help="Run the scraper once and exit")
     parser.add_argument('--run-agent-once', action='store_true', help="Run the interview prep agent once and exit")
+    parser.add_argument('--prefetch-guides', action='store_true', help="Build upcoming interview guides ahead of time and exit")
+    parser.add_argument('--render-batch', metavar='INPUT_DIR', help="Render every guide JSON file in INPUT_DIR to PDF in parallel and exit")
+    parser.add_argument('--output-dir', default='rendered_guides', help="Output directory for --render-batch")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes for --render-batch (default: CPU count)")
+    parser.add_argument('--show-runs', type=int, metavar='N', help="Print the last N run reports as JSON and exit")
+    parser.add_argument('--export-history', metavar='PATH', help="Export posted job history to a columnar .npz file and exit")
+    parser.add_argument('--min-salary', type=float, metavar='AMOUNT', help="Print posted jobs paying at least AMOUNT a year and exit")
+    parser.add_argument('--salary-currency', default='USD', help="Currency code for --min-salary (default: USD)")
+    parser.add_argument('--profile', action='store_true', help="Profile each pipeline stage (cProfile + tracemalloc)")
+    parser.add_argument('--profile-dir', default='profiles', help="Output directory for --profile")
+    parser.add_argument('--profile-top', type=int, default=20, help="Functions/allocation sites listed per stage in the --profile summary")
+    parser.add_argument('--skip-agent', action='store_true', help="With --run-once, don't start the interview prep agent")
     args = parser.parse_args()
 
     # Ensure DB is initialized
     init_db()
 
+    if args.profile:
+        profiling.enable(os.path.join(args.profile_dir, time.strftime("%Y%m%d-%H%M%S")), "main", args.profile_top)
+
     try:
         if args.run_once:
+            # Agent runs in its own worker process alongside the scrape/deliver cycle
+            agent_process = None if args.skip_agent else start_interview_agent_process()
             run_job_scraping()
+            if agent_process:
+                agent_process.join()
         elif args.run_agent_once:
             logging.info("Starting standalone Interview Prep Agent run...")
-            agent = InterviewPrepAgent()
-            agent.execute_daily_run()
+            run_interview_agent()
+        elif args.prefetch_guides:
+            run_interview_prefetch()
+        elif args.show_runs:
+            print(json.dumps(get_recent_runs(limit=args.show_runs), indent=2))
+        elif args.min_salary is not None:
+            columns = ('id', 'company', 'role', 'url', 'salary_min', 'salary_max', 'salary_period')
+            matches = find_posted_jobs_by_salary(args.salary_currency.upper(), args.min_salary)
+            print(json.dumps([dict(zip(columns, row)) for row in matches], indent=2))
+        elif args.export_history:
+            history = JobBatch.from_db()
+            history.save(args.export_history)
+            logging.info(f"Exported {len(history)} posted jobs to {args.export_history}")
+        elif args.render_batch:
+            guides = []
+            for name in sorted(os.listdir(args.render_batch)):
+                if name.endswith('.json'):
+                    with open(os.path.join(args.render_batch, name)) as f:
+                        guides.append(json.load(f))
+            InterviewPrepAgent().build_pdf_batch(guides, args.output_dir, max_workers=args.workers)
         else:
             main()
     except KeyboardInterrupt:
         logging.info("Service stopped by user")
     except Exception as e:
         logging.critical(f"Service crashed: {e}", exc_info=True)
+    finally:
+        if args.profile:
+            profiling.finish()
 
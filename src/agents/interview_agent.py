@@ -1,24 +1,42 @@
+import io
 import os
 import json
 import logging
 import requests
 import html
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone, date, timedelta
 from serpapi import GoogleSearch
 
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, KeepTogether
 from reportlab.pdfgen import canvas
 
-from src.utils.config import SERPAPI_KEY, GEMINI_API_KEY
-from src.utils.db import get_state, set_state
+from src.utils.config import (
+    SERPAPI_KEY, GEMINI_API_KEY, SEARCH_CACHE_TTL_HOURS, SEARCH_CACHE_MAX_ENTRIES,
+    PREFETCH_AHEAD_ROLES, PREFETCH_MAX_AGE_DAYS,
+    GEMINI_API_URL, GEMINI_STREAMING, GEMINI_TIMEOUT_SECONDS,
+    GEMINI_STREAM_READ_TIMEOUT, GEMINI_STREAM_MAX_ATTEMPTS,
+    GUIDE_QUESTION_COUNT, QUESTION_BANK_MIN_FRESH
+)
+from src.utils.db import (
+    get_state, set_state, get_cached_search, cache_search,
+    save_prefetched_guide, get_prefetched_guide, delete_prefetched_guide
+)
 from src.utils.telegram_bot import TelegramBot
 from src.utils.whatsapp_bot import send_whatsapp_file, send_whatsapp_message
+from src.utils import artifact_store, run_report
+from src.agents.stream_parser import QuestionStreamParser, iter_sse_text
+from src.agents import question_bank
+from src.agents.pdf_styles import get_styles
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever build_pdf or pdf_styles change the rendered output, so stored PDFs are not reused
+RENDERER_VERSION = 1
+
 ROLES = [
     "SDE1",
     "SDE2",
@@ -29,12 +47,23 @@ ROLES = [
 ]
 
 class NumberedCanvas(canvas.Canvas):
+    """
+    Canvas that defers page decorations until the page count is known.
+    Each page keeps a shallow copy of the canvas attributes, so page-level state
+    (graphics state and _extgstate, page size, rotation, transition, duration)
+    is emitted with its own page. Only the attributes shared by every page are
+    left out (SHARED_KEYS): the PDF document and the saved page states.
+    """
+    SHARED_KEYS = frozenset(('_doc', '_saved_page_states'))
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._saved_page_states = []
 
     def showPage(self):
-        self._saved_page_states.append(dict(self.__dict__))
+        self._saved_page_states.append(
+            {key: value for key, value in self.__dict__.items() if key not in self.SHARED_KEYS}
+        )
         self._startPage()
 
     def save(self):
@@ -43,6 +72,7 @@ class NumberedCanvas(canvas.Canvas):
             self.__dict__.update(state)
             self.draw_page_decorations(num_pages)
             super().showPage()
+        self._saved_page_states = []
         super().save()
 
     def draw_page_decorations(self, total_pages):
@@ -80,11 +110,27 @@ class NumberedCanvas(canvas.Canvas):
         self.restoreState()
 
 
+def render_guide_file(data, pdf_path, published_on=None):
+    """
+    Process-pool worker: renders one guide to a temporary file next to pdf_path and
+    atomically renames it into place, so readers never see a half-written PDF.
+    """
+    tmp_path = os.path.join(os.path.dirname(pdf_path), f".{os.path.basename(pdf_path)}.{os.getpid()}.tmp")
+    try:
+        InterviewPrepAgent().build_pdf(data, tmp_path, published_on=published_on)
+        os.replace(tmp_path, pdf_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return pdf_path
+
+
 class InterviewPrepAgent:
     def __init__(self):
         self.roles = ROLES
         self.serpapi_key = SERPAPI_KEY
         self.gemini_key = GEMINI_API_KEY
+        self.search_stats = {'lookups': 0, 'hits': 0, 'api_calls': 0}
 
     def get_current_role(self):
         """
@@ -101,6 +147,21 @@ class InterviewPrepAgent:
             
         return self.roles[role_idx], role_idx
 
+    def published_today(self):
+        return get_state("interview_last_published") == date.today().isoformat()
+
+    def upcoming_roles(self, count):
+        """
+        Returns the next `count` roles in rotation order as (days_ahead, role_name), starting
+        with the current role: due today, or tomorrow once today's guide has gone out.
+        """
+        _, role_idx = self.get_current_role()
+        first_day = 1 if self.published_today() else 0
+        return [(first_day + offset, self.roles[(role_idx + offset) % len(self.roles)]) for offset in range(count)]
+
+    def pdf_filename(self, role_name):
+        return f"{role_name.replace(' ', '_')}_Interview_Questions.pdf"
+
     def advance_role_index(self, current_idx):
         """
         Increments role rotation index in SQLite state.
@@ -109,15 +170,40 @@ class InterviewPrepAgent:
         set_state("interview_role_index", next_idx)
         logger.info(f"Advanced interview role index to {next_idx} ({self.roles[next_idx]})")
 
+    def normalize_query(self, query):
+        """
+        Cache key for a search query: case- and whitespace-insensitive.
+        """
+        return " ".join(query.lower().split())
+
+    def format_search_results(self, organic):
+        snippets = []
+        for r in organic:
+            title = r.get("title", "")
+            snippet = r.get("snippet", "")
+            link = r.get("link", "")
+            snippets.append(f"Title: {title}\nSnippet: {snippet}\nSource: {link}\n---")
+        return "\n".join(snippets)
+
     def search_market_trends(self, role_name):
         """
         Searches the web using SerpApi to fetch latest interview topics and trends.
+        Results are served from the SQLite search cache while within SEARCH_CACHE_TTL_HOURS.
         """
         if not self.serpapi_key:
             logger.warning("No SERPAPI_KEY configured. Skipping SerpApi search grounding.")
             return "No search results available."
 
         query = f"{role_name} interview questions and answers current market trends 2026"
+        query_key = self.normalize_query(query)
+
+        self.search_stats['lookups'] += 1
+        cached = get_cached_search(query_key, SEARCH_CACHE_TTL_HOURS * 3600)
+        if cached is not None:
+            self.search_stats['hits'] += 1
+            logger.info(f"Search cache hit for: {query}")
+            return self.format_search_results(json.loads(cached))
+
         logger.info(f"Searching web via SerpApi for: {query}")
         
         try:
@@ -128,38 +214,47 @@ class InterviewPrepAgent:
                 "num": 8
             }
             search = GoogleSearch(params)
-            results = search.get_dict()
+            self.search_stats['api_calls'] += 1
+            with run_report.api_call('serpapi'):
+                results = search.get_dict()
             organic = results.get("organic_results", [])
-            
-            snippets = []
-            for r in organic:
-                title = r.get("title", "")
-                snippet = r.get("snippet", "")
-                link = r.get("link", "")
-                snippets.append(f"Title: {title}\nSnippet: {snippet}\nSource: {link}\n---")
+
+            # Only cache real results so an empty/failed search is retried next run
+            if organic:
+                cache_search(query_key, json.dumps(organic), SEARCH_CACHE_MAX_ENTRIES)
                 
-            return "\n".join(snippets)
+            return self.format_search_results(organic)
         except Exception as e:
             logger.error(f"Error searching Google via SerpApi: {e}", exc_info=True)
             return "Search failed due to API error."
 
-    def generate_questions_json(self, role_name, search_context):
+    def log_search_cache_stats(self):
+        lookups = self.search_stats['lookups']
+        if not lookups:
+            return
+        hits = self.search_stats['hits']
+        logger.info(
+            f"Search cache: {hits}/{lookups} hits ({hits / lookups:.0%} hit rate), "
+            f"SerpApi calls made: {self.search_stats['api_calls']}, saved: {hits}"
+        )
+
+    def build_prompt(self, role_name, search_context, num_questions=10, exclude_questions=None):
         """
-        Calls Gemini API with search context to generate structured interview questions.
+        Builds the Gemini prompt. `exclude_questions` lists questions the guide already has,
+        so a retry or partial request only asks for the missing ones.
         """
-        if not self.gemini_key:
-            raise ValueError("GEMINI_API_KEY is not defined in configuration.")
+        exclusion = ""
+        if exclude_questions:
+            listed = "\n".join(f"- {q}" for q in exclude_questions)
+            exclusion = f"\nThe guide already contains the following questions; do NOT repeat or paraphrase them:\n{listed}\n"
 
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-3.5-flash:generateContent?key={self.gemini_key}"
-        headers = {'Content-Type': 'application/json'}
-        
         prompt = f"""You are an expert technical interviewer and curriculum designer.
 Generate a comprehensive, high-quality interview preparation guide (questions and answers) for the role: '{role_name}' as per current market trends in July 2026.
 
 Use the following internet search results as current context of market expectations:
 {search_context}
 
-Please generate exactly 10 high-quality interview questions and their answers.
+Please generate exactly {num_questions} high-quality interview questions and their answers.{exclusion}
 The output MUST be a single, valid JSON object in the following format:
 {{
   "role": "{role_name}",
@@ -204,8 +299,10 @@ Ensure that:
 6. If a block is code/diagram, type is 'code' and text is the code/diagram content.
 7. Return ONLY the JSON object. Do not wrap in backticks or any markdown formatting.
 """
+        return prompt
 
-        payload = {
+    def build_payload(self, prompt):
+        return {
             "contents": [{
                 "parts": [{
                     "text": prompt
@@ -216,10 +313,61 @@ Ensure that:
                 "temperature": 0.2
             }
         }
+
+    def generate_questions_json(self, role_name, search_context, num_questions=10, exclude_questions=None):
+        """
+        Calls Gemini API with search context to generate structured interview questions.
+        Uses the streaming endpoint when GEMINI_STREAMING is enabled.
+        """
+        if not self.gemini_key:
+            raise ValueError("GEMINI_API_KEY is not defined in configuration.")
+        if GEMINI_STREAMING:
+            return self.generate_questions_stream(role_name, search_context, num_questions, exclude_questions)
+        return self.generate_questions_blocking(role_name, search_context, num_questions, exclude_questions)
+
+    def generate_questions_blocking(self, role_name, search_context, num_questions=10, exclude_questions=None):
+        """
+        generateContent calls; each guide is parsed once its response completes. Like the
+        streaming path, a response with too few questions is topped up by asking again
+        for the missing ones, and extra questions are dropped.
+        """
+        started = time.monotonic()
+        data = None
+        questions = []
+        for attempt in range(GEMINI_STREAM_MAX_ATTEMPTS):
+            missing = num_questions - len(questions)
+            if missing <= 0:
+                break
+            if attempt:
+                run_report.record_retry('gemini')
+                logger.warning(f"Gemini returned {len(questions)}/{num_questions} questions for {role_name}, "
+                               f"asking for {missing} more")
+            prompt = self.build_prompt(
+                role_name, search_context, missing,
+                exclude_questions=list(exclude_questions or []) + [q.get('question', '') for q in questions]
+            )
+            response_data = self.request_guide(role_name, prompt)
+            data = data or response_data
+            questions += response_data.get('questions', [])[:missing]
+
+        if len(questions) < num_questions:
+            raise ValueError(f"Gemini produced {len(questions)}/{num_questions} questions after {GEMINI_STREAM_MAX_ATTEMPTS} attempts.")
+        logger.info(f"Gemini generation for {role_name} took {time.monotonic() - started:.1f}s")
+        data['questions'] = questions
+        return data
+
+    def request_guide(self, role_name, prompt):
+        """
+        One generateContent call, parsed as the guide JSON.
+        """
+        url = f"{GEMINI_API_URL}:generateContent?key={self.gemini_key}"
+        headers = {'Content-Type': 'application/json'}
+        payload = self.build_payload(prompt)
         
         logger.info(f"Calling Gemini API to generate questions for {role_name}...")
-        response = requests.post(url, headers=headers, json=payload, timeout=90)
-        response.raise_for_status()
+        with run_report.api_call('gemini'):
+            response = requests.post(url, headers=headers, json=payload, timeout=GEMINI_TIMEOUT_SECONDS)
+            response.raise_for_status()
         
         res_json = response.json()
         try:
@@ -238,6 +386,91 @@ Ensure that:
             logger.error(f"Failed to parse Gemini response as JSON: {e}. Raw response: {res_json}")
             raise ValueError("Invalid JSON response from Gemini API.")
 
+    def load_checkpoint(self, role_name):
+        raw = get_state(f"gemini_checkpoint:{role_name}")
+        if not raw:
+            return {'introduction': None, 'questions': []}
+        try:
+            checkpoint = json.loads(raw)
+        except ValueError:
+            return {'introduction': None, 'questions': []}
+        # Checkpoints only bridge retries within a day; stale ones are discarded
+        if checkpoint.get('date') != date.today().isoformat():
+            return {'introduction': None, 'questions': []}
+        return checkpoint
+
+    def save_checkpoint(self, role_name, checkpoint):
+        checkpoint['date'] = date.today().isoformat()
+        set_state(f"gemini_checkpoint:{role_name}", json.dumps(checkpoint))
+
+    def clear_checkpoint(self, role_name):
+        set_state(f"gemini_checkpoint:{role_name}", "")
+
+    def generate_questions_stream(self, role_name, search_context, num_questions=10, exclude_questions=None):
+        """
+        Streams the guide from streamGenerateContent and parses questions as they arrive.
+        Each completed question is checkpointed in agent_state, so after a timeout or
+        dropped stream the retry only asks Gemini for the questions still missing.
+        """
+        url = f"{GEMINI_API_URL}:streamGenerateContent?alt=sse&key={self.gemini_key}"
+        headers = {'Content-Type': 'application/json'}
+
+        checkpoint = self.load_checkpoint(role_name)
+        questions = checkpoint['questions'][:num_questions]
+        if questions:
+            logger.info(f"Resuming {role_name} guide from checkpoint with {len(questions)} question(s)")
+
+        started = time.monotonic()
+        first_question_at = None
+        for attempt in range(GEMINI_STREAM_MAX_ATTEMPTS):
+            missing = num_questions - len(questions)
+            if missing <= 0 and checkpoint.get('introduction'):
+                break
+            if attempt:
+                run_report.record_retry('gemini')
+
+            # Always ask for at least one question so the response carries an introduction
+            prompt = self.build_prompt(
+                role_name, search_context, max(missing, 1),
+                exclude_questions=list(exclude_questions or []) + [q.get('question', '') for q in questions]
+            )
+            parser = QuestionStreamParser()
+            # Each attempt gets the full timeout; `started` covers the whole generation
+            attempt_started = time.monotonic()
+            logger.info(f"Streaming {max(missing, 1)} question(s) for {role_name} from Gemini (attempt {attempt+1}/{GEMINI_STREAM_MAX_ATTEMPTS})...")
+            try:
+                with run_report.api_call('gemini'), \
+                        requests.post(url, headers=headers, json=self.build_payload(prompt), stream=True,
+                                      timeout=(10, GEMINI_STREAM_READ_TIMEOUT)) as response:
+                    response.raise_for_status()
+                    for chunk in iter_sse_text(response):
+                        for question in parser.feed(chunk):
+                            if len(questions) >= num_questions:
+                                continue
+                            questions.append(question)
+                            run_report.incr('questions_generated')
+                            if first_question_at is None:
+                                first_question_at = time.monotonic()
+                                logger.info(f"Time to first question: {first_question_at - started:.1f}s")
+                            checkpoint['questions'] = questions
+                            self.save_checkpoint(role_name, checkpoint)
+                        if parser.introduction and not checkpoint.get('introduction'):
+                            checkpoint['introduction'] = parser.introduction
+                            self.save_checkpoint(role_name, checkpoint)
+                        if time.monotonic() - attempt_started > GEMINI_TIMEOUT_SECONDS:
+                            raise TimeoutError(f"Gemini stream exceeded {GEMINI_TIMEOUT_SECONDS}s")
+            except (requests.exceptions.RequestException, TimeoutError) as e:
+                logger.warning(f"Gemini stream interrupted with {len(questions)}/{num_questions} questions: {e}")
+
+        if len(questions) < num_questions or not checkpoint.get('introduction'):
+            raise ValueError(f"Gemini stream produced {len(questions)}/{num_questions} questions after {GEMINI_STREAM_MAX_ATTEMPTS} attempts.")
+
+        for i, question in enumerate(questions, start=1):
+            question['id'] = i
+        self.clear_checkpoint(role_name)
+        logger.info(f"Gemini streaming generation for {role_name} completed in {time.monotonic() - started:.1f}s")
+        return {'role': role_name, 'introduction': checkpoint['introduction'], 'questions': questions}
+
     def format_code_block(self, text):
         """
         Escapes XML special characters in code and converts leading spaces to non-breaking spaces for ReportLab.
@@ -258,13 +491,16 @@ Ensure that:
         """
         return html.escape(text)
 
-    def build_pdf(self, data, pdf_path):
+    def build_pdf(self, data, pdf_path=None, published_on=None):
         """
         Generates a premium PDF document using ReportLab.
+        Written to pdf_path if given, otherwise rendered in memory and returned as bytes.
+        `published_on` (a date) defaults to today.
         """
-        logger.info(f"Generating PDF for {data['role']} at {pdf_path}...")
+        logger.info(f"Generating PDF for {data['role']} {'at ' + pdf_path if pdf_path else 'in memory'}...")
+        buffer = None if pdf_path else io.BytesIO()
         doc = SimpleDocTemplate(
-            pdf_path,
+            pdf_path or buffer,
             pagesize=letter,
             leftMargin=54,
             rightMargin=54,
@@ -272,104 +508,18 @@ Ensure that:
             bottomMargin=72
         )
 
-        styles = getSampleStyleSheet()
-
-        # Modify existing styles to be clean and modern
-        normal_style = styles['Normal']
-        normal_style.textColor = colors.HexColor('#1F2937') # Charcoal
-        normal_style.fontSize = 10
-        normal_style.leading = 14
-
-        # Custom Custom styles
-        title_style = ParagraphStyle(
-            name='DocTitle',
-            fontName='Helvetica-Bold',
-            fontSize=24,
-            leading=28,
-            textColor=colors.HexColor('#1E3A8A'),
-            spaceAfter=8
-        )
-
-        subtitle_style = ParagraphStyle(
-            name='DocSubtitle',
-            fontName='Helvetica',
-            fontSize=12,
-            leading=16,
-            textColor=colors.HexColor('#4B5563'),
-            spaceAfter=12
-        )
-
-        meta_style = ParagraphStyle(
-            name='DocMeta',
-            fontName='Helvetica-Oblique',
-            fontSize=9,
-            leading=12,
-            textColor=colors.HexColor('#6B7280'),
-            spaceAfter=20
-        )
-
-        intro_style = ParagraphStyle(
-            name='IntroText',
-            parent=normal_style,
-            fontSize=10.5,
-            leading=15,
-            textColor=colors.HexColor('#374151')
-        )
-
-        q_title_style = ParagraphStyle(
-            name='QuestionTitle',
-            fontName='Helvetica-Bold',
-            fontSize=12,
-            leading=16,
-            textColor=colors.HexColor('#1E3A8A'),
-            spaceBefore=14,
-            spaceAfter=6,
-            keepWithNext=True
-        )
-
-        subheading_style = ParagraphStyle(
-            name='BlockSubheading',
-            fontName='Helvetica-Bold',
-            fontSize=10,
-            leading=14,
-            textColor=colors.HexColor('#111827'),
-            spaceBefore=8,
-            spaceAfter=4,
-            keepWithNext=True
-        )
-
-        code_style = ParagraphStyle(
-            name='CodeBlock',
-            fontName='Courier',
-            fontSize=8,
-            leading=10,
-            textColor=colors.HexColor('#0F172A'),
-            backColor=colors.HexColor('#F8FAFC'),
-            borderColor=colors.HexColor('#E2E8F0'),
-            borderWidth=0.5,
-            borderPadding=8,
-            spaceBefore=6,
-            spaceAfter=6
-        )
-
-        bullet_style = ParagraphStyle(
-            name='BulletItem',
-            parent=normal_style,
-            leftIndent=15,
-            firstLineIndent=-10,
-            spaceBefore=3,
-            spaceAfter=3
-        )
+        styles = get_styles()
+        normal_style = styles['body']
 
         story = []
 
         # Header Title Area (Page 1)
-        story.append(Paragraph("DAILY TECH JOBS DIGEST BY VJ", ParagraphStyle('TopKicker', fontName='Helvetica-Bold', fontSize=9, textColor=colors.HexColor('#3B82F6'), spaceAfter=4)))
-        story.append(Paragraph(f"Interview Preparation Guide: {data['role']}", title_style))
-        story.append(Paragraph("Curated Current Market Questions & Explanatory Solutions", subtitle_style))
+        story.append(Paragraph("DAILY TECH JOBS DIGEST BY VJ", styles['kicker']))
+        story.append(Paragraph(f"Interview Preparation Guide: {data['role']}", styles['title']))
+        story.append(Paragraph("Curated Current Market Questions & Explanatory Solutions", styles['subtitle']))
         
-        date_str = datetime.now().strftime("%B %d, %Y")
-        story.append(Paragraph(f"Published on {date_str} | Powered by Gemini Grounded AI Engine", meta_style))
+        date_str = (published_on or datetime.now().date()).strftime("%B %d, %Y")
+        story.append(Paragraph(f"Published on {date_str} | Powered by Gemini Grounded AI Engine", styles['meta']))
         
         # Blue Divider bar
         divider_data = [['']]
@@ -383,12 +533,12 @@ Ensure that:
         story.append(Spacer(1, 15))
 
         # Introduction Section
-        story.append(Paragraph("Role Overview & Interview Trends", ParagraphStyle('SecH', fontName='Helvetica-Bold', fontSize=14, textColor=colors.HexColor('#1E3A8A'), spaceBefore=10, spaceAfter=8, keepWithNext=True)))
-        story.append(Paragraph(self.format_paragraph(data['introduction']), intro_style))
+        story.append(Paragraph("Role Overview & Interview Trends", styles['section']))
+        story.append(Paragraph(self.format_paragraph(data['introduction']), styles['intro']))
         story.append(Spacer(1, 15))
 
         # Questions Q1 to Q10
-        story.append(Paragraph("Curated Practice Questions", ParagraphStyle('SecH2', fontName='Helvetica-Bold', fontSize=14, textColor=colors.HexColor('#1E3A8A'), spaceBefore=10, spaceAfter=8, keepWithNext=True)))
+        story.append(Paragraph("Curated Practice Questions", styles['section']))
         
         for q in data['questions']:
             q_elements = []
@@ -396,7 +546,7 @@ Ensure that:
             # Question Title
             q_text = f"Q{q['id']}. {q['question']}"
             q_cat = f" [{q['category']}]" if 'category' in q else ""
-            q_elements.append(Paragraph(self.format_paragraph(q_text) + f"<font color='#4B5563'><i>{self.format_paragraph(q_cat)}</i></font>", q_title_style))
+            q_elements.append(Paragraph(self.format_paragraph(q_text) + f"<font color='#4B5563'><i>{self.format_paragraph(q_cat)}</i></font>", styles['question']))
             
             # Question Content Blocks
             for block in q.get('content_blocks', []):
@@ -405,14 +555,14 @@ Ensure that:
                     q_elements.append(Paragraph(self.format_paragraph(block.get('text', '')), normal_style))
                     q_elements.append(Spacer(1, 6))
                 elif b_type == 'subheading':
-                    q_elements.append(Paragraph(self.format_paragraph(block.get('text', '')), subheading_style))
+                    q_elements.append(Paragraph(self.format_paragraph(block.get('text', '')), styles['subheading']))
                 elif b_type == 'bullet_list':
                     for item in block.get('items', []):
-                        q_elements.append(Paragraph(f"&bull; {self.format_paragraph(item)}", bullet_style))
+                        q_elements.append(Paragraph(f"&bull; {self.format_paragraph(item)}", styles['bullet']))
                     q_elements.append(Spacer(1, 6))
                 elif b_type == 'code':
                     code_text = self.format_code_block(block.get('text', ''))
-                    q_elements.append(Paragraph(code_text, code_style))
+                    q_elements.append(Paragraph(code_text, styles['code']))
                     q_elements.append(Spacer(1, 6))
             
             q_elements.append(Spacer(1, 10))
@@ -422,7 +572,143 @@ Ensure that:
 
         # Build PDF using NumberedCanvas
         doc.build(story, canvasmaker=NumberedCanvas)
+        if buffer is not None:
+            logger.info(f"Successfully generated PDF ({buffer.tell()} bytes)")
+            return buffer.getvalue()
         logger.info(f"Successfully generated PDF file: {pdf_path}")
+        return pdf_path
+
+    def compose_guide(self, role_name):
+        """
+        Assembles a guide from fresh Gemini questions plus banked questions for the role.
+        Gemini is only asked for the questions the bank cannot supply, and every fresh
+        question is added to the bank for later guides.
+        """
+        bank_ids, banked = question_bank.select_questions(role_name, GUIDE_QUESTION_COUNT - QUESTION_BANK_MIN_FRESH)
+        fresh_needed = GUIDE_QUESTION_COUNT - len(banked)
+        logger.info(f"Guide for {role_name}: {len(banked)} question(s) from bank, requesting {fresh_needed} fresh")
+
+        search_context = self.search_market_trends(role_name)
+        data = self.generate_questions_json(
+            role_name, search_context, fresh_needed,
+            exclude_questions=[q.get('question', '') for q in banked]
+        )
+
+        # Both generation paths return exactly fresh_needed questions (or raise); never bank extras
+        fresh = data.get('questions', [])[:fresh_needed]
+        added_ids = question_bank.add_questions(role_name, fresh)
+        logger.info(f"Question bank: added {len(added_ids)} of {len(fresh)} fresh question(s) for {role_name}")
+        # Fresh questions count as used today too, so they sit out the cooldown like banked ones
+        question_bank.mark_used(bank_ids + added_ids)
+
+        questions = fresh + banked
+        for i, question in enumerate(questions, start=1):
+            question['id'] = i
+        data['questions'] = questions
+        return data
+
+    def render_guide(self, data, published_on=None):
+        """
+        Returns (pdf_path, pdf_bytes) for a guide from the artifact store, rendering it in
+        memory only if this exact JSON has not been rendered by the current renderer for the
+        same publish date. The guide JSON is stored alongside the PDF.
+        """
+        published_on = published_on or date.today()
+        key = artifact_store.artifact_key(data, RENDERER_VERSION, published_on.isoformat())
+        pdf_path = artifact_store.get_path(key, 'pdf')
+        if pdf_path:
+            run_report.incr('artifact_cache_hits')
+            with open(pdf_path, 'rb') as f:
+                return pdf_path, f.read()
+
+        artifact_store.put_json(key, 'json', 'guide.json', data)
+        with run_report.stage('render'):
+            pdf_bytes = self.build_pdf(data, published_on=published_on)
+        run_report.incr('guides_rendered')
+        pdf_path = artifact_store.put_bytes(key, 'pdf', self.pdf_filename(data.get('role', 'Guide')), pdf_bytes)
+        logger.info(f"Rendered guide artifact {key[:12]} for {data.get('role')}")
+        return pdf_path, pdf_bytes
+
+    def prefetch_upcoming(self, count=PREFETCH_AHEAD_ROLES, include_current=True):
+        """
+        Generates question JSON and PDFs for upcoming roles ahead of time and stores them
+        as ready artifacts, so the daily run only has to send them.
+        Returns the number of guides built.
+        """
+        start = 0 if include_current else 1
+        built = 0
+        for days_ahead, role_name in self.upcoming_roles(count + start)[start:]:
+            publish_date = date.today() + timedelta(days=days_ahead)
+            prefetched = self.load_prefetched(role_name)
+            if prefetched and prefetched['pdf_path'] and prefetched['publish_date'] == publish_date.isoformat():
+                continue
+            try:
+                if prefetched:
+                    # Stored without a PDF or for another date: keep the questions, render for the right date
+                    logger.info(f"Rendering stored interview guide for {role_name} ({days_ahead} day(s) ahead)...")
+                    data = prefetched['data']
+                else:
+                    logger.info(f"Prefetching interview guide for {role_name} ({days_ahead} day(s) ahead)...")
+                    with run_report.stage('compose'):
+                        data = self.compose_guide(role_name)
+
+                pdf_path, _ = self.render_guide(data, published_on=publish_date)
+                save_prefetched_guide(role_name, json.dumps(data), pdf_path, publish_date.isoformat())
+                built += 1
+            except Exception as e:
+                logger.error(f"Failed to prefetch interview guide for {role_name}: {e}", exc_info=True)
+        self.log_search_cache_stats()
+        return built
+
+    def load_prefetched(self, role_name):
+        """
+        Returns the stored guide for a role (prefetched, or generated by a run whose send
+        failed) as {'data', 'pdf_path', 'publish_date'} with the JSON decoded, or None if
+        nothing usable is stored.
+        """
+        prefetched = get_prefetched_guide(role_name, PREFETCH_MAX_AGE_DAYS)
+        if not prefetched:
+            return None
+        try:
+            prefetched['data'] = json.loads(prefetched['data'])
+        except ValueError:
+            logger.warning(f"Discarding unreadable prefetched guide for {role_name}")
+            delete_prefetched_guide(role_name)
+            return None
+        return prefetched
+
+    def build_pdf_batch(self, guides, output_dir, max_workers=None, published_on=None):
+        """
+        Renders many guide documents in parallel with a process pool (ReportLab layout is
+        pure-Python CPU work, so threads would not help). A guide may carry an 'audience'
+        key to render per-audience variants of the same role. Returns {label: pdf_path}
+        for the guides that rendered; failures are logged and skipped.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        jobs = {}
+        for data in guides:
+            label = f"{data['role']} {data['audience']}" if data.get('audience') else data['role']
+            pdf_path = os.path.abspath(os.path.join(output_dir, self.pdf_filename(label)))
+            jobs[pdf_path] = (label, data)
+
+        rendered = {}
+        started = time.monotonic()
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(render_guide_file, data, pdf_path, published_on): label
+                for pdf_path, (label, data) in jobs.items()
+            }
+            for future in as_completed(futures):
+                label = futures[future]
+                try:
+                    rendered[label] = future.result()
+                except Exception as e:
+                    logger.error(f"Batch render failed for {label}: {e}", exc_info=True)
+
+        elapsed = time.monotonic() - started
+        logger.info(f"Batch rendered {len(rendered)}/{len(jobs)} guides in {elapsed:.1f}s "
+                    f"({len(rendered) / elapsed if elapsed else 0:.2f} guides/s)")
+        return rendered
 
     def execute_daily_run(self):
         """
@@ -434,37 +720,51 @@ Ensure that:
         bot = TelegramBot()
         
         try:
-            # 1. Search internet for current topics/trends
-            search_context = self.search_market_trends(role_name)
-            
-            # 2. Query Gemini for interview prep material
-            data = self.generate_questions_json(role_name, search_context)
+            prefetched = self.load_prefetched(role_name)
+            if prefetched:
+                logger.info(f"Using prefetched interview guide for {role_name}")
+                data = prefetched['data']
+            else:
+                # 1-2. Search trends and query Gemini for whatever the question bank can't supply
+                with run_report.stage('compose'):
+                    data = self.compose_guide(role_name)
+                self.log_search_cache_stats()
+                # Kept until delivered, so a failed send is retried without another Gemini call
+                save_prefetched_guide(role_name, json.dumps(data), None, date.today().isoformat())
             
-            # 3. Create PDF
-            filename = f"{role_name.replace(' ', '_')}_Interview_Questions.pdf"
-            pdf_path = os.path.abspath(filename)
-            self.build_pdf(data, pdf_path)
+            # 3. Send the prefetched PDF as is when it was rendered for today; otherwise create it
+            # (reused from the artifact store when this guide was already rendered today)
+            pdf_path = prefetched and prefetched['pdf_path']
+            if pdf_path and prefetched['publish_date'] == date.today().isoformat() and os.path.exists(pdf_path):
+                run_report.incr('prefetched_pdf_hits')
+                with open(pdf_path, 'rb') as f:
+                    pdf_bytes = f.read()
+            else:
+                pdf_path, pdf_bytes = self.render_guide(data)
+            pdf_name = os.path.basename(pdf_path)
             
             # 4. Upload/Send PDF via Telegram Channel
             telegram_caption = f"📚 *Daily Interview Preparation Guide*\n\nRole: *{role_name}*\n\nHere is a comprehensive PDF guide covering the latest interview questions, code snippets, architectural solutions, and behavioral patterns for the *{role_name}* role as per current 2026 market expectations.\n\nEnjoy preparing! 🚀\n#InterviewPrep #{role_name.replace(' ', '')}"
-            bot.send_document(pdf_path, caption=telegram_caption)
+            with run_report.stage('send.telegram'):
+                telegram_sent = bot.send_document(pdf_bytes, caption=telegram_caption, filename=pdf_name)
             
             # 5. Upload/Send PDF via WhatsApp Channel
             # First send text notification
             wa_text = f"📚 *Daily Interview Preparation Guide*\n\nRole: *{role_name}*\n\nFind attached the compiled PDF guide with the latest interview questions and answers as per current market trends."
-            send_whatsapp_message(wa_text)
-            
-            # Then send PDF document
-            send_whatsapp_file(pdf_path)
+            with run_report.stage('send.whatsapp'):
+                send_whatsapp_message(wa_text)
+                
+                # Then send PDF document
+                whatsapp_sent = send_whatsapp_file(pdf_bytes, filename=pdf_name)
+            if not telegram_sent and not whatsapp_sent:
+                # Role is not advanced; the stored guide and PDF make the retry instant
+                raise RuntimeError("guide could not be delivered on any channel")
             
             # 6. Advance index to next role on success
             self.advance_role_index(role_idx)
+            set_state("interview_last_published", date.today().isoformat())
+            delete_prefetched_guide(role_name)
             
-            # Clean up local PDF file
-            if os.path.exists(pdf_path):
-                os.remove(pdf_path)
-                logger.info(f"Cleaned up local PDF file at {pdf_path}")
-                
             logger.info("Daily Interview Prep Agent completed successfully.")
             return True
             
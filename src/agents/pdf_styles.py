@@ -0,0 +1,128 @@
+from functools import lru_cache
+from types import MappingProxyType
+
+from reportlab.lib import colors
+from reportlab.lib.styles import ParagraphStyle
+
+
+class FrozenParagraphStyle(ParagraphStyle):
+    """
+    ParagraphStyle that rejects attribute changes once built, so the shared
+    registry cannot be mutated by one render and leak into the next.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__dict__['_frozen'] = True
+
+    def __setattr__(self, key, value):
+        if self.__dict__.get('_frozen'):
+            raise AttributeError(f"Style '{self.name}' is read-only")
+        super().__setattr__(key, value)
+
+
+@lru_cache(maxsize=None)
+def get_styles():
+    """
+    Returns the interview guide styles, built once per process as a read-only mapping.
+    """
+    body = FrozenParagraphStyle(
+        name='Body',
+        fontName='Helvetica',
+        fontSize=10,
+        leading=14,
+        textColor=colors.HexColor('#1F2937') # Charcoal
+    )
+
+    styles = {
+        'body': body,
+        'kicker': FrozenParagraphStyle(
+            name='TopKicker',
+            fontName='Helvetica-Bold',
+            fontSize=9,
+            textColor=colors.HexColor('#3B82F6'),
+            spaceAfter=4
+        ),
+        'title': FrozenParagraphStyle(
+            name='DocTitle',
+            fontName='Helvetica-Bold',
+            fontSize=24,
+            leading=28,
+            textColor=colors.HexColor('#1E3A8A'),
+            spaceAfter=8
+        ),
+        'subtitle': FrozenParagraphStyle(
+            name='DocSubtitle',
+            fontName='Helvetica',
+            fontSize=12,
+            leading=16,
+            textColor=colors.HexColor('#4B5563'),
+            spaceAfter=12
+        ),
+        'meta': FrozenParagraphStyle(
+            name='DocMeta',
+            fontName='Helvetica-Oblique',
+            fontSize=9,
+            leading=12,
+            textColor=colors.HexColor('#6B7280'),
+            spaceAfter=20
+        ),
+        'section': FrozenParagraphStyle(
+            name='SecH',
+            fontName='Helvetica-Bold',
+            fontSize=14,
+            textColor=colors.HexColor('#1E3A8A'),
+            spaceBefore=10,
+            spaceAfter=8,
+            keepWithNext=True
+        ),
+        'intro': FrozenParagraphStyle(
+            name='IntroText',
+            parent=body,
+            fontSize=10.5,
+            leading=15,
+            textColor=colors.HexColor('#374151')
+        ),
+        'question': FrozenParagraphStyle(
+            name='QuestionTitle',
+            fontName='Helvetica-Bold',
+            fontSize=12,
+            leading=16,
+            textColor=colors.HexColor('#1E3A8A'),
+            spaceBefore=14,
+            spaceAfter=6,
+            keepWithNext=True
+        ),
+        'subheading': FrozenParagraphStyle(
+            name='BlockSubheading',
+            fontName='Helvetica-Bold',
+            fontSize=10,
+            leading=14,
+            textColor=colors.HexColor('#111827'),
+            spaceBefore=8,
+            spaceAfter=4,
+            keepWithNext=True
+        ),
+        'code': FrozenParagraphStyle(
+            name='CodeBlock',
+            fontName='Courier',
+            fontSize=8,
+            leading=10,
+            textColor=colors.HexColor('#0F172A'),
+            backColor=colors.HexColor('#F8FAFC'),
+            borderColor=colors.HexColor('#E2E8F0'),
+            borderWidth=0.5,
+            borderPadding=8,
+            spaceBefore=6,
+            spaceAfter=6
+        ),
+        'bullet': FrozenParagraphStyle(
+            name='BulletItem',
+            parent=body,
+            leftIndent=15,
+            firstLineIndent=-10,
+            spaceBefore=3,
+            spaceAfter=3
+        ),
+    }
+    return MappingProxyType(styles)
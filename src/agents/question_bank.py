@@ -0,0 +1,89 @@
+import re
+import json
+import time
+import hashlib
+import logging
+
+from src.utils.config import QUESTION_BANK_COOLDOWN_DAYS, QUESTION_BANK_SIMILARITY_THRESHOLD
+from src.utils.db import (
+    add_bank_question, find_similar_bank_questions, get_bank_questions, mark_bank_questions_used
+)
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 3
+WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+def question_shingles(text):
+    """
+    Hashed word 3-shingles of a question, used as its similarity fingerprint.
+    Hashes are signed 64-bit so they fit SQLite INTEGER columns.
+    """
+    words = WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        grams = [" ".join(words)] if words else []
+    else:
+        grams = [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    return sorted({
+        int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+        for g in grams
+    })
+
+def find_repeat(role, shingles):
+    """
+    Returns the id of the most similar bank question if its Jaccard similarity
+    reaches QUESTION_BANK_SIMILARITY_THRESHOLD, else None.
+    """
+    best_id, best_score = None, 0.0
+    for question_id, shared, count in find_similar_bank_questions(role, shingles):
+        score = shared / float(len(shingles) + count - shared)
+        if score > best_score:
+            best_id, best_score = question_id, score
+    return best_id if best_score >= QUESTION_BANK_SIMILARITY_THRESHOLD else None
+
+def add_questions(role, questions):
+    """
+    Stores freshly generated questions, skipping near-duplicates of ones already banked.
+    Returns the ids of the added questions.
+    """
+    added = []
+    for q in questions:
+        shingles = question_shingles(q.get('question', ''))
+        if not shingles:
+            continue
+        if find_repeat(role, shingles) is not None:
+            logger.info(f"Question bank: skipping repeat for {role}: {q.get('question', '')[:80]}")
+            continue
+        payload = {k: v for k, v in q.items() if k != 'id'}
+        question_id = add_bank_question(role, q.get('category', ''), q.get('question', ''), json.dumps(payload), shingles)
+        if question_id:
+            added.append(question_id)
+    return added
+
+def select_questions(role, count):
+    """
+    Picks up to `count` banked questions for a role, least recently used first and
+    rotating across categories, skipping anything used within the cooldown window.
+    Returns (question_ids, questions).
+    """
+    if count <= 0:
+        return [], []
+    unused_since = time.time() - QUESTION_BANK_COOLDOWN_DAYS * 86400
+    by_category = {}
+    for question_id, category, payload in get_bank_questions(role, unused_since):
+        by_category.setdefault(category, []).append((question_id, payload))
+
+    chosen = []
+    # Round-robin over categories (each already in LRU order) keeps the guide varied
+    while len(chosen) < count and any(by_category.values()):
+        for category in list(by_category):
+            if by_category[category] and len(chosen) < count:
+                chosen.append(by_category[category].pop(0))
+
+    ids = [question_id for question_id, _ in chosen]
+    questions = [json.loads(payload) for _, payload in chosen]
+    return ids, questions
+
+def mark_used(question_ids):
+    if question_ids:
+        mark_bank_questions_used(question_ids)
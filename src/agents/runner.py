@@ -0,0 +1,123 @@
+import logging
+import multiprocessing
+from datetime import datetime, timezone
+
+from src.utils.db import set_state
+from src.utils.locks import job_lock
+from src.utils import run_report, profiling
+
+logger = logging.getLogger(__name__)
+
+def _record_status(status, error=None):
+    now = datetime.now(timezone.utc).isoformat()
+    set_state("interview_agent_status", status)
+    if status == "running":
+        set_state("interview_agent_started_at", now)
+    else:
+        set_state("interview_agent_finished_at", now)
+    if status in ("succeeded", "failed"):
+        set_state("interview_agent_last_error", error or "")
+
+def run_interview_agent():
+    """
+    Runs the interview prep agent under its own lock, recording progress in agent_state.
+    Returns True on success.
+    """
+    # Imported here so the worker process only pays for ReportLab/SerpApi when it runs
+    from src.agents.interview_agent import InterviewPrepAgent
+
+    with job_lock("interview agent") as acquired:
+        if not acquired:
+            return False
+        _record_status("running")
+        with run_report.start_run("interview_agent") as report:
+            try:
+                logger.info("Triggering Daily Interview Preparation Agent...")
+                ok = InterviewPrepAgent().execute_daily_run()
+                _record_status("succeeded" if ok else "failed", None if ok else "execute_daily_run reported failure")
+            except Exception as e:
+                logger.error(f"Failed to run Daily Interview Prep Agent: {e}", exc_info=True)
+                _record_status("failed", str(e))
+                report.error = str(e)
+                ok = False
+            if not ok:
+                report.status = "failed"
+                report.error = report.error or "execute_daily_run reported failure"
+            return ok
+
+def run_interview_prefetch():
+    """
+    Builds upcoming guides ahead of time. Shares the agent's lock so a prefetch
+    never generates the same role as a concurrent daily run.
+    """
+    from src.agents.interview_agent import InterviewPrepAgent
+
+    with job_lock("interview agent") as acquired:
+        if not acquired:
+            return 0
+        with run_report.start_run("interview_prefetch") as report:
+            try:
+                built = InterviewPrepAgent().prefetch_upcoming()
+                report.counters['guides_prefetched'] += built
+                return built
+            except Exception as e:
+                logger.error(f"Interview guide prefetch failed: {e}", exc_info=True)
+                report.status = "failed"
+                report.error = str(e)
+                return 0
+
+def _configure_worker_logging():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+def _agent_worker_entry():
+    _configure_worker_logging()
+    profiling.enable_from_env("interview_agent")
+    try:
+        # Use the idle time after publishing to prepare the next guide
+        if run_interview_agent():
+            run_interview_prefetch()
+    finally:
+        profiling.finish()
+
+def _prefetch_worker_entry():
+    _configure_worker_logging()
+    profiling.enable_from_env("interview_prefetch")
+    try:
+        run_interview_prefetch()
+    finally:
+        profiling.finish()
+
+def _start_worker(target, name):
+    # spawn rather than fork: the scheduler process has live threads and open sockets
+    ctx = multiprocessing.get_context("spawn")
+    process = ctx.Process(target=target, name=name, daemon=False)
+    process.start()
+    logger.info(f"Started {name} in worker process {process.pid}")
+    return process
+
+def _join_worker(process):
+    process.join()
+    if process.exitcode:
+        logger.error(f"{process.name} worker exited with code {process.exitcode}")
+
+def start_interview_agent_process():
+    """
+    Starts the agent in a separate worker process and returns the Process handle,
+    so its Gemini call and PDF rendering run alongside the scrape/deliver cycle.
+    """
+    return _start_worker(_agent_worker_entry, "interview-agent")
+
+def run_interview_agent_process():
+    """
+    Scheduler entry point: runs the agent in a worker process and waits for it.
+    """
+    _join_worker(start_interview_agent_process())
+
+def run_interview_prefetch_process():
+    """
+    Scheduler entry point: prefetches upcoming guides in a worker process.
+    """
+    _join_worker(_start_worker(_prefetch_worker_entry, "interview-prefetch"))
@@ -0,0 +1,123 @@
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+def iter_sse_text(response):
+    """
+    Yields the text chunks of a Gemini streamGenerateContent (alt=sse) response as they arrive.
+    """
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith("data:"):
+            continue
+        payload = line[len("data:"):].strip()
+        if not payload:
+            continue
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Skipping malformed stream event: {payload[:200]}")
+            continue
+        for candidate in event.get('candidates', []):
+            for part in candidate.get('content', {}).get('parts', []):
+                text = part.get('text')
+                if text:
+                    yield text
+
+
+class QuestionStreamParser:
+    """
+    Incrementally parses a guide JSON document while it is still being streamed.
+
+    Feed raw text chunks with feed(); every question object inside the top-level
+    "questions" array is returned as soon as its closing brace arrives, and the
+    "introduction" string is captured once complete. Only the unscanned tail of
+    the buffer is examined on each call.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.introduction = None
+        self._pos = 0                # next index of self.buffer to scan
+        self._in_array = False       # inside the "questions" array
+        self._depth = 0              # object depth relative to the array
+        self._in_string = False
+        self._escaped = False
+        self._object_start = None
+        self._array_closed = False
+
+    def feed(self, text):
+        self.buffer += text
+        if self.introduction is None:
+            self._try_parse_introduction()
+        if self._array_closed or (not self._in_array and not self._find_questions_array()):
+            return []
+        return self._scan_objects()
+
+    def _try_parse_introduction(self):
+        key = self.buffer.find('"introduction"')
+        if key == -1:
+            return
+        colon = self.buffer.find(':', key)
+        if colon == -1:
+            return
+        start = self.buffer.find('"', colon + 1)
+        if start == -1:
+            return
+        escaped = False
+        for i in range(start + 1, len(self.buffer)):
+            ch = self.buffer[i]
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                try:
+                    self.introduction = json.loads(self.buffer[start:i + 1])
+                except ValueError:
+                    pass
+                return
+
+    def _find_questions_array(self):
+        key = self.buffer.find('"questions"')
+        if key == -1:
+            return False
+        bracket = self.buffer.find('[', key)
+        if bracket == -1:
+            return False
+        self._in_array = True
+        self._pos = bracket + 1
+        return True
+
+    def _scan_objects(self):
+        completed = []
+        buf = self.buffer
+        for i in range(self._pos, len(buf)):
+            ch = buf[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == '\\':
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+            if ch == '"':
+                self._in_string = True
+            elif ch == ']' and self._depth == 0:
+                self._array_closed = True
+                break
+            elif ch == '{':
+                if self._depth == 0:
+                    self._object_start = i
+                self._depth += 1
+            elif ch == '}':
+                self._depth -= 1
+                if self._depth == 0 and self._object_start is not None:
+                    try:
+                        completed.append(json.loads(buf[self._object_start:i + 1]))
+                    except ValueError as e:
+                        logger.warning(f"Skipping unparseable streamed question: {e}")
+                    self._object_start = None
+        self._pos = len(buf)
+        return completed
@@ -3,19 +3,35 @@ import logging
 import pytz
 import os
 import sys
-import fcntl
+import time
 import asyncio
+from itertools import chain
 from datetime import datetime, timezone
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from src.utils.config import (
     TELEGRAM_BOT_TOKEN, TELEGRAM_CHANNEL_ID, TELEGRAM_ADMIN_CHAT_ID,
     TARGET_LOCATIONS, ROLES, SCRAPER_DELAY_SECONDS,
-    RUN_TIME_UTC, LOG_LEVEL
+    RUN_TIME_UTC, LOG_LEVEL, DIGEST_MODE, MAX_JOBS_PER_RUN,
+    SOURCE_INTERVALS_MINUTES, DEFAULT_SOURCE_INTERVAL_MINUTES, DELIVERY_INTERVAL_MINUTES,
+    PREFETCH_INTERVAL_HOURS
 )
 from src.utils.telegram_bot import TelegramBot
-from src.utils.db import init_db, is_job_posted, mark_job_posted
+from src.utils.db import (
+    init_db, mark_jobs_posted,
+    queue_pending_jobs, iter_pending_jobs, clear_pending_jobs,
+    queue_digest_jobs, get_digest_jobs, clear_digest_jobs
+)
+from src.utils.digest_format import (
+    format_job_entry, format_job_entry_wa, format_footer
+)
+from src.utils.incremental_digest import publish_incremental_digest
+from src.utils.locks import job_lock
+from src.utils import run_report
+from src import pipeline
+from src.pipeline import is_india_role, sort_key_display
 
 # Import scrapers
 from src.scrapers.remoteok import RemoteOKScraper
@@ -24,8 +40,15 @@ from src.scrapers.remotive import RemotiveScraper
 from src.scrapers.workingnomads import WorkingNomadsScraper
 from src.scrapers.google_jobs import GoogleJobsScraper
 # Add more scrapers here when implemented
-from src.agents.interview_agent import InterviewPrepAgent
+from src.agents.runner import run_interview_agent_process, run_interview_prefetch_process
 
+SCRAPER_CLASSES = [
+    RemoteOKScraper,
+    WeWorkRemotelyScraper,
+    RemotiveScraper,
+    WorkingNomadsScraper,
+    GoogleJobsScraper
+]
 
 # Setup logging
 logging.basicConfig(
@@ -33,361 +56,230 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
-def get_posted_time_str(posted_dt):
+def scrape_source(scraper):
     """
-    Returns relative string like '5 hours ago'
+    Scrapes a single source and queues its not-yet-posted jobs for the next delivery.
+    Returns the number of jobs the source returned.
     """
-    if not posted_dt:
-        return "recently"
-    # Ensure timezone aware
-    if posted_dt.tzinfo is None:
-        posted_dt = posted_dt.replace(tzinfo=timezone.utc)
-    
-    diff = datetime.now(timezone.utc) - posted_dt
-    hours = int(diff.total_seconds() // 3600)
-    if hours < 1:
-        minutes = int(diff.total_seconds() // 60)
-        return f"{minutes} mins ago" if minutes > 0 else "Just now"
-    elif hours < 24:
-        return f"{hours} hours ago"
-    else:
-        days = int(diff.total_seconds() // 86400)
-        return f"{days} days ago"
-
-def run_job_scraping():
-    # Lock file logic
-    lock_file = '/tmp/job_scraper.lock'
-    lock_fd = open(lock_file, 'w')
-    try:
-        fcntl.lockf(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
-    except IOError:
-        logging.warning("Another instance is already running. Exiting.")
-        return
-
-    try:
-        logging.info("Starting scheduled scrape job...")
-        
-        bot = TelegramBot()
-        
-        # 1. Scrape
-        scrapers = [
-            RemoteOKScraper(),
-            WeWorkRemotelyScraper(),
-            RemotiveScraper(),
-            WorkingNomadsScraper(),
-            GoogleJobsScraper()
-        ]
-        
-        all_jobs = []
-        
-        import time
-        for scraper in scrapers:
+    with job_lock(f"scrape {scraper.name}") as acquired:
+        if not acquired:
+            return 0
+        with run_report.start_run("scrape"):
+            started = time.perf_counter()
+            fetch_before = run_report.stage_seconds(f"fetch.{scraper.name}")
             try:
-                jobs = scraper.scrape()
-                all_jobs.extend(jobs)
-                time.sleep(SCRAPER_DELAY_SECONDS)
+                with run_report.stage(f"scrape.{scraper.name}"):
+                    jobs = scraper.scrape()
             except Exception as e:
                 logging.error(f"Scraper failed: {scraper.name} - {e}")
+                run_report.incr(f"scraper_errors.{scraper.name}")
+                return 0
+            finally:
+                # Whatever the scrape spent outside its HTTP requests is parsing
+                fetch_time = run_report.stage_seconds(f"fetch.{scraper.name}") - fetch_before
+                run_report.add_stage_time(f"parse.{scraper.name}", time.perf_counter() - started - fetch_time)
+
+            with run_report.stage("dedup"):
+                new_jobs = list(pipeline.dedup(pipeline.normalize(jobs)))
+                queue_pending_jobs(new_jobs)
+            run_report.incr(f"items_seen.{scraper.name}", len(jobs))
+            run_report.incr(f"items_kept.{scraper.name}", len(new_jobs))
+            logging.info(f"Queued {len(new_jobs)} of {len(jobs)} jobs from {scraper.name}")
+            return len(jobs)
+
+def deliver_pending_jobs():
+    """
+    Curates and sends everything queued by the scrape jobs since the last delivery.
+    """
+    with job_lock("delivery") as acquired:
+        if not acquired:
+            return
+        with run_report.start_run("delivery"):
+            pending = iter_pending_jobs()
+            first = next(pending, None)
+            if first is None:
+                logging.info("No pending jobs to deliver.")
+                return
+
+            # Jobs stream out of the queue; only their keys are kept, to clear them afterwards
+            streamed_keys = []
+            def tracked():
+                for job in chain([first], pending):
+                    streamed_keys.append(job.key)
+                    yield job
+            # If delivery raises, nothing is cleared and the queue is kept for the next run
+            undelivered = {job.key for job in deliver_jobs(TelegramBot(), tracked())}
+            # Jobs whose digest part failed to send stay queued. Jobs curated out (already posted,
+            # over the company or run cap, neither India nor remote) are dropped, as the daily
+            # digest always did: they are not marked posted, so a source still listing one queues it again.
+            clear_pending_jobs([key for key in streamed_keys if key not in undelivered])
 
-        if not all_jobs:
+def run_job_scraping():
+    """
+    One-off scrape/deliver cycle over every source. The interview agent is not
+    part of this cycle; see src.agents.runner.
+    """
+    logging.info("Starting scheduled scrape job...")
+    started = time.monotonic()
+
+    with run_report.start_run("scrape"):
+        found = 0
+        for scraper_cls in SCRAPER_CLASSES:
+            found += scrape_source(scraper_cls())
+            time.sleep(SCRAPER_DELAY_SECONDS)
+
+        if not found:
             logging.warning("No jobs found from any scraper.")
-            bot.send_admin_alert("No jobs found today! Check scrapers.")
-            return
+            TelegramBot().send_admin_alert("No jobs found today! Check scrapers.")
 
-        # 2. Deduplicate and Filter
-        unique_jobs = []
-        seen_ids = set()
-        
-        for job in all_jobs:
-            if is_job_posted(job['id']):
-                continue
-            if job['id'] in seen_ids:
-                continue
-            
-            # Simple keyword filtering if scraper didn't catch it
-            # (Though scrapers should handle filtering)
-            
-            seen_ids.add(job['id'])
-            unique_jobs.append(job)
-
-        if not unique_jobs:
-            logging.info("No new unique jobs found.")
-            return
+    # Outside the scrape run, so the delivery is reported as its own "delivery" run
+    deliver_pending_jobs()
+    if DIGEST_MODE == 'incremental':
+        # No scheduler runs the daily WhatsApp digest for a one-off cycle, so it goes out now
+        send_daily_whatsapp_digest()
+    logging.info(f"Scrape/deliver cycle finished in {time.monotonic() - started:.1f}s")
+
+def dedup_jobs(all_jobs):
+    """
+    Drops jobs that were already posted or appear twice in the batch.
+    """
+    return list(pipeline.dedup(all_jobs))
+
+def curate_jobs(unique_jobs, limit=MAX_JOBS_PER_RUN):
+    """
+    Keeps India and remote jobs, capped per company and to `limit`, in display order.
+    """
+    return pipeline.cap(pipeline.classify(unique_jobs), limit=limit)
+
+def build_digest_messages(header, footer, display_remote, display_india, format_entry):
+    """
+    Splits the digest into messages under MESSAGE_SAFE_LENGTH, one section per region.
+    """
+    return list(pipeline.render(header, footer, display_remote, display_india, format_entry))
+
+def split_sections(jobs):
+    """
+    (remote, india) jobs for the digest's two sections, in the order given.
+    """
+    display_india = [j for j in jobs if is_india_role(j)]
+    display_remote = [j for j in jobs if not is_india_role(j)] # Remaining are remote
+    return display_remote, display_india
+
+def send_telegram_digest(bot, header, footer, display_remote, display_india):
+    """
+    Sends the digest and returns the jobs it delivered. Sending stops at the first part
+    that fails, so the jobs of that part and the ones after it are left out.
+    """
+    if DIGEST_MODE == 'incremental':
+        # Append to today's digest message(s) in place instead of posting a new digest.
+        # Parts that fail to send are kept in the digest state and retried by the next run.
+        publish_incremental_digest(bot, header, display_remote, display_india)
+        return display_remote + display_india
+
+    # 6. Send All Messages
+    with run_report.stage("render"):
+        parts = list(pipeline.render_parts(header, footer, display_remote, display_india, format_job_entry))
+    delivered = []
+    for i, (msg, part_jobs) in enumerate(parts):
+        response = bot.send_message(msg)
+        if not (response and response.get('ok')):
+            logging.error(f"Failed to send message part {i + 1}/{len(parts)}: {response}")
+            break
+        delivered.extend(part_jobs)
+        time.sleep(1) # Rate limit
+    return delivered
+
+def send_whatsapp_digest(header, footer, display_remote, display_india):
+    """
+    Sends the digest to WhatsApp; returns whether every message went out.
+    """
+    from src.utils.whatsapp_bot import send_whatsapp_message
 
-        # 3. Curation Logic (Cap at 30, Remote vs India balance)
-        
-        # Sort by posted time (most recent first) for trimming
-        # Assuming 'posted_dt' is available in job dict (datetime object)
-        # If not, we fall back to index/scrape order
-        
-        # We need to ensure scrapers return 'posted_dt'
-        # For now, let's assume they might not, and rely on scrape order (which is usually recent first)
-        # But let's try to add a 'created_at' timestamp if possible
-        
-        # unique_jobs.sort(key=lambda x: x.get('posted_dt', datetime.min).timestamp(), reverse=True)
-        # Fix datetime.min timestamp issue
-        unique_jobs.sort(key=lambda x: x.get('posted_dt', datetime(1970, 1, 1).replace(tzinfo=timezone.utc)).timestamp(), reverse=True)
-        
-        
-        # Logic to split candidates
-        def is_india_role(job):
-            loc = job['location'].lower()
-            return "india" in loc or any(city in loc for city in ["bangalore", "bengaluru", "hyderabad", "mumbai", "chennai", "delhi", "pune", "guegaon", "noida"])
-
-        india_candidates = [j for j in unique_jobs if is_india_role(j)]
-        remote_candidates = [j for j in unique_jobs if not is_india_role(j) and "remote" in j['location'].lower()]
-
-
-        # Since limits are removed, we just take all unique_jobs
-        # But we still sort/split for display purposes
-        
-        # Combine everything (no capping logic needed anymore)
-        all_candidates = india_candidates + remote_candidates
-        
-        # Priority and Company Capping Logic
-        # 1. Sort by Priority (Developer > Others)
-        def get_priority_score(job):
-            role = job['role'].lower()
-            if any(k in role for k in ["developer", "software engineer", "sde", "backend", "frontend", "full stack"]):
-                return 0 # High priority
-            return 1 # Lower priority
-            
-        all_candidates.sort(key=lambda x: (get_priority_score(x), x.get('company')))
-
-        # 2. Cap per company (Max 5)
-        company_counts = {}
-        final_jobs = []
-        for job in all_candidates:
-            company = job['company']
-            count = company_counts.get(company, 0)
-            if count >= 5:
-                continue
-            company_counts[company] = count + 1
-            final_jobs.append(job)
-        
-        # Mark as posted
-        for job in final_jobs:
-            mark_job_posted(job['id'], job['url'])
-
-        # 4. Final Sort for Display
-        # Remote First -> India Metro -> Role Type -> Company Name
-        def sort_key_display(job):
-            is_remote = "remote" in job['location'].lower()
-            is_india = "india" in job['location'].lower() or any(c in job['location'].lower() for c in ["bangalore","delhi","mumbai","chennai","pune","hyderabad","gurgaon","noida"])
-            return (
-                0 if is_remote else 1,
-                0 if is_india else 1,
-                job['role'],
-                job['company']
-            )
-        
-        final_jobs.sort(key=sort_key_display)
-
-        # 5. Format Output
-        display_india = [j for j in final_jobs if is_india_role(j)]
-        display_remote = [j for j in final_jobs if j not in display_india] # Remaining are remote
-        
-        date_str = datetime.now().strftime("%d %b %Y")
-        
-        # Build Messages (Multi-part)
+    with run_report.stage("render"):
+        messages = build_digest_messages(header, footer, display_remote, display_india, format_job_entry_wa)
+    ok = True
+    for msg in messages:
+        ok = send_whatsapp_message(msg) and ok
+        time.sleep(1) 
+    return ok
+
+def deliver_jobs(bot, jobs):
+    """
+    Streams scraped jobs (any iterable) through dedup and curation and sends the
+    resulting digest to Telegram and WhatsApp. Jobs are marked posted once Telegram
+    has them; returns the curated jobs that could not be sent.
+    """
+    # 2-4. Deduplicate, filter, then curate (priority, recency, company cap) into display order
+    with run_report.stage("curate"):
+        final_jobs = pipeline.curate(jobs)
+
+    if not final_jobs:
+        logging.info("No new unique jobs found.")
+        return []
+
+    # 5. Format Output
+    display_remote, display_india = split_sections(final_jobs)
+    
+    date_str = datetime.now().strftime("%d %b %Y")
+    footer = format_footer(len(display_remote), len(display_india))
+    if DIGEST_MODE == 'incremental':
+        header = f"🆕 *New Tech Jobs by VJ — {date_str}*\n\n"
+    else:
         header = f"🚀 *Daily Tech Jobs Digest by VJ — {date_str}*\n\n"
-        footer = f"\n🌍 {len(display_remote)} Remote | 🇮🇳 {len(display_india)} India | Total: {len(final_jobs)} jobs"
-
-        
-        messages = []
-        current_message = header
-        
-        def format_job_entry(job):
-            # Truncate title
-            title = job['role']
-            if len(title) > 60:
-                title = title[:57] + "..."
-            
-            flag = "🌍" if "remote" in job['location'].lower() else "🇮🇳" # Or use job.get('flag')
-            
-            # Calculate posted time string
-            posted_str = get_posted_time_str(job.get('posted_dt'))
-            
-            # Basic salary if missing
-            salary = job.get('salary', 'Not disclosed')
-            if not salary: salary = 'Not disclosed'
-
-            msg_parts = [
-                f"*{title}*",
-                f"🏢 {job['company']}",
-                f"{flag} {job['location']}"
-            ]
-            
-            if posted_str != "recently":
-                msg_parts.append(f"🕐 {posted_str}")
-                
-            if salary != "Not disclosed":
-                msg_parts.append(f"💰 {salary}")
-                
-            msg_parts.append(f"🔗 [Apply Now]({job['url']})")
-            
-            if job['source'] != "Google Jobs":
-                msg_parts.append(f"🏷️ {job['source']}")
-
-            return "\n".join(msg_parts) + "\n\n"
-
-        def add_text_to_messages(new_text, section_title=None, is_footer=False, is_job=False):
-            nonlocal current_message, messages
-            
-            # If section title provided
-            if section_title:
-                text_to_add = section_title
-            else:
-                text_to_add = new_text
-
-            # Check length safety (Telegram limit ~4096)
-            if len(current_message) + len(text_to_add) > 3800:
-                messages.append(current_message)
-                if is_footer:
-                     # Footer should be on new message if doesn't fit
-                     current_message = text_to_add
-                elif section_title:
-                     # New section starts on new message
-                     current_message = text_to_add
-                elif is_job:
-                     # Continuation header for job liist
-                     current_message = f"*(Continuation)*\n\n{text_to_add}"
-                else:
-                     current_message = text_to_add
-            else:
-                current_message += text_to_add
-
-        if display_remote:
-            add_text_to_messages("", section_title="🌍 *REMOTE ROLES*\n──────────────\n")
-            for job in display_remote:
-                add_text_to_messages(format_job_entry(job), is_job=True)
-
-        if display_india:
-            # Separator if needed
-            if display_remote:
-                add_text_to_messages("\n")
-            
-            add_text_to_messages("", section_title="🇮🇳 *INDIA ROLES*\n──────────────\n")
-            for job in display_india:
-                add_text_to_messages(format_job_entry(job), is_job=True)
-
-        # Add footer
-        add_text_to_messages(footer, is_footer=True)
-        
-        # Append final message
-        if current_message:
-            messages.append(current_message)
-        
-        # 6. Send All Messages
-        for msg in messages:
-            response = bot.send_message(msg)
-            if not (response and response.get('ok')):
-                 logging.error(f"Failed to send message part: {response}")
-            import time
-            time.sleep(1) # Rate limit
-
-        logging.info("Job scrape cycle completed successfully.")
-
-        # 7. WhatsApp Logic
-        from src.utils.whatsapp_bot import send_whatsapp_message
-        
-        wa_messages = []
-        wa_current_message = header 
-        
-        def format_job_entry_wa(job):
-            # Truncate title
-            title = job['role']
-            if len(title) > 60:
-                title = title[:57] + "..."
-            
-            flag = "🌍" if "remote" in job['location'].lower() else "🇮🇳"
-            
-            # Calculate posted time string
-            posted_str = get_posted_time_str(job.get('posted_dt'))
-            
-            # Basic salary if missing
-            salary = job.get('salary', 'Not disclosed')
-            if not salary: salary = 'Not disclosed'
-
-            msg_parts = [
-                f"*{title}*",
-                f"🏢 {job['company']}",
-                f"{flag} {job['location']}"
-            ]
-            
-            if posted_str != "recently":
-                msg_parts.append(f"🕐 {posted_str}")
-                
-            if salary != "Not disclosed":
-                msg_parts.append(f"💰 {salary}")
-                
-            msg_parts.append(f"🔗 Apply: {job['url']}")
-            
-            if job['source'] != "Google Jobs":
-                msg_parts.append(f"🏷️ {job['source']}")
-
-            return "\n".join(msg_parts) + "\n\n"
-
-        def add_text_wa(new_text, section_title=None, is_footer=False, is_job=False):
-            nonlocal wa_current_message, wa_messages
-            
-            if section_title:
-                text_to_add = section_title
-            else:
-                text_to_add = new_text
-
-            # WhatsApp limit ~4000
-            if len(wa_current_message) + len(text_to_add) > 3800:
-                wa_messages.append(wa_current_message)
-                if is_footer:
-                     wa_current_message = text_to_add
-                elif section_title:
-                     wa_current_message = text_to_add
-                elif is_job:
-                     wa_current_message = f"*(Continuation)*\n\n{text_to_add}"
-                else:
-                     wa_current_message = text_to_add
-            else:
-                wa_current_message += text_to_add
-
-        if display_remote:
-            add_text_wa("", section_title="🌍 *REMOTE ROLES*\n──────────────\n")
-            for job in display_remote:
-                add_text_wa(format_job_entry_wa(job), is_job=True)
-
-        if display_india:
-            if display_remote:
-                add_text_wa("\n")
-            
-            add_text_wa("", section_title="🇮🇳 *INDIA ROLES*\n──────────────\n")
-            for job in display_india:
-                add_text_wa(format_job_entry_wa(job), is_job=True)
-
-        # Add footer
-        add_text_wa(footer, is_footer=True)
-        
-        # Append final message
-        if wa_current_message:
-            wa_messages.append(wa_current_message)
-        
-        # Send All WhatsApp Messages
-        for msg in wa_messages:
-            send_whatsapp_message(msg)
-            time.sleep(1) 
-
-        logging.info("WhatsApp delivery cycle completed.")
-
-        # Trigger Daily Interview Prep Agent
-        try:
-            logging.info("Triggering Daily Interview Preparation Agent...")
-            agent = InterviewPrepAgent()
-            agent.execute_daily_run()
-        except Exception as e:
-            logging.error(f"Failed to run Daily Interview Prep Agent: {e}", exc_info=True)
-
-    finally:
-        fcntl.lockf(lock_fd, fcntl.LOCK_UN)
-        lock_fd.close()
+
+    with run_report.stage("send.telegram"):
+        delivered = send_telegram_digest(bot, header, footer, display_remote, display_india)
+    delivered_keys = {job.key for job in delivered}
+    undelivered = [job for job in final_jobs if job.key not in delivered_keys]
+    if undelivered:
+        logging.warning(f"{len(undelivered)} of {len(final_jobs)} jobs were not sent; keeping them for the next delivery")
+    if not delivered:
+        return undelivered
+
+    # Mark as posted
+    mark_jobs_posted(delivered)
+    run_report.incr("jobs_delivered", len(delivered))
+    logging.info("Job scrape cycle completed successfully.")
+
+    # 7. WhatsApp Logic: its messages can't be edited in place, so in incremental mode
+    # the jobs wait for one daily WhatsApp digest instead of a full digest per delivery
+    if DIGEST_MODE == 'incremental':
+        queue_digest_jobs('whatsapp', delivered)
+        return undelivered
+    if undelivered:
+        # WhatsApp gets the same jobs as Telegram; the rest go out with the next delivery
+        display_remote, display_india = split_sections([j for j in final_jobs if j.key in delivered_keys])
+        footer = format_footer(len(display_remote), len(display_india))
+    with run_report.stage("send.whatsapp"):
+        if not send_whatsapp_digest(header, footer, display_remote, display_india):
+            # Telegram is the channel of record: the jobs stay posted
+            logging.error("WhatsApp digest was not fully sent")
+    return undelivered
+
+def send_daily_whatsapp_digest():
+    """
+    Incremental mode: sends everything delivered to Telegram since the last WhatsApp
+    digest as one WhatsApp digest (daily in service mode, after each one-off cycle).
+    """
+    with job_lock("whatsapp digest") as acquired:
+        if not acquired:
+            return
+        with run_report.start_run("delivery"):
+            jobs = sorted(get_digest_jobs('whatsapp'), key=sort_key_display)
+            if not jobs:
+                logging.info("No jobs queued for the WhatsApp digest.")
+                return
+
+            display_remote, display_india = split_sections(jobs)
+            header = f"🚀 *Daily Tech Jobs Digest by VJ — {datetime.now().strftime('%d %b %Y')}*\n\n"
+            footer = format_footer(len(display_remote), len(display_india))
+            with run_report.stage("send.whatsapp"):
+                sent = send_whatsapp_digest(header, footer, display_remote, display_india)
+            if not sent:
+                # Kept for the next digest; parts that did go out will be repeated then
+                logging.error("WhatsApp digest was not fully sent; keeping its jobs queued")
+                return
+            clear_digest_jobs('whatsapp', [job.key for job in jobs])
 
 def main():
     init_db()
@@ -397,10 +289,33 @@ def main():
     
     # Parse Run Time
     hour, minute = map(int, RUN_TIME_UTC.split(':'))
+    daily_trigger = CronTrigger(hour=hour, minute=minute, timezone=pytz.utc)
     
-    # Add job
-    # "cron" trigger
-    scheduler.add_job(run_job_scraping, CronTrigger(hour=hour, minute=minute, timezone=pytz.utc))
+    # Each source runs on its own interval; max_instances/coalesce stop a slow
+    # source from piling up runs, job_lock guards against other processes
+    for scraper_cls in SCRAPER_CLASSES:
+        scraper = scraper_cls()
+        interval = SOURCE_INTERVALS_MINUTES.get(scraper.name, DEFAULT_SOURCE_INTERVAL_MINUTES)
+        scheduler.add_job(
+            scrape_source, IntervalTrigger(minutes=interval, timezone=pytz.utc), args=[scraper],
+            id=f"scrape:{scraper.name}", max_instances=1, coalesce=True,
+            next_run_time=datetime.now(timezone.utc)
+        )
+        logging.info(f"Scheduled {scraper.name} every {interval} min")
+
+    # A daily digest is posted once a day; incremental mode can publish as often as we scrape
+    if DIGEST_MODE == 'incremental':
+        delivery_trigger = IntervalTrigger(minutes=DELIVERY_INTERVAL_MINUTES, timezone=pytz.utc)
+    else:
+        delivery_trigger = daily_trigger
+    scheduler.add_job(deliver_pending_jobs, delivery_trigger, id="delivery", max_instances=1, coalesce=True)
+    if DIGEST_MODE == 'incremental':
+        scheduler.add_job(send_daily_whatsapp_digest, daily_trigger, id="whatsapp_digest", max_instances=1, coalesce=True)
+    scheduler.add_job(run_interview_agent_process, daily_trigger, id="interview_agent", max_instances=1, coalesce=True)
+    scheduler.add_job(
+        run_interview_prefetch_process, IntervalTrigger(hours=PREFETCH_INTERVAL_HOURS, timezone=pytz.utc),
+        id="interview_prefetch", max_instances=1, coalesce=True
+    )
     
     # Run loop
     try:
@@ -0,0 +1,229 @@
+"""
+Streaming digest pipeline: source -> normalize -> dedup -> classify -> cap -> render.
+
+Each stage is a generator over Job records, so jobs flow through one at a time and
+are dropped as soon as a stage rejects them. Only cap() buffers, and it holds at most
+MAX_JOBS_PER_COMPANY jobs per company (plus the MAX_JOBS_PER_RUN selection), no
+matter how many jobs the sources produce. render() yields digest messages one by one.
+"""
+import time
+import heapq
+from itertools import islice
+
+from src.utils.config import MAX_JOBS_PER_RUN, MAX_JOBS_PER_COMPANY
+from src.utils.db import get_posted_keys, SQL_BATCH_SIZE
+from src.utils.digest_format import MESSAGE_SAFE_LENGTH, REMOTE_SECTION, INDIA_SECTION
+from src.utils.role_matcher import role_categories
+from src.utils import run_report
+
+
+def is_india_role(job):
+    return job.place.is_india
+
+def get_priority_score(job):
+    if "development" in role_categories(job.role):
+        return 0 # High priority
+    return 1 # Lower priority
+
+def sort_key_display(job):
+    # Remote First -> India Metro -> Role Type -> Company Name
+    place = job.place
+    return (
+        0 if place.remote else 1,
+        0 if place.is_india else 1,
+        job.role,
+        job.company
+    )
+
+def curate_rank(job):
+    # Developer roles first, then India before remote, then most recent; jobs without posted_dt rank last
+    return (
+        get_priority_score(job),
+        0 if is_india_role(job) else 1,
+        -job.posted_dt.timestamp() if job.posted_dt else 0.0,
+    )
+
+
+def source(scrapers):
+    """
+    Jobs from each scraper in turn; a scraper's result list is released before the next runs.
+    """
+    for scraper in scrapers:
+        yield from scraper.scrape()
+
+def normalize(jobs):
+    """
+    Drops records without an id (they can't be deduplicated or marked posted).
+    """
+    for job in jobs:
+        if job.id in (None, ''):
+            run_report.incr("dropped_no_id")
+            continue
+        yield job
+
+def dedup(jobs, batch_size=SQL_BATCH_SIZE):
+    """
+    Drops jobs that were already posted or were already seen in this stream, by job
+    key, so tracking-parameter variants of a URL id count as the same job. Looks
+    posted keys up one batch at a time, so only a batch of jobs is held here.
+    """
+    seen_keys = set()
+    jobs = iter(jobs)
+    while True:
+        batch = list(islice(jobs, batch_size))
+        if not batch:
+            return
+        posted = get_posted_keys([job.key for job in batch])
+        for job in batch:
+            if job.key in posted or job.key in seen_keys:
+                run_report.incr("dedup_hits")
+                continue
+            seen_keys.add(job.key)
+            yield job
+
+def classify(jobs):
+    """
+    Keeps the jobs that belong in a digest section: India roles and remote roles.
+    """
+    for job in jobs:
+        if is_india_role(job) or job.place.remote:
+            yield job
+
+def cap(jobs, per_company=MAX_JOBS_PER_COMPANY, limit=MAX_JOBS_PER_RUN):
+    """
+    Keeps the best `per_company` jobs of each company and, if limit is set, the best
+    `limit` overall (see curate_rank; ties go to the earlier job), in display order.
+
+    Each company has a bounded heap keyed worst-first, so a better job replaces the
+    current worst and everything else is released as it streams past.
+    """
+    heaps = {}
+    for seq, job in enumerate(jobs):
+        # Negated (rank, seq): heap[0] is the worst job kept for the company
+        key = tuple(-part for part in curate_rank(job)) + (-seq,)
+        heap = heaps.setdefault(job.company, [])
+        if len(heap) < per_company:
+            heapq.heappush(heap, (key, job))
+        elif key > heap[0][0]:
+            heapq.heapreplace(heap, (key, job))
+
+    kept = [entry for heap in heaps.values() for entry in heap]
+    if limit and len(kept) > limit:
+        kept = heapq.nlargest(limit, kept, key=lambda entry: entry[0])
+
+    # Same-company jobs in rank order where the display key ties
+    kept.sort(key=lambda entry: entry[0], reverse=True)
+    final_jobs = [job for _, job in kept]
+    final_jobs.sort(key=sort_key_display)
+    return final_jobs
+
+
+def render_parts(header, footer, display_remote, display_india, format_entry):
+    """
+    Yields the digest as (message, jobs) pairs, with the messages under MESSAGE_SAFE_LENGTH
+    (one section per region) and the jobs whose entries each message carries.
+    """
+    current_message = header
+    current_jobs = []
+
+    def add(text_to_add, starts_section=False, job=None):
+        # Returns the finished (message, jobs) when text_to_add doesn't fit (Telegram limit ~4096, WhatsApp ~4000)
+        nonlocal current_message, current_jobs
+        if len(current_message) + len(text_to_add) > MESSAGE_SAFE_LENGTH:
+            finished = (current_message, current_jobs)
+            if job is not None and not starts_section:
+                # Continuation header for job list
+                current_message = f"*(Continuation)*\n\n{text_to_add}"
+            else:
+                # Sections and the footer start on a new message
+                current_message = text_to_add
+            current_jobs = [job] if job is not None else []
+            return finished
+        current_message += text_to_add
+        if job is not None:
+            current_jobs.append(job)
+        return None
+
+    sections = []
+    if display_remote:
+        sections.append((REMOTE_SECTION, display_remote))
+    if display_india:
+        sections.append((INDIA_SECTION, display_india))
+
+    for i, (title, section_jobs) in enumerate(sections):
+        # Separator if needed
+        if i:
+            finished = add("\n")
+            if finished is not None:
+                yield finished
+        finished = add(title, starts_section=True)
+        if finished is not None:
+            yield finished
+        for job in section_jobs:
+            finished = add(format_entry(job), job=job)
+            if finished is not None:
+                yield finished
+
+    # Add footer
+    finished = add(footer)
+    if finished is not None:
+        yield finished
+
+    # Final message
+    if current_message:
+        yield current_message, current_jobs
+
+
+def render(header, footer, display_remote, display_india, format_entry):
+    """
+    Yields the digest as messages under MESSAGE_SAFE_LENGTH, one section per region.
+    """
+    for message, _ in render_parts(header, footer, display_remote, display_india, format_entry):
+        yield message
+
+
+class _Timed:
+    """
+    Wraps a stage's generator and accumulates the time spent producing its items,
+    which includes the time of every stage upstream of it.
+    """
+
+    def __init__(self, iterable):
+        self.iterator = iter(iterable)
+        self.seconds = 0.0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        started = time.perf_counter()
+        try:
+            return next(self.iterator)
+        finally:
+            self.seconds += time.perf_counter() - started
+
+
+STREAM_STAGES = (('normalize', normalize), ('dedup', dedup), ('classify', classify))
+
+
+def curate(jobs, limit=MAX_JOBS_PER_RUN):
+    """
+    Runs jobs through normalize -> dedup -> classify -> cap and returns the final jobs
+    in display order. Each stage's own time (excluding upstream stages) goes into the
+    run report as `pipeline.<stage>`, and the time spent producing the jobs as `pipeline.source`.
+    """
+    names, streams = ['source'], [_Timed(jobs)]
+    for name, stage in STREAM_STAGES:
+        names.append(name)
+        streams.append(_Timed(stage(streams[-1])))
+
+    started = time.perf_counter()
+    final_jobs = cap(streams[-1], limit=limit)
+    names.append('cap')
+    inclusive = [stream.seconds for stream in streams] + [time.perf_counter() - started]
+
+    upstream = 0.0
+    for name, seconds in zip(names, inclusive):
+        run_report.add_stage_time(f"pipeline.{name}", seconds - upstream)
+        upstream = seconds
+    return final_jobs
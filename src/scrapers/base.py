@@ -3,6 +3,9 @@ import logging
 import requests
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from src.utils import run_report
+from src.scrapers import fixtures
+from src.utils.locations import resolve_location
 
 class JobScraper(ABC):
     def __init__(self, name):
@@ -16,20 +19,27 @@ class JobScraper(ABC):
         """
         Scrape jobs from the source.
         Returns:
-            List of job dictionaries:
-            {
-                'company': str,
-                'role': str,
-                'location': str,
-                'posted_time': str,
-                'salary': str,
-                'url': str,
-                'source': str,
-                'id': str (unique identifier for deduplication)
-            }
+            List of Job records (src.utils.job.Job) with:
+                company, role, location, posted_time, salary, url, source: str
+                id: str (unique identifier for deduplication)
         """
         pass
 
+    def fetch(self, url, timeout=15):
+        """
+        GETs a source URL with the scraper's headers. The request is timed in the run report
+        (as API `source.<name>` and stage `fetch.<name>`) so fetch and parse time can be told apart.
+        With SCRAPER_FIXTURE_MODE the response is recorded to, or replayed from, fixture files.
+        """
+        if fixtures.mode == 'replay':
+            return fixtures.replay_response(self.name, url)
+        with run_report.stage(f"fetch.{self.name}"), run_report.api_call(f"source.{self.name}") as call:
+            response = requests.get(url, headers=self.headers, timeout=timeout)
+            call.ok = response.ok
+        if fixtures.mode == 'record':
+            fixtures.record_response(self.name, url, response)
+        return response
+
     def filter_recent_jobs(self, jobs):
         """
         Filter jobs posted in the last 24 hours.
@@ -41,34 +51,10 @@ class JobScraper(ABC):
 
     def normalize_location(self, location):
         """
-        Standardize location strings.
+        Standardize location strings (see src.utils.locations for the gazetteer).
         """
-        if not location:
-            return "Unknown"
-        
-        loc_lower = location.lower()
-        if "remote" in loc_lower:
-            if "india" in loc_lower:
-                return "Remote — India"
-            elif "asia" in loc_lower:
-                return "Remote — Asia"
-            elif "worldwide" in loc_lower:
-                return "Remote — Worldwide"
-            else:
-                return "Remote"
-        
-        # Simple mapping for major Indian cities
-        cities = ["Bangalore", "Bengaluru", "Hyderabad", "Mumbai", "Chennai", "Delhi", "Pune", "Gurgaon", "Noida"]
-        for city in cities:
-            if city.lower() in loc_lower:
-                return city
-        
-        return location.title()
+        return resolve_location(location).name
 
     def get_flag(self, location):
-        if "remote" in location.lower():
-            return "🌍"
-        elif any(c in location.lower() for c in ["bangalore", "bengaluru", "hyderabad", "mumbai", "chennai", "delhi", "pune", "india"]):
-            return "🇮🇳"
-        return "📍"
+        return resolve_location(location).flag
         
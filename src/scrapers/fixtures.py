@@ -0,0 +1,211 @@
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.utils.config import SCRAPER_FIXTURE_MODE, SCRAPER_FIXTURE_DIR, SCRAPER_FIXTURE_VERSION
+
+logger = logging.getLogger(__name__)
+
+# Fixture layout: <SCRAPER_FIXTURE_DIR>/<source>/<version>/<request key>.json (+ .body for HTTP)
+# 'record' captures every live fetch into a new version; 'replay' serves them back offline.
+mode = SCRAPER_FIXTURE_MODE
+version = SCRAPER_FIXTURE_VERSION
+# Replay multiplies feed items by this factor (see scale_content)
+scale = 1
+
+_recording_version = None
+_scaled = {}
+
+ITEM_RE = re.compile(rb'<item[\s>].*?</item>', re.S)
+# An item's link and guid (the RSS scrapers' job ids), with any CDATA wrapper kept apart
+ITEM_ID_RE = re.compile(rb'(<(link|guid)\b[^>]*>\s*(?:<!\[CDATA\[)?)(.*?)((?:\]\]>)?\s*</\2>)', re.S)
+
+
+def configure(fixture_mode, fixture_version=None, scale_factor=1):
+    global mode, version, scale
+    mode, version, scale = fixture_mode, fixture_version, scale_factor
+
+
+def source_slug(source):
+    return re.sub(r'[^a-z0-9]+', '_', source.lower()).strip('_')
+
+
+def request_key(url=None, params=None):
+    """
+    Stable key for a request: the URL, or the SerpApi params without the API key.
+    """
+    if params is not None:
+        params = {k: v for k, v in params.items() if k != 'api_key'}
+        raw = json.dumps(params, sort_keys=True)
+    else:
+        raw = url
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def versions(source):
+    """
+    Recorded versions for a source, oldest first (version names sort chronologically).
+    """
+    directory = os.path.join(SCRAPER_FIXTURE_DIR, source_slug(source))
+    if not os.path.isdir(directory):
+        return []
+    return sorted(d for d in os.listdir(directory) if os.path.isdir(os.path.join(directory, d)))
+
+
+def _record_dir(source):
+    global _recording_version
+    if _recording_version is None:
+        _recording_version = version or time.strftime("%Y%m%d-%H%M%S")
+    directory = os.path.join(SCRAPER_FIXTURE_DIR, source_slug(source), _recording_version)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def _replay_dir(source):
+    available = versions(source)
+    chosen = version if version in available else (available[-1] if available and not version else None)
+    if chosen is None:
+        raise FileNotFoundError(f"No recorded fixtures for {source} (version {version or 'latest'}) under {SCRAPER_FIXTURE_DIR}")
+    return os.path.join(SCRAPER_FIXTURE_DIR, source_slug(source), chosen)
+
+
+def _write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def record_response(source, url, response):
+    directory = _record_dir(source)
+    key = request_key(url=url)
+    with open(os.path.join(directory, f"{key}.body"), 'wb') as f:
+        f.write(response.content)
+    _write_json(os.path.join(directory, f"{key}.json"), {
+        'url': url,
+        'status_code': response.status_code,
+        'content_type': response.headers.get('Content-Type', ''),
+        'encoding': response.encoding,
+        'recorded_at': time.time(),
+    })
+    logger.info(f"Recorded fixture {source}/{os.path.basename(directory)}/{key} ({len(response.content)} bytes)")
+
+
+def replay_response(source, url):
+    """
+    Rebuilds the recorded requests.Response for a URL, scaled by the replay factor.
+    """
+    directory = _replay_dir(source)
+    key = request_key(url=url)
+    with open(os.path.join(directory, f"{key}.json"), encoding='utf-8') as f:
+        meta = json.load(f)
+
+    cache_key = (directory, key, scale)
+    if cache_key not in _scaled:
+        with open(os.path.join(directory, f"{key}.body"), 'rb') as f:
+            _scaled[cache_key] = scale_content(f.read(), meta['content_type'], scale)
+
+    response = requests.Response()
+    response.status_code = meta['status_code']
+    response._content = _scaled[cache_key]
+    response.headers = CaseInsensitiveDict({'Content-Type': meta['content_type']})
+    response.encoding = meta['encoding']
+    response.url = url
+    return response
+
+
+def record_search(source, params, result):
+    directory = _record_dir(source)
+    key = request_key(params=params)
+    _write_json(os.path.join(directory, f"{key}.json"), {
+        'params': {k: v for k, v in params.items() if k != 'api_key'},
+        'result': result,
+        'recorded_at': time.time(),
+    })
+    logger.info(f"Recorded fixture {source}/{os.path.basename(directory)}/{key}")
+
+
+def replay_search(source, params):
+    directory = _replay_dir(source)
+    key = request_key(params=params)
+    cache_key = (directory, key, scale)
+    if cache_key not in _scaled:
+        with open(os.path.join(directory, f"{key}.json"), encoding='utf-8') as f:
+            _scaled[cache_key] = json.dumps(_scale_document(json.load(f)['result'], scale))
+    # A fresh copy per call, as GoogleSearch.get_dict() would return
+    return json.loads(_scaled[cache_key])
+
+
+def recorded_at(source):
+    """
+    Earliest recording time in the replayed version, so callers can pin "now" to it.
+    """
+    directory = _replay_dir(source)
+    times = []
+    for name in os.listdir(directory):
+        if name.endswith('.json'):
+            with open(os.path.join(directory, name), encoding='utf-8') as f:
+                times.append(json.load(f).get('recorded_at', 0))
+    return min(times) if times else None
+
+
+ID_FIELDS = ('id', 'job_id', 'url', 'slug')
+
+
+def _scale_items(items, factor):
+    if factor <= 1:
+        return items
+    # Only postings are copied, not notices like RemoteOK's leading legal entry
+    postings = [i for i in items if isinstance(i, dict) and any(f in i for f in ID_FIELDS)] or items
+    scaled = list(items)
+    for copy in range(1, factor):
+        for item in postings:
+            if isinstance(item, dict):
+                item = dict(item)
+                # Keep ids and links unique so the copies look like distinct postings
+                for field in ID_FIELDS:
+                    value = item.get(field)
+                    if isinstance(value, str) and value:
+                        item[field] = f"{value}-x{copy}"
+                    elif isinstance(value, int):
+                        item[field] = value * 1000 + copy
+            scaled.append(item)
+    return scaled
+
+
+def _renamed_item(item, copy):
+    # Keep links and guids unique so the copies look like distinct postings
+    return ITEM_ID_RE.sub(lambda m: m.group(1) + m.group(3) + f"-x{copy}".encode() + m.group(4), item)
+
+
+def _scale_document(data, factor):
+    if isinstance(data, list):
+        return _scale_items(data, factor)
+    if isinstance(data, dict):
+        lists = [k for k, v in data.items() if isinstance(v, list)]
+        if lists:
+            field = max(lists, key=lambda k: len(data[k]))
+            data[field] = _scale_items(data[field], factor)
+    return data
+
+
+def scale_content(content, content_type, factor):
+    """
+    Synthetically enlarges a recorded feed: RSS <item>s are repeated with renamed links and
+    guids, and the largest list in a JSON document (top-level array or a dict value) is
+    extended with renamed copies.
+    """
+    if factor <= 1:
+        return content
+    if 'json' in content_type or content.lstrip()[:1] in (b'[', b'{'):
+        return json.dumps(_scale_document(json.loads(content), factor)).encode('utf-8')
+
+    items = ITEM_RE.findall(content)
+    if not items:
+        return content
+    last = content.rfind(b'</item>') + len(b'</item>')
+    copies = b''.join(_renamed_item(item, copy) for copy in range(1, factor) for item in items)
+    return content[:last] + copies + content[last:]
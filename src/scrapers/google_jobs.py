@@ -1,15 +1,33 @@
 
 from serpapi import GoogleSearch
 from .base import JobScraper
+from src.utils.job import Job
+from src.utils.role_matcher import is_relevant_role
+from src.utils.timestamps import parse_timestamp
+from . import fixtures
 import os
 import logging
+from datetime import datetime, timezone
 from src.utils.config import SERPAPI_KEY
+from src.utils import run_report
 
 class GoogleJobsScraper(JobScraper):
     def __init__(self):
         super().__init__('GoogleJobs (SerpApi)')
         self.api_key = SERPAPI_KEY
 
+    def search(self, params):
+        """
+        Runs one SerpApi query, timed in the run report (and recorded/replayed) like JobScraper.fetch.
+        """
+        if fixtures.mode == 'replay':
+            return fixtures.replay_search(self.name, params)
+        with run_report.stage(f"fetch.{self.name}"), run_report.api_call(f"source.{self.name}"):
+            result = GoogleSearch(params).get_dict()
+        if fixtures.mode == 'record':
+            fixtures.record_search(self.name, params, result)
+        return result
+
     def scrape(self):
         if not self.api_key:
             logging.warning("No SERPAPI_KEY found. Skipping Google Jobs scraping.")
@@ -18,6 +36,7 @@ class GoogleJobsScraper(JobScraper):
         try:
             logging.info(f"Fetching jobs from {self.name}...")
             jobs = []
+            now = datetime.now(timezone.utc)
             
             # Search queries for India
             queries = [
@@ -35,15 +54,15 @@ class GoogleJobsScraper(JobScraper):
                     "chips": "date_posted:today" # Only today/recent
                 }
 
-                search = GoogleSearch(params)
-                results = search.get_dict()
+                results = self.search(params)
                 jobs_results = results.get("jobs_results", [])
 
                 for job in jobs_results:
                     title = job.get("title", "Unknown Role")
                     company = job.get("company_name", "Unknown Company")
                     location = job.get("location", "India")
-                    salary = job.get("salary", "Not disclosed")
+                    # SerpApi puts the pay ("50K–70K a year") in detected_extensions
+                    salary = job.get("detected_extensions", {}).get("salary") or job.get("salary") or "Not disclosed"
                     
                     # Google Jobs doesn't always give a direct link clearly, 
                     # often buried in `related_links` or `apply_options`.
@@ -53,19 +72,23 @@ class GoogleJobsScraper(JobScraper):
                     
                     job_id = job.get("job_id", "")
 
-                    if not job_id:
+                    if not job_id or not is_relevant_role(title):
                         continue
 
-                    jobs.append({
-                        'company': company,
-                        'role': title,
-                        'location': self.normalize_location(location),
-                        'posted_time': job.get("detected_extensions", {}).get("posted_at", "Recently"),
-                        'salary': salary,
-                        'url': url,
-                        'source': 'Google Jobs', # Aggregates LinkedIn, Naukri etc.
-                        'id': job_id
-                    })
+                    # SerpApi only gives a relative "posted_at" ("5 hours ago")
+                    posted_at = job.get("detected_extensions", {}).get("posted_at", "Recently")
+
+                    jobs.append(Job(
+                        company=company,
+                        role=title,
+                        location=self.normalize_location(location),
+                        posted_time=posted_at,
+                        posted_dt=parse_timestamp(posted_at, now),
+                        salary=salary,
+                        url=url,
+                        source='Google Jobs', # Aggregates LinkedIn, Naukri etc.
+                        id=job_id
+                    ))
             
             logging.info(f"Found {len(jobs)} jobs from {self.name}")
             return jobs
@@ -1,7 +1,10 @@
 
-import requests
 from .base import JobScraper
-from datetime import datetime, timedelta
+from src.utils.job import Job
+from src.utils.role_matcher import is_relevant_role
+from src.utils.timestamps import parse_timestamp
+from src.utils.salary import from_range, format_salary
+from datetime import datetime, timedelta, timezone
 import logging
 
 class RemoteOKScraper(JobScraper):
@@ -12,7 +15,7 @@ class RemoteOKScraper(JobScraper):
     def scrape(self):
         try:
             logging.info(f"Fetching jobs from {self.name}...")
-            response = requests.get(self.api_url, headers=self.headers, timeout=15)
+            response = self.fetch(self.api_url)
             response.raise_for_status()
             data = response.json()
             
@@ -21,21 +24,20 @@ class RemoteOKScraper(JobScraper):
             if len(data) > 0 and 'legal' in data[0]:
                 data = data[1:]
 
-            cutoff_time = datetime.now() - timedelta(hours=24)
+            now = datetime.now(timezone.utc)
+            cutoff_time = now - timedelta(hours=24)
 
             for item in data:
                 # Check date
-                date_str = item.get('date', '')
-                try:
-                    # RemoteOK returns ISO format sometimes, or relative
-                    # For API, 'date' is usually ISO 8601
-                    job_date = datetime.strptime(date_str.split('T')[0], "%Y-%m-%d")
-                    if job_date < cutoff_time:
-                        continue
-                except ValueError:
-                    # Fallback or skip if date parsing fails
+                # For API, 'date' is usually ISO 8601; 'epoch' is the same instant in seconds
+                date_str = item.get('date') or item.get('epoch')
+                posted_dt = parse_timestamp(date_str, now)
+                if posted_dt is None:
+                    # Skip if date parsing fails
                     logging.warning(f"Could not parse date: {date_str}")
                     continue
+                if posted_dt < cutoff_time:
+                    continue
 
                 title = item.get('position', 'Unknown Role')
                 company = item.get('company', 'Unknown Company')
@@ -43,22 +45,22 @@ class RemoteOKScraper(JobScraper):
                 url = item.get('url', '')
                 tags = item.get('tags', [])
                 
-                # Check for relevant tags
-                relevant_tags = {'dev', 'engineer', 'developer', 'backend', 'frontend', 'full stack', 'sre', 'devops', 'qa', 'test'}
-                if not any(tag.lower() in relevant_tags for tag in tags) and \
-                   not any(role in title.lower() for role in ['developer', 'engineer', 'sre', 'devops', 'tester']):
+                # Check for relevant title or tags
+                if not is_relevant_role(title, tags):
                     continue
 
-                jobs.append({
-                    'company': company,
-                    'role': title,
-                    'location': self.normalize_location(location),
-                    'posted_time': "Recently", # Since we filter by date
-                    'salary': item.get('salary_min', '') + " - " + item.get('salary_max', '') if item.get('salary_max') else "Not disclosed",
-                    'url': url,
-                    'source': 'RemoteOK',
-                    'id': item.get('id', url)
-                })
+                jobs.append(Job(
+                    company=company,
+                    role=title,
+                    location=self.normalize_location(location),
+                    posted_time="Recently", # Since we filter by date
+                    posted_dt=posted_dt,
+                    # The API gives yearly USD amounts as numbers (0 when not disclosed)
+                    salary=format_salary(from_range(item.get('salary_min'), item.get('salary_max'), "USD")),
+                    url=url,
+                    source='RemoteOK',
+                    id=item.get('id', url)
+                ))
 
             logging.info(f"Found {len(jobs)} jobs from {self.name}")
             return jobs
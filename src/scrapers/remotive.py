@@ -1,7 +1,9 @@
 
-import requests
 from .base import JobScraper
-from datetime import datetime, timedelta
+from src.utils.job import Job
+from src.utils.role_matcher import is_relevant_role
+from src.utils.timestamps import parse_timestamp
+from datetime import datetime, timedelta, timezone
 import logging
 
 class RemotiveScraper(JobScraper):
@@ -12,7 +14,7 @@ class RemotiveScraper(JobScraper):
     def scrape(self):
         try:
             logging.info(f"Fetching jobs from {self.name}...")
-            response = requests.get(self.api_url, headers=self.headers, timeout=15)
+            response = self.fetch(self.api_url)
             response.raise_for_status()
             data = response.json()
             
@@ -20,16 +22,13 @@ class RemotiveScraper(JobScraper):
             jobs_data = data.get('jobs', [])
             
             jobs = []
-            cutoff_time = datetime.now() - timedelta(hours=24)
+            now = datetime.now(timezone.utc)
+            cutoff_time = now - timedelta(hours=24)
 
             for item in jobs_data:
-                # Remotive provides 'publication_date' usually in ISO format
-                date_str = item.get('publication_date', '')
-                try:
-                    job_date = datetime.strptime(date_str.split('T')[0], "%Y-%m-%d")
-                    if job_date < cutoff_time:
-                        continue
-                except ValueError:
+                # Remotive provides 'publication_date' usually in ISO format (UTC, no offset)
+                posted_dt = parse_timestamp(item.get('publication_date'), now)
+                if posted_dt is None or posted_dt < cutoff_time:
                     continue
 
                 title = item.get('title', 'Unknown Role')
@@ -43,19 +42,20 @@ class RemotiveScraper(JobScraper):
                 relevant_categories = ['software development', 'qa', 'devops / sysadmin', 'data']
                 if category not in relevant_categories:
                     # check title just in case
-                    if not any(role in title.lower() for role in ['developer', 'engineer', 'sre', 'devops', 'tester']):
+                    if not is_relevant_role(title, tags):
                         continue
 
-                jobs.append({
-                    'company': company,
-                    'role': title,
-                    'location': self.normalize_location(location),
-                    'posted_time': "Recently",
-                    'salary': item.get('salary', 'Not disclosed'),
-                    'url': url,
-                    'source': 'Remotive',
-                    'id': str(item.get('id', url))
-                })
+                jobs.append(Job(
+                    company=company,
+                    role=title,
+                    location=self.normalize_location(location),
+                    posted_time="Recently",
+                    posted_dt=posted_dt,
+                    salary=item.get('salary') or 'Not disclosed',
+                    url=url,
+                    source='Remotive',
+                    id=str(item.get('id', url))
+                ))
 
             logging.info(f"Found {len(jobs)} jobs from {self.name}")
             return jobs
@@ -1,10 +1,11 @@
 
-import requests
 from bs4 import BeautifulSoup
 from .base import JobScraper
-from datetime import datetime, timedelta
+from src.utils.job import Job
+from src.utils.role_matcher import is_relevant_role
+from src.utils.timestamps import parse_timestamp
+from datetime import datetime, timedelta, timezone
 import logging
-from email.utils import parsedate_to_datetime
 
 class WeWorkRemotelyScraper(JobScraper):
     def __init__(self):
@@ -14,24 +15,23 @@ class WeWorkRemotelyScraper(JobScraper):
     def scrape(self):
         try:
             logging.info(f"Fetching jobs from {self.name}...")
-            response = requests.get(self.feed_url, headers=self.headers, timeout=15)
+            response = self.fetch(self.feed_url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'xml')
             items = soup.find_all('item')
             jobs = []
             
-            cutoff_time = datetime.now() - timedelta(hours=24)
+            now = datetime.now(timezone.utc)
+            cutoff_time = now - timedelta(hours=24)
 
             for item in items:
                 pub_date_elem = item.find('pubDate')
                 if not pub_date_elem:
                     continue
-                pub_date_str = pub_date_elem.text
 
-                pub_date = parsedate_to_datetime(pub_date_str)
-                # Convert to naive or offset-aware comparison
-                if pub_date.replace(tzinfo=None) < cutoff_time:
+                pub_date = parse_timestamp(pub_date_elem.text, now)
+                if pub_date is None or pub_date < cutoff_time:
                     continue
                 
                 title_elem = item.find('title')
@@ -55,21 +55,20 @@ class WeWorkRemotelyScraper(JobScraper):
                     company = "Unknown"
 
                 # Filter by role keywords
-                role_lower = role.lower()
-                relevant_keywords = ['developer', 'software', 'engineer', 'devops', 'sre', 'backend', 'frontend', 'full stack', 'qa', 'tester']
-                if not any(k in role_lower for k in relevant_keywords):
+                if not is_relevant_role(role):
                     continue
 
-                jobs.append({
-                    'company': company,
-                    'role': role,
-                    'location': 'Remote', # WWR is mostly remote
-                    'posted_time': "Recently",
-                    'salary': "Not disclosed", # Usually not in RSS title
-                    'url': link,
-                    'source': 'WeWorkRemotely',
-                    'id': guid
-                })
+                jobs.append(Job(
+                    company=company,
+                    role=role,
+                    location='Remote', # WWR is mostly remote
+                    posted_time="Recently",
+                    posted_dt=pub_date,
+                    salary="Not disclosed", # Usually not in RSS title
+                    url=link,
+                    source='WeWorkRemotely',
+                    id=guid
+                ))
 
             logging.info(f"Found {len(jobs)} jobs from {self.name}")
             return jobs
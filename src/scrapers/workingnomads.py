@@ -1,8 +1,10 @@
 
-import requests
 from bs4 import BeautifulSoup
 from .base import JobScraper
-from datetime import datetime, timedelta
+from src.utils.job import Job
+from src.utils.role_matcher import is_relevant_role
+from src.utils.timestamps import parse_timestamp
+from datetime import datetime, timedelta, timezone
 import logging
 
 class WorkingNomadsScraper(JobScraper):
@@ -17,7 +19,7 @@ class WorkingNomadsScraper(JobScraper):
         try:
             logging.info(f"Fetching jobs from {self.name}...")
             # For brevity, let's stick to RSS if it works easily
-            response = requests.get(self.feed_url, headers=self.headers, timeout=15)
+            response = self.fetch(self.feed_url)
             # RSS processing similar to WWR
             # If RSS fails or is blocked, skip.
             
@@ -27,16 +29,15 @@ class WorkingNomadsScraper(JobScraper):
             jobs = []
             
             # Their RSS date format: "Mon, 16 Feb 2026 12:00:00 +0000"
-            from email.utils import parsedate_to_datetime
-            
-            cutoff_time = datetime.now() - timedelta(hours=24)
+            now = datetime.now(timezone.utc)
+            cutoff_time = now - timedelta(hours=24)
 
             for item in items:
                 pub_date_data = item.find('pubDate')
                 if not pub_date_data:
                     continue
-                pub_date = parsedate_to_datetime(pub_date_data.text)
-                if pub_date.replace(tzinfo=None) < cutoff_time:
+                pub_date = parse_timestamp(pub_date_data.text, now)
+                if pub_date is None or pub_date < cutoff_time:
                     continue
                 
                 title_elem = item.find('title')
@@ -49,6 +50,9 @@ class WorkingNomadsScraper(JobScraper):
                     role = title
                     company = "Unknown"
                 
+                if not is_relevant_role(role):
+                    continue
+
                 link_elem = item.find('link')
                 link = link_elem.text
                 
@@ -56,16 +60,17 @@ class WorkingNomadsScraper(JobScraper):
                 # Default to Remote
                 location = "Remote"
                 
-                jobs.append({
-                    'company': company,
-                    'role': role,
-                    'location': location,
-                    'posted_time': "Recently",
-                    'salary': "Not disclosed",
-                    'url': link,
-                    'source': 'WorkingNomads',
-                    'id': link # Use URL as ID
-                })
+                jobs.append(Job(
+                    company=company,
+                    role=role,
+                    location=location,
+                    posted_time="Recently",
+                    posted_dt=pub_date,
+                    salary="Not disclosed",
+                    url=link,
+                    source='WorkingNomads',
+                    id=link # Use URL as ID
+                ))
 
             logging.info(f"Found {len(jobs)} jobs from {self.name}")
             return jobs
@@ -0,0 +1,82 @@
+import os
+import json
+import hashlib
+import logging
+from src.utils.config import ARTIFACT_DIR, ARTIFACT_MAX_BYTES
+from src.utils.db import get_artifact, record_artifact, delete_artifact, evict_artifacts
+
+logger = logging.getLogger(__name__)
+
+def artifact_key(data, *parts):
+    """
+    Returns the SHA-256 hex digest of a JSON document in canonical form plus any extra
+    parts (renderer version, publish date) that change the rendered output.
+    """
+    digest = hashlib.sha256(json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+    for part in parts:
+        digest.update(b'\0' + str(part).encode('utf-8'))
+    return digest.hexdigest()
+
+def artifact_path(key, filename):
+    """
+    Returns the absolute path an artifact file should be written to, creating its directory.
+    """
+    directory = os.path.abspath(os.path.join(ARTIFACT_DIR, key))
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, filename)
+
+def get_path(key, kind):
+    """
+    Returns the path of a stored artifact, or None if it was never stored or has been removed.
+    """
+    path = get_artifact(key, kind)
+    if path and os.path.exists(path):
+        logger.info(f"Artifact cache hit for {kind} {key[:12]}")
+        return path
+    if path:
+        delete_artifact(key, kind)
+    return None
+
+def add(key, kind, path):
+    """
+    Indexes a file already written at artifact_path(), then evicts least recently
+    used artifacts (never this key's) until the store fits ARTIFACT_MAX_BYTES.
+    """
+    record_artifact(key, kind, path, os.path.getsize(path))
+    for evicted in evict_artifacts(ARTIFACT_MAX_BYTES, keep_key=key):
+        _remove(evicted)
+    return path
+
+def put_bytes(key, kind, filename, payload):
+    """
+    Writes an in-memory artifact (temp file + rename, so concurrent runs never see a
+    partial file), indexes it and returns its path.
+    """
+    path = artifact_path(key, filename)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return add(key, kind, path)
+
+def put_json(key, kind, filename, data):
+    return put_bytes(key, kind, filename, json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
+
+def load_json(key, kind):
+    path = get_path(key, kind)
+    if not path:
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def _remove(path):
+    logger.info(f"Evicting artifact {path}")
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    try:
+        # Only succeeds once the key's last file is gone
+        os.rmdir(os.path.dirname(path))
+    except OSError:
+        pass
@@ -17,11 +17,95 @@ WHATSAPP_TOKEN = os.getenv('WHATSAPP_ACCESS_TOKEN')
 WHATSAPP_PHONE_ID = os.getenv('WHATSAPP_PHONE_NUMBER_ID')
 WHATSAPP_RECIPIENT = os.getenv('WHATSAPP_RECIPIENT_PHONE_NUMBER')
 
+# API Base URLs (override to point at local stand-ins, e.g. benchmarks/fake_api.py)
+TELEGRAM_API_BASE = os.getenv('TELEGRAM_API_BASE', 'https://api.telegram.org').rstrip('/')
+WHATSAPP_API_BASE = os.getenv('WHATSAPP_API_BASE', 'https://graph.facebook.com/v22.0').rstrip('/')
+
+# Run Reports
+# Optional directory for Prometheus textfile-collector output (unset = disabled)
+METRICS_TEXTFILE_DIR = os.getenv('METRICS_TEXTFILE_DIR')
+
 # Job Filters (Hardcoded)
 TARGET_LOCATIONS = ["Bangalore", "Remote", "Hyderabad", "Mumbai", "Chennai", "Pune", "Delhi"]
 ROLES = ["developer", "tester", "devops"]
 
+# Role categories: keywords match job titles and tags case-insensitively at word starts
+# (keywords of three letters or fewer, like "dev", only as whole words).
+# Scrapers keep a job if it matches any category; 'development' roles are prioritised
+# in the digest.
+ROLE_CATEGORIES = {
+    "development": ["developer", "software engineer", "sde", "backend", "frontend", "full stack"],
+    "engineering": ["engineer", "software", "dev"],
+    "devops": ["devops", "sre"],
+    "qa": ["qa", "tester", "test"],
+}
+
 # Scraper Settings (Hardcoded)
 SCRAPER_DELAY_SECONDS = 3
 RUN_TIME_UTC = "10:30"
+
+# Scraper Fixtures: 'record' saves every fetched response, 'replay' serves them back offline
+SCRAPER_FIXTURE_MODE = os.getenv('SCRAPER_FIXTURE_MODE')
+SCRAPER_FIXTURE_DIR = os.getenv('SCRAPER_FIXTURE_DIR', 'fixtures/scrapers')
+# Version (directory) to record into or replay; default is a new timestamp / the latest recording
+SCRAPER_FIXTURE_VERSION = os.getenv('SCRAPER_FIXTURE_VERSION')
+
+# Service mode: per-source scrape intervals (minutes), keyed by scraper name.
+# Scrapes only queue jobs; delivery runs daily at RUN_TIME_UTC, or every
+# DELIVERY_INTERVAL_MINUTES when DIGEST_MODE is 'incremental'
+SOURCE_INTERVALS_MINUTES = {
+    'RemoteOK': 30,
+    'WeWorkRemotely': 60,
+    'Remotive': 60,
+    'WorkingNomads': 120,
+    'GoogleJobs (SerpApi)': 360,
+}
+DEFAULT_SOURCE_INTERVAL_MINUTES = 60
+DELIVERY_INTERVAL_MINUTES = 60
 LOG_LEVEL = "INFO"
+
+# Digest publishing: 'daily' posts a fresh digest each run; 'incremental' appends
+# new jobs to today's digest message by editing it in place
+DIGEST_MODE = os.getenv('DIGEST_MODE', 'daily')
+
+# Curation: at most this many jobs per digest run, most relevant and recent first (0 = no limit)
+MAX_JOBS_PER_RUN = int(os.getenv('MAX_JOBS_PER_RUN', '0'))
+MAX_JOBS_PER_COMPANY = 5
+
+# Media Cache Settings (Hardcoded)
+# WhatsApp media IDs expire 30 days after upload; Telegram file_ids are long-lived
+WHATSAPP_MEDIA_TTL_HOURS = 24 * 29
+TELEGRAM_FILE_ID_TTL_HOURS = 24 * 365
+
+# SerpApi Search Cache (Hardcoded)
+# Interview trend searches barely change week to week; reuse results within the TTL
+SEARCH_CACHE_TTL_HOURS = 24 * 7
+SEARCH_CACHE_MAX_ENTRIES = 50
+
+# Interview Guide Prefetch (Hardcoded)
+# Upcoming roles are generated ahead of time so the daily run only has to send
+PREFETCH_AHEAD_ROLES = 1
+PREFETCH_MAX_AGE_DAYS = 6
+PREFETCH_INTERVAL_HOURS = 6
+
+# Guide Artifact Store (Hardcoded)
+# Guide JSON and rendered PDFs, addressed by content hash; least recently used are evicted past the size cap
+ARTIFACT_DIR = 'artifacts'
+ARTIFACT_MAX_BYTES = 200 * 1024 * 1024
+
+# Gemini Settings (Hardcoded)
+GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-3.5-flash"
+GEMINI_TIMEOUT_SECONDS = 90
+# Streaming parses questions as they arrive and retries only the missing ones; the attempt
+# limit also bounds the blocking path's requests for questions a response left out
+GEMINI_STREAMING = True
+GEMINI_STREAM_READ_TIMEOUT = 30
+GEMINI_STREAM_MAX_ATTEMPTS = 3
+
+# Question Bank (Hardcoded)
+# Each guide has GUIDE_QUESTION_COUNT questions; at least QUESTION_BANK_MIN_FRESH come
+# fresh from Gemini and the rest are reused from the bank once it has enough material
+GUIDE_QUESTION_COUNT = 10
+QUESTION_BANK_MIN_FRESH = 4
+QUESTION_BANK_COOLDOWN_DAYS = 30
+QUESTION_BANK_SIMILARITY_THRESHOLD = 0.6
@@ -1,48 +1,448 @@
 
 import sqlite3
 import logging
+import json
 import os
+import time
+from src.utils.job import Job
+from src.utils.job_keys import job_key, infer_sources
+from src.utils.salary import COUNTRY_CURRENCIES, SOURCE_CURRENCIES
 
 DB_FILE = 'jobs.db'
 
+# Job history kept with each posted job (added after the table was first created)
+POSTED_JOB_HISTORY_COLUMNS = {
+    'company': 'TEXT',
+    'role': 'TEXT',
+    'source': 'TEXT',
+    'location': 'TEXT',
+    'country': 'TEXT',
+    'remote': 'INTEGER',
+    'posted_at': 'REAL',
+    # Parsed salary (see src/utils/salary.py); min/max are annualized, in salary_currency
+    'salary_currency': 'TEXT',
+    'salary_period': 'TEXT',
+    'salary_min': 'REAL',
+    'salary_max': 'REAL',
+}
+
+def _columns(cursor, table):
+    return {row[1] for row in cursor.execute(f'PRAGMA table_info({table})')}
+
+def _ensure_columns(cursor, table, columns):
+    existing = _columns(cursor, table)
+    for name, sql_type in columns.items():
+        if name not in existing:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN {name} {sql_type}')
+
+# posted_jobs is keyed by job_key(source, id): a 64-bit INTEGER PRIMARY KEY is the
+# table's rowid, so dedup lookups need no separate index over long TEXT ids
+POSTED_JOBS_SQL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        key INTEGER PRIMARY KEY,
+        id TEXT,
+        url TEXT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+def _migrate_posted_job_keys(cursor):
+    """
+    Rebuilds a posted_jobs table keyed by raw TEXT id into one keyed by job_key.
+    Rows from before sources were recorded get their source inferred (see
+    infer_sources); a bare numeric id that fits several sources is kept under
+    each of their keys, so it stays deduplicated whichever source lists it again.
+    """
+    columns = ['id', 'url', 'timestamp', *POSTED_JOB_HISTORY_COLUMNS]
+    source_index = columns.index('source')
+    cursor.execute(POSTED_JOBS_SQL.format(table='posted_jobs_keyed'))
+    _ensure_columns(cursor, 'posted_jobs_keyed', POSTED_JOB_HISTORY_COLUMNS)
+
+    def keyed_rows():
+        for row in cursor.connection.execute(f"SELECT {', '.join(columns)} FROM posted_jobs"):
+            job_id, url, source = row[0], row[1], row[source_index]
+            for candidate in (source,) if source else infer_sources(job_id, url) or ('',):
+                yield (job_key(candidate, job_id), *row)
+
+    cursor.executemany(
+        f"INSERT OR IGNORE INTO posted_jobs_keyed (key, {', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * (len(columns) + 1))})",
+        keyed_rows()
+    )
+    migrated = cursor.execute('SELECT COUNT(*) FROM posted_jobs_keyed').fetchone()[0]
+    cursor.execute('DROP TABLE posted_jobs')
+    cursor.execute('ALTER TABLE posted_jobs_keyed RENAME TO posted_jobs')
+    logging.info(f"Migrated posted_jobs to hashed job keys ({migrated} keys)")
+
+# Queued jobs are keyed the same way, so equal numeric ids from two sources don't
+# overwrite each other and tracking-parameter variants of a URL queue once
+PENDING_JOBS_SQL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        key INTEGER PRIMARY KEY,
+        id TEXT,
+        payload TEXT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+def _migrate_pending_job_keys(cursor):
+    """
+    Rebuilds a pending_jobs table keyed by raw TEXT id into one keyed by job_key,
+    decoding each payload for its source. Later rows win, as a re-queue would.
+    """
+    cursor.execute(PENDING_JOBS_SQL.format(table='pending_jobs_keyed'))
+
+    def keyed_rows():
+        for payload, timestamp in cursor.connection.execute(
+                'SELECT payload, timestamp FROM pending_jobs ORDER BY timestamp'):
+            try:
+                job = _decode_job(payload)
+            except Exception as e:
+                logging.warning(f"Dropping unreadable pending job during migration: {e}")
+                continue
+            yield (job.key, str(job.id), payload, timestamp)
+
+    cursor.executemany(
+        'INSERT OR REPLACE INTO pending_jobs_keyed (key, id, payload, timestamp) VALUES (?, ?, ?, ?)',
+        keyed_rows()
+    )
+    cursor.execute('DROP TABLE pending_jobs')
+    cursor.execute('ALTER TABLE pending_jobs_keyed RENAME TO pending_jobs')
+    logging.info("Migrated pending_jobs to hashed job keys")
+
+def _fill_salary_currencies(cursor):
+    # Salaries stored before defaults were inferred (see salary.with_default_currency)
+    cursor.executemany(
+        'UPDATE posted_jobs SET salary_currency = ? '
+        'WHERE salary_currency IS NULL AND salary_max IS NOT NULL AND country = ?',
+        [(currency, country) for country, currency in COUNTRY_CURRENCIES.items()]
+    )
+    cursor.executemany(
+        'UPDATE posted_jobs SET salary_currency = ? '
+        'WHERE salary_currency IS NULL AND salary_max IS NOT NULL AND source = ?',
+        [(currency, source) for source, currency in SOURCE_CURRENCIES.items()]
+    )
+
 def init_db():
     conn = sqlite3.connect(DB_FILE)
     cursor = conn.cursor()
+    cursor.execute(POSTED_JOBS_SQL.format(table='posted_jobs'))
+    _ensure_columns(cursor, 'posted_jobs', POSTED_JOB_HISTORY_COLUMNS)
+    if 'key' not in _columns(cursor, 'posted_jobs'):
+        _migrate_posted_job_keys(cursor)
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_posted_jobs_timestamp ON posted_jobs (timestamp)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_posted_jobs_salary ON posted_jobs (salary_currency, salary_max)')
+    _fill_salary_currencies(cursor)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS agent_state (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    ''')
+    cursor.execute(PENDING_JOBS_SQL.format(table='pending_jobs'))
+    if 'key' not in _columns(cursor, 'pending_jobs'):
+        _migrate_pending_job_keys(cursor)
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS posted_jobs (
-            id TEXT PRIMARY KEY,
-            url TEXT,
+        CREATE TABLE IF NOT EXISTS digest_queue (
+            channel TEXT,
+            key INTEGER,
+            payload TEXT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (channel, key)
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS prefetched_guides (
+            role TEXT PRIMARY KEY,
+            data TEXT,
+            pdf_path TEXT,
+            publish_date TEXT,
             timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
         )
     ''')
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS agent_state (
-            key TEXT PRIMARY KEY,
-            value TEXT
+        CREATE TABLE IF NOT EXISTS question_bank (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            role TEXT,
+            category TEXT,
+            question TEXT,
+            payload TEXT,
+            shingle_count INTEGER,
+            use_count INTEGER DEFAULT 0,
+            last_used REAL,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_question_bank_role ON question_bank (role, category)')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS question_shingles (
+            shingle INTEGER,
+            question_id INTEGER
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_question_shingles ON question_shingles (shingle)')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS search_cache (
+            query_key TEXT PRIMARY KEY,
+            result TEXT,
+            created_at REAL,
+            last_access REAL
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS media_cache (
+            content_hash TEXT,
+            channel TEXT,
+            media_id TEXT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (content_hash, channel)
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS artifacts (
+            key TEXT,
+            kind TEXT,
+            path TEXT,
+            size INTEGER,
+            last_access REAL,
+            PRIMARY KEY (key, kind)
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT,
+            started_at REAL,
+            duration REAL,
+            status TEXT,
+            report TEXT
         )
     ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_runs_kind ON runs (kind, started_at)')
     conn.commit()
     conn.close()
 
-def is_job_posted(job_id):
+def is_job_posted(source, job_id):
     conn = sqlite3.connect(DB_FILE)
     cursor = conn.cursor()
-    cursor.execute('SELECT 1 FROM posted_jobs WHERE id = ?', (job_id,))
+    cursor.execute('SELECT 1 FROM posted_jobs WHERE key = ?', (job_key(source, job_id),))
     result = cursor.fetchone()
     conn.close()
     return result is not None
 
-def mark_job_posted(job_id, url):
+def mark_job_posted(source, job_id, url):
     conn = sqlite3.connect(DB_FILE)
     cursor = conn.cursor()
     try:
-        cursor.execute('INSERT OR IGNORE INTO posted_jobs (id, url) VALUES (?, ?)', (job_id, url))
+        cursor.execute(
+            'INSERT OR IGNORE INTO posted_jobs (key, id, url, source) VALUES (?, ?, ?, ?)',
+            (job_key(source, job_id), job_id, url, source)
+        )
         conn.commit()
     except Exception as e:
         logging.error(f"Error marking job as posted: {e}")
     finally:
         conn.close()
 
+# Stay under SQLite's default limit on bound parameters per statement
+SQL_BATCH_SIZE = 900
+
+def get_posted_keys(keys):
+    """
+    Returns the subset of job keys (see job_keys.job_key) already in posted_jobs,
+    using one connection and batched IN queries instead of a lookup per job.
+    """
+    keys = list(set(keys))
+    posted = set()
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        for start in range(0, len(keys), SQL_BATCH_SIZE):
+            batch = keys[start:start + SQL_BATCH_SIZE]
+            cursor.execute(
+                f"SELECT key FROM posted_jobs WHERE key IN ({','.join('?' * len(batch))})", batch
+            )
+            posted.update(row[0] for row in cursor.fetchall())
+    finally:
+        conn.close()
+    return posted
+
+def _salary_columns(pay):
+    if pay is None:
+        return (None, None, None, None)
+    return (pay.currency, pay.period, *pay.annual())
+
+def mark_jobs_posted(jobs):
+    """
+    Marks a batch of jobs as posted in a single transaction.
+    """
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.executemany(
+            'INSERT OR IGNORE INTO posted_jobs (key, id, url, company, role, source, location, country, remote, '
+            'posted_at, salary_currency, salary_period, salary_min, salary_max) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [
+                (job.key, job.id, job.url, job.company, job.role, job.source, job.location,
+                 job.place.country, int(job.place.remote),
+                 job.posted_dt.timestamp() if job.posted_dt else None,
+                 *_salary_columns(job.pay))
+                for job in jobs
+            ]
+        )
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error marking jobs as posted: {e}")
+    finally:
+        conn.close()
+
+def iter_job_history(since=None):
+    """
+    Yields posted_jobs rows as (id, company, role, source, location, country, remote,
+    posted_at, recorded_at) with both times as Unix seconds; posted_at is None when the
+    source gave no timestamp (and for rows posted before history was kept).
+    """
+    conn = sqlite3.connect(DB_FILE)
+    try:
+        query = (
+            "SELECT id, company, role, source, location, country, remote, posted_at, "
+            "CAST(strftime('%s', timestamp) AS REAL) FROM posted_jobs"
+        )
+        params = ()
+        if since is not None:
+            query += " WHERE timestamp >= datetime(?, 'unixepoch')"
+            params = (since,)
+        yield from conn.execute(query, params)
+    finally:
+        conn.close()
+
+def find_posted_jobs_by_salary(currency, minimum=None, maximum=None, since=None, limit=100):
+    """
+    Returns posted jobs paying in `currency` whose yearly range reaches `minimum` and starts
+    at or below `maximum`, as (id, company, role, url, salary_min, salary_max, salary_period),
+    best paid first. `since` limits to jobs recorded after a Unix time.
+
+    The threshold is a range scan on idx_posted_jobs_salary, so no salary text is parsed here.
+    """
+    conditions, params = ['salary_currency = ?', 'salary_max >= ?'], [currency, minimum or 0]
+    if maximum is not None:
+        conditions.append('(salary_min IS NULL OR salary_min <= ?)')
+        params.append(maximum)
+    if since is not None:
+        conditions.append("timestamp >= datetime(?, 'unixepoch')")
+        params.append(since)
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            'SELECT id, company, role, url, salary_min, salary_max, salary_period FROM posted_jobs '
+            f'WHERE {" AND ".join(conditions)} ORDER BY salary_max DESC LIMIT ?',
+            (*params, limit)
+        )
+        return cursor.fetchall()
+    except Exception as e:
+        logging.error(f"Error searching posted jobs by salary: {e}")
+        return []
+    finally:
+        conn.close()
+
+def _encode_job(job):
+    return json.dumps(job.to_dict())
+
+def _decode_job(payload):
+    return Job.from_dict(json.loads(payload))
+
+def queue_pending_jobs(jobs):
+    """
+    Stores scraped jobs until the next delivery run. Re-queuing a job refreshes it.
+    """
+    if not jobs:
+        return
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.executemany(
+            'INSERT OR REPLACE INTO pending_jobs (key, id, payload) VALUES (?, ?, ?)',
+            [(job.key, str(job.id), _encode_job(job)) for job in jobs]
+        )
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error queueing pending jobs: {e}")
+    finally:
+        conn.close()
+
+def iter_pending_jobs():
+    """
+    Yields queued jobs oldest first, decoding each row only as it is consumed.
+    """
+    conn = sqlite3.connect(DB_FILE)
+    try:
+        for row in conn.execute('SELECT payload FROM pending_jobs ORDER BY timestamp'):
+            yield _decode_job(row[0])
+    except Exception as e:
+        logging.error(f"Error reading pending jobs: {e}")
+    finally:
+        conn.close()
+
+def get_pending_jobs():
+    return list(iter_pending_jobs())
+
+def clear_pending_jobs(keys):
+    """
+    Removes delivered jobs from the queue by job key.
+    """
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.executemany('DELETE FROM pending_jobs WHERE key = ?', [(key,) for key in keys])
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error clearing pending jobs: {e}")
+    finally:
+        conn.close()
+
+def queue_digest_jobs(channel, jobs):
+    """
+    Holds delivered jobs for a channel's next daily digest (channels that can't be edited
+    in place don't get a digest per incremental delivery).
+    """
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.executemany(
+            'INSERT OR REPLACE INTO digest_queue (channel, key, payload) VALUES (?, ?, ?)',
+            [(channel, job.key, _encode_job(job)) for job in jobs]
+        )
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error queueing {channel} digest jobs: {e}")
+    finally:
+        conn.close()
+
+def get_digest_jobs(channel):
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute('SELECT payload FROM digest_queue WHERE channel = ? ORDER BY timestamp', (channel,))
+        return [_decode_job(row[0]) for row in cursor.fetchall()]
+    except Exception as e:
+        logging.error(f"Error reading {channel} digest jobs: {e}")
+        return []
+    finally:
+        conn.close()
+
+def clear_digest_jobs(channel, keys):
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.executemany('DELETE FROM digest_queue WHERE channel = ? AND key = ?', [(channel, key) for key in keys])
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error clearing {channel} digest jobs: {e}")
+    finally:
+        conn.close()
+
 def get_state(key, default=None):
     conn = sqlite3.connect(DB_FILE)
     cursor = conn.cursor()
@@ -67,3 +467,324 @@ def set_state(key, value):
     finally:
         conn.close()
 
+
+def get_cached_media(content_hash, channel, max_age_hours):
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "SELECT media_id FROM media_cache WHERE content_hash = ? AND channel = ? AND timestamp > datetime('now', ?)",
+            (content_hash, channel, f'-{int(max_age_hours)} hours')
+        )
+        result = cursor.fetchone()
+        return result[0] if result else None
+    except Exception as e:
+        logging.error(f"Error reading media cache for {channel}: {e}")
+        return None
+    finally:
+        conn.close()
+
+def cache_media(content_hash, channel, media_id):
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            'INSERT OR REPLACE INTO media_cache (content_hash, channel, media_id, timestamp) VALUES (?, ?, ?, CURRENT_TIMESTAMP)',
+            (content_hash, channel, media_id)
+        )
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error caching media for {channel}: {e}")
+    finally:
+        conn.close()
+
+def delete_cached_media(content_hash, channel):
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute('DELETE FROM media_cache WHERE content_hash = ? AND channel = ?', (content_hash, channel))
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error deleting media cache entry for {channel}: {e}")
+    finally:
+        conn.close()
+
+def get_cached_search(query_key, max_age_seconds):
+    """
+    Returns the cached result for a normalized query if younger than max_age_seconds.
+    """
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    now = time.time()
+    try:
+        cursor.execute(
+            'SELECT result FROM search_cache WHERE query_key = ? AND created_at > ?',
+            (query_key, now - max_age_seconds)
+        )
+        result = cursor.fetchone()
+        if result:
+            cursor.execute('UPDATE search_cache SET last_access = ? WHERE query_key = ?', (now, query_key))
+            conn.commit()
+        return result[0] if result else None
+    except Exception as e:
+        logging.error(f"Error reading search cache: {e}")
+        return None
+    finally:
+        conn.close()
+
+def cache_search(query_key, result, max_entries):
+    """
+    Stores a search result and evicts the least recently used entries beyond max_entries.
+    """
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    now = time.time()
+    try:
+        cursor.execute(
+            'INSERT OR REPLACE INTO search_cache (query_key, result, created_at, last_access) VALUES (?, ?, ?, ?)',
+            (query_key, result, now, now)
+        )
+        cursor.execute(
+            'DELETE FROM search_cache WHERE query_key NOT IN (SELECT query_key FROM search_cache ORDER BY last_access DESC LIMIT ?)',
+            (max_entries,)
+        )
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error writing search cache: {e}")
+    finally:
+        conn.close()
+
+def save_prefetched_guide(role, data, pdf_path, publish_date):
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            'INSERT OR REPLACE INTO prefetched_guides (role, data, pdf_path, publish_date, timestamp) VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)',
+            (role, data, pdf_path, publish_date)
+        )
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error saving prefetched guide for {role}: {e}")
+    finally:
+        conn.close()
+
+def get_prefetched_guide(role, max_age_days):
+    """
+    Returns the prebuilt guide for a role as a dict, or None if missing or older than max_age_days.
+    """
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "SELECT data, pdf_path, publish_date FROM prefetched_guides WHERE role = ? AND timestamp > datetime('now', ?)",
+            (role, f'-{int(max_age_days)} days')
+        )
+        result = cursor.fetchone()
+        if not result:
+            return None
+        return {'data': result[0], 'pdf_path': result[1], 'publish_date': result[2]}
+    except Exception as e:
+        logging.error(f"Error reading prefetched guide for {role}: {e}")
+        return None
+    finally:
+        conn.close()
+
+def delete_prefetched_guide(role):
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute('DELETE FROM prefetched_guides WHERE role = ?', (role,))
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error deleting prefetched guide for {role}: {e}")
+    finally:
+        conn.close()
+
+def add_bank_question(role, category, question, payload, shingles):
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            'INSERT INTO question_bank (role, category, question, payload, shingle_count) VALUES (?, ?, ?, ?, ?)',
+            (role, category, question, payload, len(shingles))
+        )
+        question_id = cursor.lastrowid
+        cursor.executemany(
+            'INSERT INTO question_shingles (shingle, question_id) VALUES (?, ?)',
+            [(shingle, question_id) for shingle in shingles]
+        )
+        conn.commit()
+        return question_id
+    except Exception as e:
+        logging.error(f"Error adding question to bank: {e}")
+        return None
+    finally:
+        conn.close()
+
+def find_similar_bank_questions(role, shingles):
+    """
+    Returns (question_id, shared_shingles, shingle_count) for bank questions of a role
+    that share at least one shingle with the given set.
+    """
+    if not shingles:
+        return []
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        placeholders = ','.join('?' * len(shingles))
+        cursor.execute(
+            f'''SELECT qs.question_id, COUNT(DISTINCT qs.shingle), qb.shingle_count
+                FROM question_shingles qs JOIN question_bank qb ON qb.id = qs.question_id
+                WHERE qs.shingle IN ({placeholders}) AND qb.role = ?
+                GROUP BY qs.question_id''',
+            (*shingles, role)
+        )
+        return cursor.fetchall()
+    except Exception as e:
+        logging.error(f"Error searching question bank: {e}")
+        return []
+    finally:
+        conn.close()
+
+def get_bank_questions(role, unused_since):
+    """
+    Returns (id, category, payload) for a role's bank questions not used since `unused_since`
+    (epoch seconds), least recently used first.
+    """
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            '''SELECT id, category, payload FROM question_bank
+               WHERE role = ? AND (last_used IS NULL OR last_used < ?)
+               ORDER BY COALESCE(last_used, 0), use_count, id''',
+            (role, unused_since)
+        )
+        return cursor.fetchall()
+    except Exception as e:
+        logging.error(f"Error reading question bank: {e}")
+        return []
+    finally:
+        conn.close()
+
+def mark_bank_questions_used(question_ids):
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        now = time.time()
+        cursor.executemany(
+            'UPDATE question_bank SET use_count = use_count + 1, last_used = ? WHERE id = ?',
+            [(now, question_id) for question_id in question_ids]
+        )
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error updating question bank usage: {e}")
+    finally:
+        conn.close()
+
+def get_artifact(key, kind):
+    """
+    Returns the stored path of an artifact and bumps its last access time, or None.
+    """
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute('SELECT path FROM artifacts WHERE key = ? AND kind = ?', (key, kind))
+        result = cursor.fetchone()
+        if result:
+            cursor.execute('UPDATE artifacts SET last_access = ? WHERE key = ? AND kind = ?', (time.time(), key, kind))
+            conn.commit()
+        return result[0] if result else None
+    except Exception as e:
+        logging.error(f"Error reading artifact index: {e}")
+        return None
+    finally:
+        conn.close()
+
+def record_artifact(key, kind, path, size):
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            'INSERT OR REPLACE INTO artifacts (key, kind, path, size, last_access) VALUES (?, ?, ?, ?, ?)',
+            (key, kind, path, size, time.time())
+        )
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error recording artifact {key[:12]}/{kind}: {e}")
+    finally:
+        conn.close()
+
+def delete_artifact(key, kind):
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute('DELETE FROM artifacts WHERE key = ? AND kind = ?', (key, kind))
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error deleting artifact {key[:12]}/{kind}: {e}")
+    finally:
+        conn.close()
+
+def evict_artifacts(max_bytes, keep_key=None):
+    """
+    Drops least recently used artifacts from the index until the total size fits max_bytes.
+    Entries for keep_key are never evicted. Returns the paths of the evicted artifacts.
+    """
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute('SELECT COALESCE(SUM(size), 0) FROM artifacts')
+        total = cursor.fetchone()[0]
+        if total <= max_bytes:
+            return []
+        cursor.execute(
+            'SELECT key, kind, path, size FROM artifacts WHERE key != ? ORDER BY last_access ASC',
+            (keep_key or '',)
+        )
+        evicted = []
+        for key, kind, path, size in cursor.fetchall():
+            if total <= max_bytes:
+                break
+            cursor.execute('DELETE FROM artifacts WHERE key = ? AND kind = ?', (key, kind))
+            evicted.append(path)
+            total -= size
+        conn.commit()
+        return evicted
+    except Exception as e:
+        logging.error(f"Error evicting artifacts: {e}")
+        return []
+    finally:
+        conn.close()
+
+def save_run(kind, started_at, duration, status, report):
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            'INSERT INTO runs (kind, started_at, duration, status, report) VALUES (?, ?, ?, ?, ?)',
+            (kind, started_at, duration, status, report)
+        )
+        conn.commit()
+    except Exception as e:
+        logging.error(f"Error saving {kind} run report: {e}")
+    finally:
+        conn.close()
+
+def get_recent_runs(kind=None, limit=10):
+    """
+    Returns the latest run reports (decoded JSON), newest first.
+    """
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    try:
+        if kind:
+            cursor.execute('SELECT report FROM runs WHERE kind = ? ORDER BY started_at DESC LIMIT ?', (kind, limit))
+        else:
+            cursor.execute('SELECT report FROM runs ORDER BY started_at DESC LIMIT ?', (limit,))
+        return [json.loads(row[0]) for row in cursor.fetchall()]
+    except Exception as e:
+        logging.error(f"Error reading run reports: {e}")
+        return []
+    finally:
+        conn.close()
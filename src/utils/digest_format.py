@@ -0,0 +1,77 @@
+from datetime import datetime, timezone
+
+# Telegram/WhatsApp hard limit is ~4096; keep headroom for markdown
+MESSAGE_SAFE_LENGTH = 3800
+
+# Digest section headers, one per region
+REMOTE_SECTION = "🌍 *REMOTE ROLES*\n──────────────\n"
+INDIA_SECTION = "🇮🇳 *INDIA ROLES*\n──────────────\n"
+
+def get_posted_time_str(posted_dt):
+    """
+    Returns relative string like '5 hours ago'
+    """
+    if not posted_dt:
+        return "recently"
+    # Ensure timezone aware
+    if posted_dt.tzinfo is None:
+        posted_dt = posted_dt.replace(tzinfo=timezone.utc)
+    
+    diff = datetime.now(timezone.utc) - posted_dt
+    hours = int(diff.total_seconds() // 3600)
+    if hours < 1:
+        minutes = int(diff.total_seconds() // 60)
+        return f"{minutes} mins ago" if minutes > 0 else "Just now"
+    elif hours < 24:
+        return f"{hours} hours ago"
+    else:
+        days = int(diff.total_seconds() // 86400)
+        return f"{days} days ago"
+
+def _format_entry(job, apply_line):
+    # Truncate title
+    title = job.role
+    if len(title) > 60:
+        title = title[:57] + "..."
+    
+    flag = job.place.flag
+    
+    # Calculate posted time string
+    posted_str = get_posted_time_str(job.posted_dt)
+    
+    # Basic salary if missing
+    salary = job.salary or 'Not disclosed'
+
+    msg_parts = [
+        f"*{title}*",
+        f"🏢 {job.company}",
+        f"{flag} {job.location}"
+    ]
+    
+    if posted_str != "recently":
+        msg_parts.append(f"🕐 {posted_str}")
+        
+    if salary != "Not disclosed":
+        msg_parts.append(f"💰 {salary}")
+        
+    msg_parts.append(apply_line)
+    
+    if job.source != "Google Jobs":
+        msg_parts.append(f"🏷️ {job.source}")
+
+    return "\n".join(msg_parts) + "\n\n"
+
+def format_job_entry(job):
+    """
+    Telegram entry (Markdown link).
+    """
+    return _format_entry(job, f"🔗 [Apply Now]({job.url})")
+
+def format_job_entry_wa(job):
+    """
+    WhatsApp entry (plain URL, WhatsApp does not render Markdown links).
+    """
+    return _format_entry(job, f"🔗 Apply: {job.url}")
+
+def format_footer(remote_count, india_count):
+    return f"\n🌍 {remote_count} Remote | 🇮🇳 {india_count} India | Total: {remote_count + india_count} jobs"
@@ -0,0 +1,151 @@
+import json
+import logging
+from datetime import datetime
+
+from src.utils import run_report
+from src.utils.db import get_state, set_state
+from src.utils.digest_format import (
+    MESSAGE_SAFE_LENGTH, REMOTE_SECTION, INDIA_SECTION, format_job_entry, format_footer
+)
+
+logger = logging.getLogger(__name__)
+
+CONTINUATION = "*(Continuation)*\n\n"
+
+# editMessageText errors after which the message has to be posted again
+MESSAGE_GONE_ERRORS = ("message to edit not found", "message can't be edited")
+
+def _load_json_state(key, default):
+    try:
+        return json.loads(get_state(key) or json.dumps(default))
+    except ValueError:
+        return default
+
+def _load_digest_state(today):
+    """
+    Returns today's digest state, or a fresh one if the stored digest belongs to an earlier day.
+    """
+    if get_state("digest_date") != today:
+        return {'message_ids': [], 'open_id': None, 'body': None, 'unsent': [], 'section': None, 'remote': 0, 'india': 0}
+    open_id = get_state("digest_open_message_id")
+    return {
+        'message_ids': _load_json_state("digest_message_ids", []),
+        'open_id': int(open_id) if open_id else None,
+        'body': get_state("digest_current_body"),
+        'unsent': _load_json_state("digest_unsent_parts", []),
+        'section': get_state("digest_section") or None,
+        'remote': int(get_state("digest_remote_count", 0)),
+        'india': int(get_state("digest_india_count", 0)),
+    }
+
+def _save_digest_state(today, state):
+    set_state("digest_date", today)
+    set_state("digest_message_ids", json.dumps(state['message_ids']))
+    set_state("digest_open_message_id", state['open_id'] or "")
+    set_state("digest_current_body", state['body'])
+    set_state("digest_unsent_parts", json.dumps(state['unsent']))
+    set_state("digest_section", state['section'] or "")
+    set_state("digest_remote_count", state['remote'])
+    set_state("digest_india_count", state['india'])
+
+def _edit_status(response):
+    """
+    'ok' for an edit that went through (or changed nothing), 'gone' when the message was
+    deleted or can no longer be edited, else 'failed' (a transient error worth retrying).
+    """
+    if response and response.get('ok'):
+        return 'ok'
+    description = ((response or {}).get('description') or '').lower()
+    if "message is not modified" in description:
+        return 'ok'
+    if any(error in description for error in MESSAGE_GONE_ERRORS):
+        return 'gone'
+    return 'failed'
+
+
+def publish_incremental_digest(bot, header, display_remote, display_india):
+    """
+    Appends new jobs to today's Telegram digest by editing its open (last) message in place.
+    A new message part is only sent once the size limit is reached. `header` opens the
+    day's first message, and a region's section header is repeated whenever the region
+    changes from the last entry posted.
+
+    Message ids, the body of the open part, and any parts that failed to send are tracked
+    in agent_state. Later runs keep appending and send the failed parts first, in order.
+    The open part is only reposted when Telegram reports it deleted or no longer editable;
+    after any other edit failure the next run edits it again.
+    """
+    if not display_remote and not display_india:
+        return 0
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    state = _load_digest_state(today)
+
+    if state['body'] is None:
+        state['body'] = header
+    state['remote'] += len(display_remote)
+    state['india'] += len(display_india)
+    footer = format_footer(state['remote'], state['india'])
+
+    # parts[0] continues the open message; further parts (starting with any left unsent
+    # by an earlier run) are new messages
+    parts = [state['body']] + state['unsent']
+
+    def add(text, starts_section=False):
+        if len(parts[-1]) + len(text) + len(footer) > MESSAGE_SAFE_LENGTH:
+            # Sections start a new message as they are; job lists get a continuation header
+            parts.append(text.lstrip("\n") if starts_section else CONTINUATION + text)
+        else:
+            parts[-1] += text
+
+    with run_report.stage("render"):
+        for section, title, section_jobs in (('remote', REMOTE_SECTION, display_remote),
+                                             ('india', INDIA_SECTION, display_india)):
+            if not section_jobs:
+                continue
+            if state['section'] != section:
+                add(("\n" if state['section'] else "") + title, starts_section=True)
+                state['section'] = section
+            for job in section_jobs:
+                add(format_job_entry(job))
+
+    calls = 0
+    sent = 0  # parts[:sent] are on the channel
+    for i, body in enumerate(parts):
+        # Only the last part carries the running totals
+        text = body + footer if i == len(parts) - 1 else body
+        if i == 0 and state['open_id'] is not None:
+            calls += 1
+            status = _edit_status(bot.edit_message(state['open_id'], text))
+            if status == 'ok':
+                sent = 1
+                continue
+            if status == 'failed':
+                # The message is still on the channel: edit it again next run rather than
+                # posting a duplicate
+                logger.error(f"Failed to edit digest message {state['open_id']}, retrying next run")
+                break
+            # Message deleted or no longer editable: repost the part as a new message
+            logger.warning(f"Digest message {state['open_id']} is gone, posting it again")
+            state['open_id'] = None
+
+        calls += 1
+        response = bot.send_message(text)
+        if not (response and response.get('ok')):
+            # This part and the ones after it are kept, in order, for the next run
+            logger.error(f"Failed to send digest part {i + 1}/{len(parts)}: {response}")
+            break
+        state['open_id'] = response['result']['message_id']
+        state['message_ids'].append(state['open_id'])
+        sent = i + 1
+
+    if sent:
+        state['body'], state['unsent'] = parts[sent - 1], parts[sent:]
+    else:
+        # Nothing went out: the next run edits the open message again, or posts the
+        # part as a new message if there is none (open_id is None)
+        state['body'], state['unsent'] = parts[0], parts[1:]
+    _save_digest_state(today, state)
+    logger.info(f"Incremental digest updated with {len(display_remote) + len(display_india)} jobs "
+                f"using {calls} API call(s), {len(state['unsent'])} part(s) left unsent")
+    return calls
@@ -0,0 +1,58 @@
+import sys
+from datetime import datetime
+
+from src.utils.locations import resolve_location
+from src.utils.salary import parse_salary, with_default_currency
+from src.utils.job_keys import job_key
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Job:
+    """
+    One scraped job posting.
+
+    Slotted so large batches stay compact. Values that repeat across a batch
+    (source, normalized location, company) are interned, and the location and
+    salary are parsed once here (`place` and `pay`, shared between jobs with the
+    same text; `pay` takes the country's or source's currency if the text names none). `key` identifies the posting for dedup (see job_keys.job_key).
+    """
+    __slots__ = (
+        'id', 'company', 'role', 'location', 'posted_time', 'salary', 'url', 'source', 'posted_dt',
+        'place', 'pay', 'key',
+    )
+
+    FIELDS = ('id', 'company', 'role', 'location', 'posted_time', 'salary', 'url', 'source', 'posted_dt')
+
+    def __init__(self, *, id, company, role, location, url, source,
+                 posted_time="Recently", salary="Not disclosed", posted_dt=None):
+        self.id = id
+        self.company = _intern(company)
+        self.role = role
+        self.location = _intern(location)
+        self.posted_time = posted_time
+        self.salary = salary
+        self.url = url
+        self.source = _intern(source)
+        self.posted_dt = posted_dt
+        self.place = resolve_location(self.location)
+        self.pay = with_default_currency(parse_salary(salary), self.place.country, self.source)
+        self.key = job_key(self.source, id)
+
+    def __repr__(self):
+        return f"Job(id={self.id!r}, company={self.company!r}, role={self.role!r}, location={self.location!r})"
+
+    def to_dict(self):
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        if isinstance(self.posted_dt, datetime):
+            data['posted_dt'] = self.posted_dt.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        data = {field: data[field] for field in cls.FIELDS if field in data}
+        if isinstance(data.get('posted_dt'), str):
+            data['posted_dt'] = datetime.fromisoformat(data['posted_dt'])
+        return cls(**data)
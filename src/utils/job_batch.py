@@ -0,0 +1,215 @@
+import numpy as np
+
+from src.utils.db import iter_job_history
+
+# Region buckets used by the digest sections
+REGIONS = ("India", "Remote", "Other", "Unknown")
+DAY_SECONDS = 86400
+
+
+def _region(country, remote):
+    if country == "India":
+        return "India"
+    if remote is None and country is None:
+        return "Unknown"  # posted before history was kept
+    return "Remote" if remote else "Other"
+
+
+class _Encoder:
+    """
+    Dictionary-encodes a categorical column: each distinct value gets the next integer code.
+    """
+
+    def __init__(self, categories=()):
+        self.codes = {value: code for code, value in enumerate(categories)}
+
+    def __call__(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes)
+        return code
+
+    def categories(self):
+        return np.array(list(self.codes), dtype=str)
+
+
+class JobBatch:
+    """
+    Columnar view of a batch of jobs (or the posted_jobs history) for analytics.
+
+    company, role, source and region are dictionary-encoded: `codes[name]` is an int32
+    array indexing into `categories[name]`. posted_at and recorded_at are float64 Unix
+    seconds (NaN when unknown); `times` is posted_at falling back to recorded_at.
+    Aggregations are NumPy bincounts over the codes, never per-job Python loops.
+    """
+    CATEGORICAL = ('company', 'role', 'source', 'region')
+
+    def __init__(self, ids, codes, categories, posted_at, recorded_at):
+        self.ids = ids
+        self.codes = codes
+        self.categories = categories
+        self.posted_at = posted_at
+        self.recorded_at = recorded_at
+        self.times = np.where(np.isnan(posted_at), recorded_at, posted_at)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def _from_rows(cls, rows):
+        # rows: (id, company, role, source, region, posted_at, recorded_at)
+        encoders = {name: _Encoder(REGIONS if name == 'region' else ()) for name in cls.CATEGORICAL}
+        ids, columns, posted_at, recorded_at = [], {name: [] for name in cls.CATEGORICAL}, [], []
+        for job_id, company, role, source, region, posted, recorded in rows:
+            ids.append(str(job_id))
+            columns['company'].append(encoders['company'](company or "Unknown"))
+            columns['role'].append(encoders['role'](role or "Unknown"))
+            columns['source'].append(encoders['source'](source or "Unknown"))
+            columns['region'].append(encoders['region'](region))
+            posted_at.append(np.nan if posted is None else posted)
+            recorded_at.append(np.nan if recorded is None else recorded)
+        return cls(
+            np.array(ids, dtype=str),
+            {name: np.array(values, dtype=np.int32) for name, values in columns.items()},
+            {name: encoder.categories() for name, encoder in encoders.items()},
+            np.array(posted_at, dtype=np.float64),
+            np.array(recorded_at, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_jobs(cls, jobs, recorded_at=None):
+        """
+        Builds a batch from Job records (e.g. one scrape), recorded at `recorded_at` (Unix seconds).
+        """
+        return cls._from_rows(
+            (job.id, job.company, job.role, job.source, _region(job.place.country, job.place.remote),
+             job.posted_dt.timestamp() if job.posted_dt else None, recorded_at)
+            for job in jobs
+        )
+
+    @classmethod
+    def from_db(cls, since=None):
+        """
+        Loads the posted_jobs history (optionally only rows recorded since a Unix time).
+        """
+        return cls._from_rows(
+            (job_id, company, role, source, _region(country, remote), posted_at, recorded_at)
+            for job_id, company, role, source, _, country, remote, posted_at, recorded_at
+            in iter_job_history(since)
+        )
+
+    def save(self, path):
+        """
+        Writes the batch as a compressed .npz (plain arrays, no pickling).
+        """
+        arrays = {'ids': self.ids, 'posted_at': self.posted_at, 'recorded_at': self.recorded_at}
+        for name in self.CATEGORICAL:
+            arrays[f'{name}_codes'] = self.codes[name]
+            arrays[f'{name}_categories'] = self.categories[name]
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                data['ids'],
+                {name: data[f'{name}_codes'] for name in cls.CATEGORICAL},
+                {name: data[f'{name}_categories'] for name in cls.CATEGORICAL},
+                data['posted_at'],
+                data['recorded_at'],
+            )
+
+    def column(self, name):
+        """
+        Decoded values of a categorical column.
+        """
+        return self.categories[name][self.codes[name]]
+
+    def where(self, mask):
+        """
+        The rows selected by a boolean mask, sharing this batch's categories.
+        """
+        return JobBatch(
+            self.ids[mask],
+            {name: codes[mask] for name, codes in self.codes.items()},
+            self.categories,
+            self.posted_at[mask],
+            self.recorded_at[mask],
+        )
+
+    def between(self, start=None, end=None):
+        mask = np.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= self.times >= start
+        if end is not None:
+            mask &= self.times < end
+        return self.where(mask)
+
+    def counts(self, name):
+        """
+        Job count per category of a column, as an array aligned with categories[name].
+        """
+        return np.bincount(self.codes[name], minlength=len(self.categories[name]))
+
+    def top(self, name, n=10):
+        """
+        The n most frequent values of a column as [(value, count)], most frequent first.
+        """
+        counts = self.counts(name)
+        n = min(n, np.count_nonzero(counts))
+        order = np.argpartition(-counts, n - 1)[:n] if n else np.array([], dtype=np.intp)
+        order = order[np.argsort(-counts[order], kind='stable')]
+        return [(str(self.categories[name][i]), int(counts[i])) for i in order]
+
+    def crosstab(self, rows, cols):
+        """
+        Counts for every (rows value, cols value) pair as a 2-D array
+        (categories[rows] x categories[cols]).
+        """
+        n_rows, n_cols = len(self.categories[rows]), len(self.categories[cols])
+        flat = self.codes[rows].astype(np.int64) * n_cols + self.codes[cols]
+        return np.bincount(flat, minlength=n_rows * n_cols).reshape(n_rows, n_cols)
+
+    def share(self, rows, cols):
+        """
+        crosstab normalized per row, e.g. share('role', 'region') is the remote/India split per role.
+        """
+        table = self.crosstab(rows, cols).astype(np.float64)
+        totals = table.sum(axis=1, keepdims=True)
+        return np.divide(table, totals, out=np.zeros_like(table), where=totals > 0)
+
+    def _periods(self, period_seconds):
+        known = ~np.isnan(self.times)
+        index = np.floor(self.times[known] / period_seconds).astype(np.int64)
+        start = index.min() if len(index) else 0
+        return known, index - start, start * period_seconds
+
+    def per_period(self, name, period_days=7):
+        """
+        Counts per period (weeks by default) and category: returns (period_starts, table)
+        where table[i, j] counts categories[name][j] in the period starting at period_starts[i].
+        Periods are aligned to the Unix epoch (Thursdays for weeks).
+        """
+        period = period_days * DAY_SECONDS
+        known, index, origin = self._periods(period)
+        n_periods = int(index.max()) + 1 if len(index) else 0
+        n_cats = len(self.categories[name])
+        flat = index * n_cats + self.codes[name][known]
+        table = np.bincount(flat, minlength=n_periods * n_cats).reshape(n_periods, n_cats)
+        return origin + np.arange(n_periods) * period, table
+
+    def rolling_counts(self, window_days=7, name=None):
+        """
+        Trailing window_days sums of daily counts: returns (day_starts, counts), with counts
+        1-D, or 2-D per category of `name` when given.
+        """
+        if name is None:
+            known, index, origin = self._periods(DAY_SECONDS)
+            daily = np.bincount(index, minlength=int(index.max()) + 1 if len(index) else 0)
+        else:
+            origin, daily = self.per_period(name, period_days=1)
+            origin = origin[0] if len(origin) else 0
+        cumulative = np.cumsum(daily, axis=0)
+        rolling = cumulative.copy()
+        rolling[window_days:] -= cumulative[:-window_days]
+        return origin + np.arange(len(daily)) * DAY_SECONDS, rolling
@@ -0,0 +1,101 @@
+import re
+import hashlib
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+# Query parameters that only track where a click came from; dropping them makes
+# links shared through different channels compare equal
+TRACKING_PARAMS = {
+    'gclid', 'fbclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid', '_hsenc', '_hsmi',
+    'ref', 'ref_src', 'referrer', 'source', 'src', 'trk', 'tracking_id',
+}
+TRACKING_PREFIXES = ('utm_',)
+
+# Hosts of the sources whose ids are (or whose postings link to) their own site
+SOURCE_HOSTS = {
+    'remoteok.com': 'RemoteOK',
+    'remoteok.io': 'RemoteOK',
+    'weworkremotely.com': 'WeWorkRemotely',
+    'remotive.com': 'Remotive',
+    'remotive.io': 'Remotive',
+    'workingnomads.com': 'WorkingNomads',
+}
+# Both APIs use plain integer ids, so a bare number alone doesn't tell them apart
+NUMERIC_ID_SOURCES = ('RemoteOK', 'Remotive')
+
+DUPLICATE_SLASHES_RE = re.compile(r'/{2,}')
+
+
+def _is_tracking(param):
+    param = param.lower()
+    return param in TRACKING_PARAMS or param.startswith(TRACKING_PREFIXES)
+
+
+def canonical_url(url):
+    """
+    Normalizes a job URL so variants of the same link compare equal. The scheme
+    becomes https, the host is lowercased without "www." or a default port, and
+    duplicate and trailing slashes are removed. Tracking parameters and the
+    fragment are dropped, and the remaining query parameters are sorted.
+    """
+    text = url.strip()
+    try:
+        parts = urlsplit(text)
+        host = (parts.hostname or '').rstrip('.')
+        port = parts.port
+    except ValueError:
+        return text
+    if host.startswith('www.'):
+        host = host[4:]
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    path = DUPLICATE_SLASHES_RE.sub('/', parts.path).rstrip('/')
+    params = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking(k))
+    query = f"?{urlencode(params)}" if params else ""
+    return f"https://{host}{path}{query}"
+
+
+def canonical_id(job_id):
+    """
+    A source's job id as text, canonicalized when the source uses URLs as ids.
+    """
+    text = str(job_id).strip()
+    if text[:8].lower().startswith(('http://', 'https://')):
+        return canonical_url(text)
+    return text
+
+
+def job_key(source, job_id):
+    """
+    Fixed-width key for a posting: the first 64 bits of a BLAKE2b hash of
+    (source, canonical id), as a signed integer so it fits an SQLite INTEGER.
+    With one posting per key and tens of thousands of postings, an accidental
+    collision (skipping a new job as already posted) has odds around 1e-10.
+    """
+    digest = hashlib.blake2b(f"{source}\x1f{canonical_id(job_id)}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def infer_sources(job_id, url=None):
+    """
+    Candidate sources for a posting stored without one (rows from before
+    sources were recorded). The answer comes from the id's or URL's host, or
+    from an id that is neither a URL nor a number, which is a SerpApi
+    job_id. A bare number with no recognizable URL could come from either
+    numeric-id source, so both are returned.
+    """
+    text = str(job_id).strip()
+    for link in (text, url or ''):
+        try:
+            host = (urlsplit(link.strip()).hostname or '').rstrip('.')
+        except ValueError:
+            continue
+        if host.startswith('www.'):
+            host = host[4:]
+        if host in SOURCE_HOSTS:
+            return (SOURCE_HOSTS[host],)
+    if text.isdigit():
+        return NUMERIC_ID_SOURCES
+    if text[:8].lower().startswith(('http://', 'https://')):
+        return ()
+    return ('Google Jobs',)
@@ -0,0 +1,133 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# Gazetteer: country -> (ISO code, region, aliases), city -> (country, aliases).
+# Aliases are matched case-insensitively as whole words; the canonical name is
+# what normalized locations display.
+COUNTRIES = {
+    "India": ("IN", "Asia", ["india", "bharat"]),
+    "United States": ("US", "North America", ["united states", "usa", "u.s.", "us"]),
+    "Canada": ("CA", "North America", ["canada"]),
+    "United Kingdom": ("GB", "Europe", ["united kingdom", "uk", "england", "great britain"]),
+    "Germany": ("DE", "Europe", ["germany", "deutschland"]),
+    "Netherlands": ("NL", "Europe", ["netherlands", "holland"]),
+    "France": ("FR", "Europe", ["france"]),
+    "Ireland": ("IE", "Europe", ["ireland"]),
+    "Spain": ("ES", "Europe", ["spain"]),
+    "Poland": ("PL", "Europe", ["poland"]),
+    "Singapore": ("SG", "Asia", ["singapore"]),
+    "United Arab Emirates": ("AE", "Asia", ["united arab emirates", "uae"]),
+    "Australia": ("AU", "Oceania", ["australia"]),
+}
+
+CITIES = {
+    "Bangalore": ("India", ["bangalore", "bengaluru"]),
+    "Hyderabad": ("India", ["hyderabad", "secunderabad"]),
+    "Mumbai": ("India", ["mumbai", "bombay", "navi mumbai"]),
+    "Chennai": ("India", ["chennai", "madras"]),
+    "Delhi": ("India", ["delhi", "new delhi", "delhi ncr"]),
+    "Pune": ("India", ["pune"]),
+    "Gurgaon": ("India", ["gurgaon", "gurugram"]),
+    "Noida": ("India", ["noida"]),
+    "Kolkata": ("India", ["kolkata", "calcutta"]),
+    "Ahmedabad": ("India", ["ahmedabad"]),
+    "Kochi": ("India", ["kochi", "cochin"]),
+    "Thiruvananthapuram": ("India", ["thiruvananthapuram", "trivandrum"]),
+    "Jaipur": ("India", ["jaipur"]),
+    "Chandigarh": ("India", ["chandigarh"]),
+    "Coimbatore": ("India", ["coimbatore"]),
+    "Indore": ("India", ["indore"]),
+    "New York": ("United States", ["new york", "nyc"]),
+    "San Francisco": ("United States", ["san francisco", "bay area"]),
+    "Seattle": ("United States", ["seattle"]),
+    "Austin": ("United States", ["austin"]),
+    "Toronto": ("Canada", ["toronto"]),
+    "London": ("United Kingdom", ["london"]),
+    "Berlin": ("Germany", ["berlin"]),
+    "Munich": ("Germany", ["munich", "münchen"]),
+    "Amsterdam": ("Netherlands", ["amsterdam"]),
+    "Paris": ("France", ["paris"]),
+    "Dublin": ("Ireland", ["dublin"]),
+    "Barcelona": ("Spain", ["barcelona"]),
+    "Warsaw": ("Poland", ["warsaw"]),
+    "Dubai": ("United Arab Emirates", ["dubai"]),
+    "Sydney": ("Australia", ["sydney"]),
+}
+
+REMOTE_FLAG = "🌍"
+UNKNOWN_FLAG = "📍"
+
+
+class Location(NamedTuple):
+    name: str                # normalized display label
+    country: Optional[str]   # canonical country name, None if not in the gazetteer
+    region: Optional[str]    # continent-level region ("Asia", "Europe", ...) or "Worldwide"
+    flag: str                # 🌍 for remote roles, else the country flag (📍 if unknown)
+    remote: bool
+
+    @property
+    def is_india(self):
+        return self.country == "India"
+
+
+def _country_flag(code):
+    # Regional indicator symbols: "IN" -> 🇮🇳
+    return ''.join(chr(0x1F1E6 + ord(ch) - ord('A')) for ch in code)
+
+
+def _build_aliases():
+    aliases = {}
+    for country, (_, _, names) in COUNTRIES.items():
+        for alias in names:
+            aliases[alias] = (None, country)
+    for city, (country, names) in CITIES.items():
+        for alias in names:
+            aliases[alias] = (city, country)
+    return aliases
+
+
+ALIASES = _build_aliases()
+# Longest alias first so "new delhi" wins over "delhi"; lookarounds instead of \b
+# because aliases like "u.s." end in punctuation
+ALIAS_RE = re.compile(
+    r'(?<![\w.])(' + '|'.join(re.escape(a) for a in sorted(ALIASES, key=len, reverse=True)) + r')(?![\w])'
+)
+
+
+@lru_cache(maxsize=4096)
+def resolve_location(location):
+    """
+    Resolves a raw or already normalized location string. Memoized: the same few
+    hundred strings account for nearly every posting in a batch.
+    """
+    if not location:
+        return Location("Unknown", None, None, UNKNOWN_FLAG, False)
+
+    loc_lower = location.lower()
+    city = country = None
+    for alias in ALIAS_RE.findall(loc_lower):
+        alias_city, alias_country = ALIASES[alias]
+        if alias_city:
+            # The first city decides; its country overrides a country named earlier
+            city, country = alias_city, alias_country
+            break
+        country = country or alias_country
+
+    if "remote" in loc_lower:
+        if country == "India":
+            name = "Remote — India"
+        elif "asia" in loc_lower:
+            name = "Remote — Asia"
+        elif "worldwide" in loc_lower:
+            name = "Remote — Worldwide"
+        else:
+            name = "Remote"
+        region = COUNTRIES[country][1] if country else ("Asia" if name == "Remote — Asia" else "Worldwide")
+        return Location(name, country, region, REMOTE_FLAG, True)
+
+    if country is None:
+        return Location(location.title(), None, None, UNKNOWN_FLAG, False)
+    code, region, _ = COUNTRIES[country]
+    # Known cities get their canonical name; otherwise keep the (more specific) original
+    return Location(city or location.title(), country, region, _country_flag(code), False)
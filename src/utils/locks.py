@@ -0,0 +1,27 @@
+import re
+import fcntl
+import logging
+from contextlib import contextmanager
+
+@contextmanager
+def job_lock(name):
+    """
+    Per-job, cross-process lock so the same job never overlaps with itself
+    while different jobs (e.g. two sources) can run side by side.
+    Yields True if the lock was acquired.
+    """
+    slug = re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+    lock_fd = open(f'/tmp/job_scraper_{slug}.lock', 'w')
+    try:
+        fcntl.lockf(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except IOError:
+        logging.warning(f"Job '{name}' is already running. Skipping this run.")
+        lock_fd.close()
+        yield False
+        return
+
+    try:
+        yield True
+    finally:
+        fcntl.lockf(lock_fd, fcntl.LOCK_UN)
+        lock_fd.close()
@@ -0,0 +1,54 @@
+import os
+import hashlib
+import logging
+from src.utils.config import WHATSAPP_MEDIA_TTL_HOURS, TELEGRAM_FILE_ID_TTL_HOURS
+from src.utils.db import get_cached_media, cache_media, delete_cached_media
+
+logger = logging.getLogger(__name__)
+
+# Channel name -> how long an uploaded media handle stays reusable
+MEDIA_TTL_HOURS = {
+    'whatsapp': WHATSAPP_MEDIA_TTL_HOURS,
+    'telegram': TELEGRAM_FILE_ID_TTL_HOURS,
+}
+
+def content_hash(document):
+    """
+    Returns the SHA-256 hex digest of an in-memory document (bytes) or of a file, read in chunks.
+    """
+    if isinstance(document, (bytes, bytearray)):
+        return hashlib.sha256(document).hexdigest()
+    digest = hashlib.sha256()
+    with open(document, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def read_document(document, filename=None):
+    """
+    Returns (filename, payload bytes) for a document given as bytes or as a file path,
+    so it is read once and the same buffer is hashed and uploaded.
+    """
+    if isinstance(document, (bytes, bytearray)):
+        if not filename:
+            raise ValueError("filename is required for in-memory documents")
+        return filename, bytes(document)
+    with open(document, 'rb') as f:
+        return filename or os.path.basename(document), f.read()
+
+def get_media_id(channel, digest):
+    """
+    Returns a previously uploaded media handle for this content, if still valid.
+    """
+    media_id = get_cached_media(digest, channel, MEDIA_TTL_HOURS[channel])
+    if media_id:
+        logger.info(f"Media cache hit for {channel} ({digest[:12]})")
+    return media_id
+
+def remember_media_id(channel, digest, media_id):
+    if media_id:
+        cache_media(digest, channel, media_id)
+
+def forget_media_id(channel, digest):
+    logger.info(f"Invalidating cached {channel} media for {digest[:12]}")
+    delete_cached_media(digest, channel)
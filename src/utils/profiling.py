@@ -0,0 +1,172 @@
+import io
+import os
+import time
+import pstats
+import cProfile
+import logging
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Set by enable() so spawned worker processes (the interview agent) profile too
+PROFILE_DIR_ENV = 'JOBSCRAPER_PROFILE_DIR'
+PROFILE_TOP_ENV = 'JOBSCRAPER_PROFILE_TOP'
+
+_session = None
+
+
+class ProfileSession:
+    """
+    cProfile stats, wall time and tracemalloc allocation growth accumulated per stage name.
+
+    In service mode the scheduler runs jobs on a thread pool, so each thread keeps its
+    own stack of open stages and its own profiler per stage; they are merged in finish().
+    Traced memory is process-wide, so stages running at the same time share their peaks.
+    """
+
+    def __init__(self, output_dir, top_n):
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.profiles = {}  # stage name -> {thread id: cProfile.Profile}
+        self.wall = Counter()
+        self.calls = Counter()
+        self.peaks = Counter()
+        self.allocations = {}
+
+    @property
+    def active(self):
+        # (name, profiler, traced memory at entry) of this thread's open stages, innermost last
+        stack = getattr(self.local, 'active', None)
+        if stack is None:
+            stack = self.local.active = []
+        return stack
+
+
+def enable(output_dir, label, top_n=20):
+    """
+    Turns on profiling for this process; stage output goes to output_dir/label/.
+    """
+    global _session
+    os.environ[PROFILE_DIR_ENV] = output_dir
+    os.environ[PROFILE_TOP_ENV] = str(top_n)
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(1)
+    _session = ProfileSession(os.path.join(output_dir, label), top_n)
+    logger.info(f"Profiling enabled, writing stage profiles to {_session.output_dir}")
+
+
+def enable_from_env(label):
+    """
+    Enables profiling in a worker process if the parent was started with --profile.
+    """
+    output_dir = os.getenv(PROFILE_DIR_ENV)
+    if output_dir:
+        enable(output_dir, label, int(os.getenv(PROFILE_TOP_ENV, 20)))
+
+
+def _snapshot():
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+
+
+def _record_peak(session, name, baseline):
+    _, peak = tracemalloc.get_traced_memory()
+    session.peaks[name] = max(session.peaks[name], peak - baseline)
+
+
+@contextmanager
+def profile(name):
+    """
+    Profiles the enclosed block under a stage name when profiling is enabled.
+    Stages can nest (fetch.<source> inside scrape.<source>, render inside send.<channel>).
+    Only one cProfile profiler can be active per thread, so the enclosing stage's
+    profiler is paused while a nested stage runs: function stats go to the innermost
+    stage, while wall time, peak memory and allocations include nested stages.
+    """
+    session = _session
+    if session is None:
+        yield
+        return
+
+    outer = session.active[-1] if session.active else None
+    if outer is not None:
+        outer[1].disable()
+        # reset_peak() below would drop the enclosing stage's peak so far
+        with session.lock:
+            _record_peak(session, outer[0], outer[2])
+
+    with session.lock:
+        profiler = session.profiles.setdefault(name, {}).setdefault(threading.get_ident(), cProfile.Profile())
+    before = _snapshot()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    session.active.append((name, profiler, baseline))
+    started = time.perf_counter()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        session.active.pop()
+        growth = _snapshot().compare_to(before, 'lineno')
+        with session.lock:
+            session.wall[name] += time.perf_counter() - started
+            session.calls[name] += 1
+            _record_peak(session, name, baseline)
+            allocations = session.allocations.setdefault(name, Counter())
+            for stat in growth:
+                if stat.size_diff > 0:
+                    frame = stat.traceback[0]
+                    allocations[f"{frame.filename}:{frame.lineno}"] += stat.size_diff
+            if outer is not None:
+                _record_peak(session, outer[0], outer[2])
+        if outer is not None:
+            outer[1].enable()
+
+
+def _slug(name):
+    return ''.join(ch if ch.isalnum() or ch in '.-' else '_' for ch in name)
+
+
+def finish():
+    """
+    Writes one <stage>.prof file (pstats format, e.g. for snakeviz) per stage and a
+    summary.txt with wall time, peak traced memory, the top functions by cumulative
+    time and the top allocation sites of each stage. Returns the summary path.
+    """
+    global _session
+    session, _session = _session, None
+    if session is None:
+        return None
+
+    os.makedirs(session.output_dir, exist_ok=True)
+    lines = [f"Stage profiles ({len(session.profiles)} stage(s)), slowest first", ""]
+    for name in sorted(session.profiles, key=lambda n: session.wall[n], reverse=True):
+        stream = io.StringIO()
+        stats = pstats.Stats(*session.profiles[name].values(), stream=stream)
+        stats.dump_stats(os.path.join(session.output_dir, f"{_slug(name)}.prof"))
+
+        lines.append(f"== {name}: {session.wall[name]:.3f}s over {session.calls[name]} call(s), "
+                     f"peak +{session.peaks[name] / 1024:.1f} KiB traced")
+        stats.sort_stats('cumulative').print_stats(session.top_n)
+        lines.append(stream.getvalue().strip())
+        lines.append("")
+        lines.append(f"Top {session.top_n} allocation sites (bytes still held after the stage):")
+        for site, size in session.allocations[name].most_common(session.top_n):
+            lines.append(f"  {size / 1024:10.1f} KiB  {site}")
+        lines.append("")
+
+    summary_path = os.path.join(session.output_dir, "summary.txt")
+    with open(summary_path, 'w') as f:
+        f.write("\n".join(lines) + "\n")
+    tracemalloc.stop()
+    logger.info(f"Profile summary written to {summary_path}")
+    return summary_path
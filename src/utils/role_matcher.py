@@ -0,0 +1,98 @@
+import re
+from functools import lru_cache
+
+from src.utils.config import ROLE_CATEGORIES
+
+# Keywords this short only match whole words ("dev" is not "Device", "qa" is not "Qatar")
+WHOLE_WORD_MAX_LENGTH = 3
+WORD_END = '(?![a-z])'
+
+
+def _keyword_pattern(keyword):
+    pattern = re.escape(keyword)
+    return pattern + WORD_END if len(keyword) <= WHOLE_WORD_MAX_LENGTH else pattern
+
+
+def _trie_pattern(words):
+    """
+    Regex alternation for words with common prefixes factored out, so the engine
+    walks one branch per character instead of retrying every keyword.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def render(node, depth):
+        branches = [re.escape(ch) + render(child, depth + 1) for ch, child in sorted(node.items()) if ch]
+        if '' in node and depth <= WHOLE_WORD_MAX_LENGTH:
+            # A short keyword ends here: tried after the longer ones, and only at a word end
+            branches.append(WORD_END)
+        elif not branches:
+            return ''
+        elif '' in node:
+            # Optional when a keyword ends here; greedy, so the longest keyword wins
+            body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+            return f"(?:{body})?"
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+    return render(trie, 0)
+
+
+class RoleMatcher:
+    """
+    Matches job titles and tags against keyword categories in one regex pass.
+
+    Keywords match case-insensitively at the start of a word ("engineer" matches
+    "Engineers", "qa" does not match "Aqua"); keywords of up to WHOLE_WORD_MAX_LENGTH
+    characters must also end a word ("dev" does not match "Device"). Every category whose keyword occurs
+    in the text is returned, including keywords nested in a longer match
+    ("software engineer" also counts as "engineer").
+    """
+
+    def __init__(self, categories):
+        keyword_categories = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                keyword_categories.setdefault(keyword.lower(), set()).add(category)
+
+        # The regex consumes the longest keyword at each word start; fold in the
+        # categories of shorter keywords that start at a word inside it.
+        self.keyword_categories = {}
+        for keyword in keyword_categories:
+            found = set()
+            for other, other_categories in keyword_categories.items():
+                if re.search(r'(?<![a-z0-9])' + _keyword_pattern(other), keyword):
+                    found |= other_categories
+            self.keyword_categories[keyword] = frozenset(found)
+
+        # A lookbehind rather than \b: it keeps the regex's first-character scan fast
+        self.pattern = re.compile(r'(?<![a-z0-9])(?:' + _trie_pattern(keyword_categories) + ')')
+
+    def categories(self, text):
+        return frozenset().union(*map(self.keyword_categories.__getitem__, self.pattern.findall(text.lower())))
+
+
+_matcher = RoleMatcher(ROLE_CATEGORIES)
+
+
+@lru_cache(maxsize=4096)
+def _text_categories(text):
+    # Titles and tags repeat heavily across a batch ("Senior Software Engineer", "dev")
+    return _matcher.categories(text)
+
+
+def role_categories(title, tags=()):
+    """
+    Every ROLE_CATEGORIES category matched by a job title or any of its tags.
+    """
+    found = _text_categories(title or '')
+    for tag in tags:
+        found = found | _text_categories(str(tag))
+    return found
+
+
+def is_relevant_role(title, tags=()):
+    return bool(role_categories(title, tags))
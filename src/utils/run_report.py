@@ -0,0 +1,238 @@
+import os
+import json
+import time
+import logging
+import contextvars
+from collections import Counter
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from src.utils import profiling
+from src.utils.config import METRICS_TEXTFILE_DIR
+from src.utils.db import save_run
+
+logger = logging.getLogger(__name__)
+
+# The report of the run in progress in this thread/process; None outside a run, where
+# every recording helper below is a no-op.
+_current = contextvars.ContextVar('run_report', default=None)
+
+
+class RunReport:
+    """
+    Per-stage timings, counters and API call statistics for one run.
+    """
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.started_at = time.time()
+        self.finished_at = None
+        self.status = 'running'
+        self.error = None
+        self.stages = Counter()
+        self.counters = Counter()
+        self.api = {}
+
+    def _api(self, name):
+        if name not in self.api:
+            self.api[name] = {'calls': 0, 'errors': 0, 'retries': 0, 'latencies': []}
+        return self.api[name]
+
+    def to_dict(self):
+        api = {}
+        for name, stats in self.api.items():
+            latencies = sorted(stats['latencies'])
+            api[name] = {
+                'calls': stats['calls'],
+                'errors': stats['errors'],
+                'retries': stats['retries'],
+                'total_seconds': round(sum(latencies), 4),
+                'p50_seconds': round(_percentile(latencies, 50), 4),
+                'p95_seconds': round(_percentile(latencies, 95), 4),
+                'max_seconds': round(latencies[-1], 4) if latencies else 0.0,
+            }
+        finished_at = self.finished_at or time.time()
+        return {
+            'kind': self.kind,
+            'status': self.status,
+            'error': self.error,
+            'started_at': self.started_at,
+            'finished_at': finished_at,
+            'duration_seconds': round(finished_at - self.started_at, 4),
+            'stages': {name: round(seconds, 4) for name, seconds in self.stages.items()},
+            'counters': dict(self.counters),
+            'api': api,
+        }
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def current():
+    return _current.get()
+
+
+@contextmanager
+def start_run(kind):
+    """
+    Collects a report for the enclosed run, then logs it as JSON, stores it in the runs
+    table and, if METRICS_TEXTFILE_DIR is set, writes it as a Prometheus textfile.
+    Nested calls join the run already in progress.
+    """
+    report = _current.get()
+    if report is not None:
+        yield report
+        return
+
+    report = RunReport(kind)
+    token = _current.set(report)
+    try:
+        yield report
+        if report.status == 'running':
+            report.status = 'succeeded'
+    except Exception as e:
+        report.status = 'failed'
+        report.error = str(e)
+        raise
+    finally:
+        _current.reset(token)
+        report.finished_at = time.time()
+        _publish(report)
+
+
+def _publish(report):
+    data = report.to_dict()
+    payload = json.dumps(data, sort_keys=True)
+    logger.info(f"Run report: {payload}")
+    save_run(report.kind, report.started_at, data['duration_seconds'], report.status, payload)
+    if METRICS_TEXTFILE_DIR:
+        try:
+            write_prometheus_textfile(data, METRICS_TEXTFILE_DIR)
+        except OSError as e:
+            logger.error(f"Failed to write metrics textfile: {e}")
+
+
+@contextmanager
+def stage(name):
+    """
+    Adds the wall time of the enclosed block to a named stage (stages can repeat).
+    Under run.py --profile the block is also CPU- and allocation-profiled.
+    """
+    report = _current.get()
+    started = time.perf_counter()
+    try:
+        with profiling.profile(name):
+            yield
+    finally:
+        if report is not None:
+            report.stages[name] += time.perf_counter() - started
+
+
+def stage_seconds(name):
+    report = _current.get()
+    return report.stages[name] if report is not None else 0.0
+
+
+def add_stage_time(name, seconds):
+    report = _current.get()
+    if report is not None:
+        report.stages[name] += seconds
+
+
+def incr(name, amount=1):
+    report = _current.get()
+    if report is not None:
+        report.counters[name] += amount
+
+
+@contextmanager
+def api_call(name):
+    """
+    Times one API request. An exception, or setting `call.ok = False` on the yielded
+    object, counts the call as an error.
+    """
+    report = _current.get()
+    call = SimpleNamespace(ok=True)
+    started = time.perf_counter()
+    try:
+        yield call
+    except Exception:
+        call.ok = False
+        raise
+    finally:
+        if report is not None:
+            stats = report._api(name)
+            stats['calls'] += 1
+            stats['latencies'].append(time.perf_counter() - started)
+            if not call.ok:
+                stats['errors'] += 1
+
+
+def record_retry(name):
+    report = _current.get()
+    if report is not None:
+        report._api(name)['retries'] += 1
+
+
+def _metric_name(name):
+    return ''.join(ch if ch.isalnum() else '_' for ch in name)
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def write_prometheus_textfile(data, directory):
+    """
+    Writes a run report in Prometheus text format for node_exporter's textfile collector,
+    one file per run kind so the scraper and agent processes don't overwrite each other.
+    """
+    kind = _label(data['kind'])
+    lines = [
+        "# HELP jobscraper_run_duration_seconds Wall time of the last run.",
+        "# TYPE jobscraper_run_duration_seconds gauge",
+        f'jobscraper_run_duration_seconds{{kind="{kind}"}} {data["duration_seconds"]}',
+        "# HELP jobscraper_run_success Whether the last run succeeded.",
+        "# TYPE jobscraper_run_success gauge",
+        f'jobscraper_run_success{{kind="{kind}"}} {1 if data["status"] == "succeeded" else 0}',
+        "# HELP jobscraper_run_finished_timestamp_seconds Unix time the last run finished.",
+        "# TYPE jobscraper_run_finished_timestamp_seconds gauge",
+        f'jobscraper_run_finished_timestamp_seconds{{kind="{kind}"}} {data["finished_at"]:.3f}',
+        "# HELP jobscraper_stage_seconds Time spent per stage in the last run.",
+        "# TYPE jobscraper_stage_seconds gauge",
+    ]
+    for name, seconds in sorted(data['stages'].items()):
+        lines.append(f'jobscraper_stage_seconds{{kind="{kind}",stage="{_label(name)}"}} {seconds}')
+    lines += [
+        "# HELP jobscraper_run_count Counters recorded during the last run.",
+        "# TYPE jobscraper_run_count gauge",
+    ]
+    for name, value in sorted(data['counters'].items()):
+        lines.append(f'jobscraper_run_count{{kind="{kind}",name="{_label(name)}"}} {value}')
+    for field in ('calls', 'errors', 'retries'):
+        lines += [
+            f"# HELP jobscraper_api_{field} API {field} in the last run.",
+            f"# TYPE jobscraper_api_{field} gauge",
+        ]
+        for name, stats in sorted(data['api'].items()):
+            lines.append(f'jobscraper_api_{field}{{kind="{kind}",api="{_label(name)}"}} {stats[field]}')
+    lines += [
+        "# HELP jobscraper_api_latency_seconds API latency quantiles in the last run.",
+        "# TYPE jobscraper_api_latency_seconds gauge",
+    ]
+    for name, stats in sorted(data['api'].items()):
+        for quantile, key in (('0.5', 'p50_seconds'), ('0.95', 'p95_seconds'), ('1', 'max_seconds')):
+            lines.append(f'jobscraper_api_latency_seconds{{kind="{kind}",api="{_label(name)}",quantile="{quantile}"}} {stats[key]}')
+
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"jobscraper_{_metric_name(data['kind'])}.prom")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write("\n".join(lines) + "\n")
+    # Atomic rename so the collector never reads a partial file
+    os.replace(tmp_path, path)
+    return path
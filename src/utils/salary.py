@@ -0,0 +1,192 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+NOT_DISCLOSED = "Not disclosed"
+
+# Currency markers in lowercased text: symbols anywhere, codes and words as whole words
+CURRENCY_SYMBOL_MARKERS = {"us$": "USD", "c$": "CAD", "a$": "AUD", "s$": "SGD", "$": "USD", "€": "EUR", "£": "GBP", "₹": "INR"}
+CURRENCY_WORD_MARKERS = {
+    "usd": "USD", "eur": "EUR", "gbp": "GBP", "inr": "INR", "cad": "CAD", "aud": "AUD", "sgd": "SGD",
+    "aed": "AED", "rs": "INR", "lpa": "INR", "lakh": "INR", "lakhs": "INR", "lac": "INR", "lacs": "INR",
+    "cr": "INR", "crore": "INR", "crores": "INR",
+}
+CURRENCY_RE = re.compile(
+    '|'.join(re.escape(m) for m in sorted(CURRENCY_SYMBOL_MARKERS, key=len, reverse=True))
+    + r'|(?<![a-z])(?:' + '|'.join(CURRENCY_WORD_MARKERS) + r')(?![a-z])'
+    # "18lpa", "25lakh": word markers glued to the amount
+    + r'|(?<=\d)(?:lpa|lakhs?|lacs?|crores?)(?![a-z])'
+)
+CURRENCY_SYMBOLS = {"USD": "$", "EUR": "€", "GBP": "£", "INR": "₹", "CAD": "C$", "AUD": "A$", "SGD": "S$"}
+
+# Currency assumed when the salary text names none ("50K–70K a year"): the job's country's,
+# else the source's (the remote boards are US-based and post in USD)
+COUNTRY_CURRENCIES = {
+    "India": "INR", "United States": "USD", "Canada": "CAD", "United Kingdom": "GBP", "Germany": "EUR",
+    "Netherlands": "EUR", "France": "EUR", "Ireland": "EUR", "Spain": "EUR", "Poland": "PLN",
+    "Singapore": "SGD", "United Arab Emirates": "AED", "Australia": "AUD",
+}
+SOURCE_CURRENCIES = {"RemoteOK": "USD", "Remotive": "USD", "WeWorkRemotely": "USD", "WorkingNomads": "USD"}
+
+# Amount suffixes ("80k", "25L", "1.2 cr", "18 LPA")
+MULTIPLIERS = {
+    'k': 1e3, 'm': 1e6, 'l': 1e5, 'lpa': 1e5, 'lakh': 1e5, 'lakhs': 1e5, 'lac': 1e5, 'lacs': 1e5,
+    'cr': 1e7, 'crore': 1e7, 'crores': 1e7,
+}
+# Indian units: an amount in lakhs or crores is in rupees even without "₹" or "Rs"
+INR_SUFFIXES = {'l', 'lpa', 'lakh', 'lakhs', 'lac', 'lacs', 'cr', 'crore', 'crores'}
+AMOUNT_RE = re.compile(r'(?<![\d.,])(\d[\d,]*(?:\.\d+)?)\s*(k|m|lpa|lakhs?|lacs?|l|crores?|cr)?(?![a-z\d])')
+
+PERIOD_RE = re.compile(
+    r'(?<![a-z])(?:(hour|hr|h|hourly)|(day|daily)|(week|wk|weekly)|(month|mo|monthly|pm)'
+    r'|(year|yr|yearly|annum|annual|annually|pa|lpa))s?(?![a-z])'
+)
+# A pay rate ("an hour", "per month", "/yr", "hourly"), as opposed to a duration ("2-5 years")
+RATE_RE = re.compile(
+    r'(?:\bper|\ban?|/)\s*(?:hour|hr|h|day|week|wk|month|mo|year|yr|annum)(?![a-z])'
+    r'|(?<![a-z])(?:hourly|daily|weekly|monthly|yearly|annually|annual)(?![a-z])'
+)
+# A number of units ("2-5 years", "10-20 hours per week"): a duration or a count, not pay
+DURATION_RE = re.compile(r'\d\+?\s*(?:hours|hrs|days|weeks|months|years|yrs)(?![a-z])')
+# Below this, a bare number without a currency, unit or rate is not taken as a salary
+MIN_BARE_AMOUNT = 1000
+PERIODS = ('hour', 'day', 'week', 'month', 'year')
+# Paid units per year, for comparing ranges across periods
+PERIODS_PER_YEAR = {'hour': 2080, 'day': 260, 'week': 52, 'month': 12, 'year': 1}
+
+
+class Salary(NamedTuple):
+    currency: Optional[str]  # ISO 4217 code, None if the text names no currency
+    min: Optional[float]     # in `period` units; None for "up to X"
+    max: float
+    period: str              # 'hour', 'day', 'week', 'month' or 'year'
+
+    def annual(self):
+        """
+        (min, max) per year, so ranges posted per hour or month compare with yearly ones.
+        """
+        factor = PERIODS_PER_YEAR[self.period]
+        return (None if self.min is None else self.min * factor), self.max * factor
+
+
+def _currency(text):
+    match = CURRENCY_RE.search(text)
+    if match is None:
+        return None
+    marker = match.group()
+    return CURRENCY_SYMBOL_MARKERS.get(marker) or CURRENCY_WORD_MARKERS[marker]
+
+
+def _number(digits):
+    return float(digits.replace(',', ''))
+
+
+@lru_cache(maxsize=4096)
+def _parse_text(text):
+    lowered = text.lower()
+    amounts = AMOUNT_RE.findall(lowered)[:2]
+    if not amounts:
+        return None
+
+    multipliers = [MULTIPLIERS.get(suffix, 1) for _, suffix in amounts]
+    values = []
+    for (digits, suffix), multiplier in zip(amounts, multipliers):
+        if not suffix and max(multipliers) > 1 and _number(digits) < 1000:
+            # "$80 - 120k": the bare end of a range shares the other end's unit
+            multiplier = max(multipliers)
+        values.append(_number(digits) * multiplier)
+    if not any(values):
+        return None
+
+    suffixes = {suffix for _, suffix in amounts if suffix}
+    currency = _currency(lowered) or ('INR' if suffixes & INR_SUFFIXES else None)
+    if currency is None and not suffixes and max(values) < MIN_BARE_AMOUNT and (
+            DURATION_RE.search(lowered) or not RATE_RE.search(lowered)):
+        # Small bare numbers with nothing marking them as pay ("2-5 years experience")
+        return None
+
+    period_match = PERIOD_RE.search(lowered)
+    if period_match:
+        period = PERIODS[period_match.lastindex - 1]
+    else:
+        # Feeds leave the period out of yearly ranges; small bare amounts are hourly rates
+        period = 'hour' if max(values) < 1000 else 'year'
+
+    low, high = min(values), max(values)
+    if low < high / 10:
+        # Not a range: the second number is something else ("$100k + 0.5% equity")
+        low = high = values[0]
+    if len(values) == 1 and 'up to' in lowered:
+        low = None
+    return Salary(currency, low, high, period)
+
+
+def parse_salary(value):
+    """
+    Parses a salary as sources publish it ("$80k - $120k", "₹25L - ₹40L", "$50 - $70 an hour",
+    "18 LPA", "€4,000/month") into a Salary, or None when it names no amount
+    ("Not disclosed", "Competitive").
+
+    A single amount is both min and max ("$100k+" guarantees $100k); "up to X" has no min.
+    Lakh and crore amounts are in INR. A small bare number needs a rate ("15 - 20 an hour"),
+    so durations and counts ("2-5 years experience") are not salaries.
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return Salary(None, float(value), float(value), 'year') if value > 0 else None
+    return _parse_text(str(value))
+
+
+def default_currency(country, source):
+    return COUNTRY_CURRENCIES.get(country) or SOURCE_CURRENCIES.get(source)
+
+
+def with_default_currency(salary, country, source):
+    """
+    Fills in the currency of a salary whose text names none from the job's country or
+    source (see COUNTRY_CURRENCIES), so it is found by currency searches.
+    """
+    if salary is None or salary.currency is not None:
+        return salary
+    currency = default_currency(country, source)
+    return salary._replace(currency=currency) if currency else salary
+
+
+def from_range(low, high, currency, period='year'):
+    """
+    Builds a Salary from numeric API fields, where 0 or a missing value means not given.
+    """
+    low = float(low) if low else None
+    high = float(high) if high else low
+    if high is None:
+        return None
+    return Salary(currency, low, high, period)
+
+
+def _format_amount(amount, currency):
+    if currency == "INR" and amount >= 1e5:
+        return f"{amount / 1e5:g}L"
+    if amount >= 1e3:
+        return f"{amount / 1e3:g}k"
+    return f"{amount:g}"
+
+
+def format_salary(salary):
+    """
+    Display text for a Salary in the digest's style ("$80k - $120k", "₹25L", "$60 - $80 / hour").
+    """
+    if salary is None:
+        return NOT_DISCLOSED
+    symbol = CURRENCY_SYMBOLS.get(salary.currency, "")
+    code = "" if symbol or not salary.currency else f" {salary.currency}"
+    high = f"{symbol}{_format_amount(salary.max, salary.currency)}"
+    if salary.min is None:
+        text = f"Up to {high}"
+    elif salary.min == salary.max:
+        text = high
+    else:
+        text = f"{symbol}{_format_amount(salary.min, salary.currency)} - {high}"
+    # Yearly is implied, except for amounts small enough to read as hourly
+    suffix = "" if salary.period == 'year' and salary.max >= 1000 else f" / {salary.period}"
+    return f"{text}{code}{suffix}"
@@ -4,9 +4,24 @@ import requests
 import logging
 import time
 from dotenv import load_dotenv
+from src.utils.config import TELEGRAM_API_BASE
+from src.utils import run_report
+from src.utils.media_cache import content_hash, read_document, get_media_id, remember_media_id, forget_media_id
 
 load_dotenv()
 
+def retry_delay(error, attempt):
+    """
+    Seconds to wait before retrying: Telegram's retry_after on 429, else exponential backoff.
+    """
+    response = getattr(error, 'response', None)
+    if response is not None and response.status_code == 429:
+        try:
+            return float(response.json().get('parameters', {}).get('retry_after', 2 ** attempt))
+        except ValueError:
+            pass
+    return 2 ** attempt
+
 class TelegramBot:
     def __init__(self):
         self.token = os.getenv('TELEGRAM_BOT_TOKEN')
@@ -17,7 +32,7 @@ class TelegramBot:
         if not chat_id:
             chat_id = self.channel_id
         
-        url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+        url = f"{TELEGRAM_API_BASE}/bot{self.token}/sendMessage"
         payload = {
             'chat_id': chat_id,
             'text': text,
@@ -26,13 +41,17 @@ class TelegramBot:
         }
         
         for attempt in range(retries):
+            if attempt:
+                run_report.record_retry('telegram.sendMessage')
             try:
-                response = requests.post(url, json=payload, timeout=10)
-                response.raise_for_status()
+                with run_report.api_call('telegram.sendMessage'):
+                    response = requests.post(url, json=payload, timeout=10)
+                    response.raise_for_status()
+                run_report.incr('messages_sent.telegram')
                 return response.json()
             except requests.exceptions.RequestException as e:
                 logging.warning(f"Failed to send message (attempt {attempt+1}/{retries}): {e}")
-                time.sleep(2 ** attempt)
+                time.sleep(retry_delay(e, attempt))
         
         logging.error(f"Failed to send Telegram message after {retries} attempts")
         return None
@@ -41,7 +60,7 @@ class TelegramBot:
         if not chat_id:
             chat_id = self.channel_id
             
-        url = f"https://api.telegram.org/bot{self.token}/editMessageText"
+        url = f"{TELEGRAM_API_BASE}/bot{self.token}/editMessageText"
         payload = {
             'chat_id': chat_id,
             'message_id': message_id,
@@ -51,13 +70,25 @@ class TelegramBot:
         }
         
         for attempt in range(retries):
+            if attempt:
+                run_report.record_retry('telegram.editMessageText')
             try:
-                response = requests.post(url, json=payload, timeout=10)
-                response.raise_for_status()
+                with run_report.api_call('telegram.editMessageText'):
+                    response = requests.post(url, json=payload, timeout=10)
+                    response.raise_for_status()
+                run_report.incr('messages_edited.telegram')
                 return response.json()
             except requests.exceptions.RequestException as e:
+                error = getattr(e, 'response', None)
+                if error is not None and error.status_code == 400:
+                    # Not retryable (e.g. the message was deleted); the caller reads the description
+                    logging.warning(f"Telegram refused to edit message {message_id}: {error.text}")
+                    try:
+                        return error.json()
+                    except ValueError:
+                        return None
                 logging.warning(f"Failed to edit message (attempt {attempt+1}/{retries}): {e}")
-                time.sleep(2 ** attempt)
+                time.sleep(retry_delay(e, attempt))
 
         logging.error(f"Failed to edit message after {retries} attempts")
         return None
@@ -66,7 +97,7 @@ class TelegramBot:
         if not chat_id:
             chat_id = self.channel_id
             
-        url = f"https://api.telegram.org/bot{self.token}/pinChatMessage"
+        url = f"{TELEGRAM_API_BASE}/bot{self.token}/pinChatMessage"
         payload = {
             'chat_id': chat_id,
             'message_id': message_id
@@ -81,29 +112,53 @@ class TelegramBot:
         if self.admin_chat_id:
             self.send_message(f"⚠️ ADMIN ALERT: {message}", chat_id=self.admin_chat_id)
 
-    def send_document(self, file_path, caption=None, chat_id=None, parse_mode='Markdown', retries=3):
+    def send_document(self, document, caption=None, chat_id=None, parse_mode='Markdown', retries=3, filename=None):
+        """
+        Sends a document given as a file path or as bytes (filename is then required).
+        """
         if not chat_id:
             chat_id = self.channel_id
         
-        url = f"https://api.telegram.org/bot{self.token}/sendDocument"
+        url = f"{TELEGRAM_API_BASE}/bot{self.token}/sendDocument"
+        data = {
+            'chat_id': chat_id,
+            'parse_mode': parse_mode
+        }
+        if caption:
+            data['caption'] = caption
+
+        filename, payload = read_document(document, filename)
+
+        # Reuse the file_id from an earlier upload of the same content
+        digest = content_hash(payload)
+        file_id = get_media_id('telegram', digest)
+        if file_id:
+            try:
+                with run_report.api_call('telegram.sendDocument'):
+                    response = requests.post(url, data={**data, 'document': file_id}, timeout=10)
+                    response.raise_for_status()
+                run_report.incr('documents_sent.telegram')
+                return response.json()
+            except requests.exceptions.RequestException as e:
+                logging.warning(f"Failed to send cached Telegram file_id, re-uploading: {e}")
+                forget_media_id('telegram', digest)
         
         for attempt in range(retries):
+            if attempt:
+                run_report.record_retry('telegram.sendDocument')
             try:
-                with open(file_path, 'rb') as f:
-                    files = {'document': f}
-                    data = {
-                        'chat_id': chat_id,
-                        'parse_mode': parse_mode
-                    }
-                    if caption:
-                        data['caption'] = caption
-                    
+                files = {'document': (filename, payload)}
+                with run_report.api_call('telegram.sendDocument'):
                     response = requests.post(url, data=data, files=files, timeout=30)
                     response.raise_for_status()
-                    return response.json()
+                run_report.incr('documents_sent.telegram')
+                result = response.json()
+                uploaded = (result.get('result') or {}).get('document') or {}
+                remember_media_id('telegram', digest, uploaded.get('file_id'))
+                return result
             except requests.exceptions.RequestException as e:
                 logging.warning(f"Failed to send document (attempt {attempt+1}/{retries}): {e}")
-                time.sleep(2 ** attempt)
+                time.sleep(retry_delay(e, attempt))
         
         logging.error(f"Failed to send Telegram document after {retries} attempts")
         return None
@@ -0,0 +1,93 @@
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+
+# "5 hours ago", "an hour ago", "30+ days ago", "2 hrs ago", "1 week ago"
+RELATIVE_RE = re.compile(r'\b(\d+|an?|one)\+?\s*(min|minute|hour|hr|day|week|month)s?\b.*\bago\b')
+RELATIVE_UNITS = {
+    'min': timedelta(minutes=1),
+    'minute': timedelta(minutes=1),
+    'hour': timedelta(hours=1),
+    'hr': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),
+}
+# ISO-8601 forms Python 3.10's fromisoformat rejects: "Z", "+0000" offsets and
+# fractions that aren't 3 or 6 digits
+ISO_RE = re.compile(
+    r'(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2}(?::\d{2})?)(?:\.(\d+))?\s*(Z|[+-]\d{2}(?::?\d{2})?)?',
+    re.IGNORECASE
+)
+RELATIVE_WORDS = {
+    'just now': timedelta(0),
+    'today': timedelta(0),
+    'yesterday': timedelta(days=1),
+}
+
+
+def _aware(dt):
+    # Sources that omit the offset publish in UTC
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+
+def _from_iso(text):
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        match = ISO_RE.fullmatch(text)
+        if match is None:
+            raise
+    day, clock, fraction, offset = match.groups()
+    fraction = f".{(fraction + '000000')[:6]}" if fraction else ""
+    if offset is None:
+        offset = ""
+    elif offset.upper() == 'Z':
+        offset = "+00:00"
+    else:
+        digits = offset[1:].replace(':', '').ljust(4, '0')
+        offset = f"{offset[0]}{digits[:2]}:{digits[2:]}"
+    return datetime.fromisoformat(f"{day}T{clock}{fraction}{offset}")
+
+
+def parse_timestamp(value, now=None):
+    """
+    Parses a posting timestamp into a timezone-aware datetime, or None if it can't be read.
+
+    Accepts datetimes, Unix epochs, ISO-8601 ("2026-02-16T10:00:00Z"), RFC-822
+    ("Mon, 16 Feb 2026 12:00:00 +0000") and relative phrases ("5 hours ago",
+    "yesterday"), which are resolved against `now` (default: the current UTC time).
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return _aware(value)
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, timezone.utc)
+
+    text = str(value).strip()
+    if not text:
+        return None
+
+    # ISO-8601 starts with the year; the common case, so it is tried first
+    if text[0].isdigit():
+        try:
+            return _aware(_from_iso(text))
+        except ValueError:
+            if text.isdigit():
+                return datetime.fromtimestamp(int(text), timezone.utc)
+
+    lowered = text.lower()
+    relative = RELATIVE_WORDS.get(lowered)
+    match = RELATIVE_RE.search(lowered) if relative is None and 'ago' in lowered else None
+    if match:
+        amount, unit = match.groups()
+        relative = (int(amount) if amount.isdigit() else 1) * RELATIVE_UNITS[unit]
+    if relative is not None:
+        return (now or datetime.now(timezone.utc)) - relative
+
+    # RFC-822, as RSS feeds publish it
+    try:
+        return _aware(parsedate_to_datetime(text))
+    except (TypeError, ValueError, IndexError):
+        return None
@@ -1,7 +1,9 @@
 
 import requests
 import logging
-from src.utils.config import WHATSAPP_TOKEN, WHATSAPP_PHONE_ID, WHATSAPP_RECIPIENT
+from src.utils.config import WHATSAPP_TOKEN, WHATSAPP_PHONE_ID, WHATSAPP_RECIPIENT, WHATSAPP_API_BASE
+from src.utils import run_report
+from src.utils.media_cache import content_hash, read_document, get_media_id, remember_media_id, forget_media_id
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +16,7 @@ def send_whatsapp_message(message):
         logger.error("WhatsApp config missing. Skipping send.")
         return False
 
-    url = f"https://graph.facebook.com/v22.0/{WHATSAPP_PHONE_ID}/messages"
+    url = f"{WHATSAPP_API_BASE}/{WHATSAPP_PHONE_ID}/messages"
     headers = {
         'Authorization': f'Bearer {WHATSAPP_TOKEN}',
         'Content-Type': 'application/json'
@@ -53,8 +55,11 @@ def send_whatsapp_message(message):
         }
         
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=20)
-            if response.status_code in [200, 201]:
+            with run_report.api_call('whatsapp.messages') as call:
+                response = requests.post(url, headers=headers, json=payload, timeout=20)
+                call.ok = response.status_code in [200, 201]
+            if call.ok:
+                run_report.incr('messages_sent.whatsapp')
                 logger.info(f"WhatsApp message part {i+1}/{len(messages)} sent successfully")
             else:
                 logger.error(f"WhatsApp Send Failed: {response.status_code} - {response.text}")
@@ -65,52 +70,53 @@ def send_whatsapp_message(message):
             
     return success
 
-def upload_media(file_path):
+def upload_media(document, filename=None):
     """
-    Uploads a local file to WhatsApp/Facebook Graph API and returns its media_id.
+    Uploads a document (file path, or bytes plus filename) to WhatsApp/Facebook Graph API
+    and returns its media_id.
     """
     if not WHATSAPP_TOKEN or not WHATSAPP_PHONE_ID:
         logger.error("WhatsApp config missing. Skipping upload.")
         return None
 
     # Note that WhatsApp media upload endpoint uses the phone ID
-    url = f"https://graph.facebook.com/v22.0/{WHATSAPP_PHONE_ID}/media"
+    url = f"{WHATSAPP_API_BASE}/{WHATSAPP_PHONE_ID}/media"
     headers = {
         'Authorization': f'Bearer {WHATSAPP_TOKEN}'
     }
     
-    import os
-    filename = os.path.basename(file_path)
-    
     try:
-        with open(file_path, 'rb') as f:
-            files = {
-                'file': (filename, f, 'application/pdf')
-            }
-            data = {
-                'messaging_product': 'whatsapp'
-            }
+        filename, payload = read_document(document, filename)
+        files = {
+            'file': (filename, payload, 'application/pdf')
+        }
+        data = {
+            'messaging_product': 'whatsapp'
+        }
+        with run_report.api_call('whatsapp.media') as call:
             response = requests.post(url, headers=headers, files=files, data=data, timeout=30)
-            if response.status_code in [200, 201]:
-                media_id = response.json().get('id')
-                logger.info(f"WhatsApp media upload successful. ID: {media_id}")
-                return media_id
-            else:
-                logger.error(f"WhatsApp Media Upload Failed: {response.status_code} - {response.text}")
-                return None
+            call.ok = response.status_code in [200, 201]
+        if call.ok:
+            media_id = response.json().get('id')
+            logger.info(f"WhatsApp media upload successful. ID: {media_id}")
+            return media_id
+        else:
+            logger.error(f"WhatsApp Media Upload Failed: {response.status_code} - {response.text}")
+            return None
     except Exception as e:
         logger.error(f"WhatsApp Media Upload Error: {e}")
         return None
 
-def send_whatsapp_document(media_id, filename):
+def send_whatsapp_document(media_id, filename, recipient=None):
     """
     Sends a document message using a WhatsApp media ID.
     """
-    if not WHATSAPP_TOKEN or not WHATSAPP_PHONE_ID or not WHATSAPP_RECIPIENT:
+    recipient = recipient or WHATSAPP_RECIPIENT
+    if not WHATSAPP_TOKEN or not WHATSAPP_PHONE_ID or not recipient:
         logger.error("WhatsApp config missing. Skipping send.")
         return False
 
-    url = f"https://graph.facebook.com/v22.0/{WHATSAPP_PHONE_ID}/messages"
+    url = f"{WHATSAPP_API_BASE}/{WHATSAPP_PHONE_ID}/messages"
     headers = {
         'Authorization': f'Bearer {WHATSAPP_TOKEN}',
         'Content-Type': 'application/json'
@@ -119,7 +125,7 @@ def send_whatsapp_document(media_id, filename):
     payload = {
         "messaging_product": "whatsapp",
         "recipient_type": "individual",
-        "to": WHATSAPP_RECIPIENT,
+        "to": recipient,
         "type": "document",
         "document": {
             "id": media_id,
@@ -128,8 +134,11 @@ def send_whatsapp_document(media_id, filename):
     }
     
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=20)
-        if response.status_code in [200, 201]:
+        with run_report.api_call('whatsapp.messages') as call:
+            response = requests.post(url, headers=headers, json=payload, timeout=20)
+            call.ok = response.status_code in [200, 201]
+        if call.ok:
+            run_report.incr('documents_sent.whatsapp')
             logger.info("WhatsApp document sent successfully")
             return True
         else:
@@ -139,13 +148,23 @@ def send_whatsapp_document(media_id, filename):
         logger.error(f"WhatsApp Document Send Error: {e}")
         return False
 
-def send_whatsapp_file(file_path):
+def send_whatsapp_file(document, recipient=None, filename=None):
     """
-    Uploads and sends a file via WhatsApp.
+    Sends a document (file path, or bytes plus filename) via WhatsApp, uploading it
+    only if no valid media ID is cached for the same content.
     """
-    import os
-    media_id = upload_media(file_path)
+    filename, payload = read_document(document, filename)
+    digest = content_hash(payload)
+
+    media_id = get_media_id('whatsapp', digest)
     if media_id:
-        return send_whatsapp_document(media_id, os.path.basename(file_path))
-    return False
+        if send_whatsapp_document(media_id, filename, recipient):
+            return True
+        # Media may have expired or been purged on Meta's side; re-upload once
+        forget_media_id('whatsapp', digest)
 
+    media_id = upload_media(payload, filename)
+    if media_id:
+        remember_media_id('whatsapp', digest, media_id)
+        return send_whatsapp_document(media_id, filename, recipient)
+    return False